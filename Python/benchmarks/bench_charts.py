@@ -0,0 +1,279 @@
+"""
+图表性能基准测试
+
+在无界面的 Agg 后端下，按参数扫描分别运行各图表函数，测量：
+    - build:  调用图表函数构建图窗的耗时
+    - draw:   首次 canvas.draw() 渲染到 Agg 的耗时
+    - save:   分别保存为 PNG / SVG / PDF（写入内存）的耗时
+    - peak_mb: 构建 + 渲染 + 保存全过程中 tracemalloc 记录的峰值内存（单独运行一次测得）
+耗时重复多次取中位数，结果写入 JSON，可与之前的结果比较以发现性能回退。
+
+扫描参数：
+    - bubble_plot:       点数 n_points、是否用预建索引渲染中心 1% 面积的局部窗口 crop
+    - diverging_scatter: 类数 n_clusters、每类点数 n_per_cluster
+    - diverging_scatter_from_labels: 小类数 n_clusters、大类点数 n_large（一个大类加若干约 10 个点的小类）
+    - filled_2D_line:    线数 n_lines、每条线点数 line_length
+    - filled_3D_line:    类别数 n_cat、时间点数 n_time、是否使用静态视角投影 static_view
+    - sankey_diagram:    每层节点数 n_nodes、每层之间的边数 n_edges
+    - scatter_with_*:    点数 n_points（scatter_with_histograms / scatter_with_boxplot）
+    - violin_heatmap:    每列小提琴样本数 n_samples（7 x 12 热图）
+
+用法（在 Python/ 目录下运行）：
+    python benchmarks/bench_charts.py [--preset quick|full] [--chart 图表名 ...] [-n 重复次数]
+                                      [--formats png,svg,pdf] [--json 输出文件]
+                                      [--compare 基准文件 [--threshold 1.25]]
+"""
+import argparse
+import io
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PYTHON_DIR)
+
+# 每个图表的参数扫描：参数名 -> 取值列表，按笛卡尔积组合
+SWEEPS = {
+    'quick': {
+        'bubble_plot': {'n_points': [1_000, 10_000], 'crop': [False, True]},
+        'diverging_scatter': {'n_clusters': [5, 20], 'n_per_cluster': [100, 1_000]},
+        'diverging_scatter_from_labels': {'n_clusters': [20, 300], 'n_large': [1_000, 10_000]},
+        'filled_2D_line': {'n_lines': [10, 50], 'line_length': [1_000, 10_000]},
+        'filled_3D_line': {'n_cat': [5, 20], 'n_time': [50, 200], 'static_view': [False, True]},
+        'sankey_diagram': {'n_nodes': [10, 1_000], 'n_edges': [100, 10_000]},
+        'scatter_with_boxplot': {'n_points': [1_000, 2_000_000]},
+        'scatter_with_histograms': {'n_points': [1_000, 2_000_000]},
+        'violin_heatmap': {'n_samples': [10_000, 100_000]},
+    },
+    'full': {
+        'bubble_plot': {'n_points': [1_000, 10_000, 100_000, 1_000_000], 'crop': [False, True]},
+        'diverging_scatter': {'n_clusters': [5, 20, 50], 'n_per_cluster': [100, 1_000, 10_000]},
+        'diverging_scatter_from_labels': {'n_clusters': [20, 300, 1_000], 'n_large': [1_000, 100_000, 2_000_000]},
+        'filled_2D_line': {'n_lines': [10, 50, 200], 'line_length': [1_000, 10_000, 100_000]},
+        'filled_3D_line': {'n_cat': [5, 20, 50], 'n_time': [50, 500, 5_000], 'static_view': [False, True]},
+        'sankey_diagram': {'n_nodes': [10, 1_000, 5_000], 'n_edges': [100, 10_000, 100_000]},
+        'scatter_with_boxplot': {'n_points': [1_000, 100_000, 2_000_000, 20_000_000]},
+        'scatter_with_histograms': {'n_points': [1_000, 100_000, 2_000_000, 20_000_000]},
+        'violin_heatmap': {'n_samples': [10_000, 100_000, 1_000_000]},
+    },
+}
+
+FORMATS = ('png', 'svg', 'pdf')
+
+
+def make_case(chart, params, seed=0):
+    """
+    按参数生成确定性的测试数据，返回 (图表函数, 位置参数元组)
+    """
+    rng = np.random.default_rng(seed)
+    if chart == 'bubble_plot':
+        from figure_model.bubble_plot import bubble_plot
+        n = params['n_points']
+        points = rng.random((n, 2)) * 100
+        v = np.abs(rng.standard_normal(n))
+        if params['crop']:
+            # 索引在准备数据时构建一次，计时只包含局部窗口的渲染
+            from figure_model.bubble_plot import BubbleIndex
+            return bubble_plot, (None, None, ['#009FFF', '#EC2F4B'], 2, 0.6, 'auto', (45, 55, 45, 55),
+                                 BubbleIndex(points, v))
+        return bubble_plot, (points, v, ['#009FFF', '#EC2F4B'], 2, 0.6)
+    if chart == 'diverging_scatter':
+        from figure_model.diverging_scatter import diverging_scatter
+        n, m = params['n_clusters'], params['n_per_cluster']
+        centers = rng.random((n, 2)) * 100
+        data_matrix = centers[:, None, :] + rng.standard_normal((n, m, 2)) * 5
+        return diverging_scatter, (centers, data_matrix, ['#ff6e7f', '#bfe9ff'], True)
+    if chart == 'diverging_scatter_from_labels':
+        from figure_model.diverging_scatter import diverging_scatter_from_labels
+        sizes = np.r_[params['n_large'], rng.integers(5, 15, params['n_clusters'])]
+        labels = np.repeat(np.arange(len(sizes)), sizes)
+        xy = rng.standard_normal((len(labels), 2)) * 5 + rng.random((len(sizes), 2))[labels] * 100
+        return diverging_scatter_from_labels, (labels, xy, ['#ff6e7f', '#bfe9ff'], True)
+    if chart == 'filled_2D_line':
+        from figure_model.filled_2D_line import filled_2D_line
+        n, m = params['n_lines'], params['line_length']
+        starts = rng.random(n) * 150
+        x = starts[:, None] + np.linspace(0, 50, m)[None, :]
+        y = rng.random((n, 1)) * 20 * np.exp(-(np.linspace(-3, 3, m)[None, :] ** 2) / 2)
+        return filled_2D_line, (np.stack((x, y), axis=2), ['#ff6e7f', '#bfe9ff'])
+    if chart == 'filled_3D_line':
+        from figure_model.filled_3D_line import filled_3D_line
+        n_cat, n_time = params['n_cat'], params['n_time']
+        data = np.abs(np.cumsum(rng.standard_normal((n_time, n_cat)), axis=0)) + 1
+        return filled_3D_line, (data, np.arange(n_time, dtype=float), None, None, params['static_view'])
+    if chart == 'sankey_diagram':
+        from figure_model.sankey_diagram import sankey_diagram
+        n_layers, m, k = 4, params['n_nodes'], params['n_edges']
+        layer = np.repeat(np.arange(n_layers - 1), k)
+        connection = (layer, rng.integers(0, m, len(layer)), rng.integers(0, m, len(layer)), rng.random(len(layer)))
+        return sankey_diagram, (rng.random((n_layers, m)) + 0.1, connection)
+    if chart in ('scatter_with_boxplot', 'scatter_with_histograms'):
+        from figure_model import scatter_marginals
+        data_matrix = rng.standard_normal((params['n_points'], 2)) * [1, 2]
+        return getattr(scatter_marginals, chart), (data_matrix,)
+    if chart == 'violin_heatmap':
+        from figure_model.violin_heatmap import violin_heatmap
+        data = rng.random((7, 12))
+        vdata = data.mean(axis=0) + rng.standard_normal((params['n_samples'], 12)) * 0.3
+        return violin_heatmap, (data, vdata)
+    raise ValueError(f'未知的图表: {chart}')
+
+
+def run_once(func, args, formats):
+    """
+    构建、渲染并保存一次图表，返回各阶段耗时（秒）
+    """
+    import matplotlib.pyplot as plt
+
+    t0 = time.perf_counter()
+    fig = func(*args)
+    t1 = time.perf_counter()
+    try:
+        fig.canvas.draw()
+        t2 = time.perf_counter()
+        save = {}
+        for fmt in formats:
+            start = time.perf_counter()
+            fig.savefig(io.BytesIO(), format=fmt)
+            save[fmt] = time.perf_counter() - start
+    finally:
+        plt.close(fig)
+    return {'build': t1 - t0, 'draw': t2 - t1, 'save': save}
+
+
+def peak_memory(func, args, formats):
+    """
+    在 tracemalloc 下完整运行一次，返回峰值内存（MB）
+    """
+    tracemalloc.start()
+    try:
+        run_once(func, args, formats)
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+
+def bench_case(chart, params, repeat, formats):
+    """
+    测量一个参数组合，返回结果字典（耗时为 repeat 次的中位数）
+    """
+    func, args = make_case(chart, params)
+    runs = [run_once(func, args, formats) for _ in range(repeat)]
+    return {
+        'chart': chart,
+        'params': params,
+        'build_s': statistics.median(r['build'] for r in runs),
+        'draw_s': statistics.median(r['draw'] for r in runs),
+        'save_s': {fmt: statistics.median(r['save'][fmt] for r in runs) for fmt in formats},
+        'peak_mb': peak_memory(func, args, formats),
+    }
+
+
+def iter_cases(preset, charts=None):
+    """
+    依次产生 (图表名, 参数字典)
+    """
+    for chart, sweep in SWEEPS[preset].items():
+        if charts and chart not in charts:
+            continue
+        names = list(sweep)
+        for values in itertools.product(*(sweep[k] for k in names)):
+            yield chart, dict(zip(names, values))
+
+
+def _case_key(result):
+    return result['chart'], tuple(sorted(result['params'].items()))
+
+
+def _total_time(result, formats):
+    return result['build_s'] + result['draw_s'] + sum(result['save_s'][fmt] for fmt in formats)
+
+
+def compare(results, baseline, threshold):
+    """
+    与基准结果逐项比较总耗时（构建 + 渲染 + 双方都测过的保存格式），返回变慢超过 threshold 倍的条目列表
+    """
+    base = {_case_key(r): r for r in baseline['results']}
+    regressions = []
+    for r in results:
+        old = base.get(_case_key(r))
+        if old is None:
+            continue
+        formats = set(old['save_s']) & set(r['save_s'])
+        ratio = _total_time(r, formats) / max(_total_time(old, formats), 1e-9)
+        flag = '  <-- 变慢' if ratio > threshold else ''
+        print(f"{r['chart']:<18s} {_format_params(r['params']):<34s} {ratio:6.2f}x{flag}")
+        if ratio > threshold:
+            regressions.append({'chart': r['chart'], 'params': r['params'], 'ratio': ratio})
+    return regressions
+
+
+def _format_params(params):
+    return ' '.join(f'{k}={v}' for k, v in params.items())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='figure_model 图表性能基准')
+    parser.add_argument('--preset', choices=sorted(SWEEPS), default='quick', help='参数扫描规模')
+    parser.add_argument('--chart', nargs='*', default=None, help='只测这些图表')
+    parser.add_argument('-n', '--repeat', type=int, default=3, help='每个参数组合的重复次数')
+    parser.add_argument('--formats', default=','.join(FORMATS), help='保存格式，逗号分隔')
+    parser.add_argument('--json', default=None, help='可选，将结果写入该 JSON 文件')
+    parser.add_argument('--compare', default=None, help='可选，与之前保存的 JSON 结果比较')
+    parser.add_argument('--threshold', type=float, default=1.25, help='总耗时超过基准多少倍视为回退')
+    args = parser.parse_args(argv)
+
+    import matplotlib
+    matplotlib.use('Agg')
+    from figure_model.font_cache import get_chinese_font
+
+    formats = [f for f in args.formats.split(',') if f]
+    for fmt in formats:
+        if fmt not in FORMATS:
+            parser.error(f'不支持的格式: {fmt}')
+    # 字体解析只在首次调用时发生，不计入任何一个参数组合
+    get_chinese_font()
+
+    results = []
+    for chart, params in iter_cases(args.preset, args.chart):
+        r = bench_case(chart, params, args.repeat, formats)
+        results.append(r)
+        saves = ' '.join(f'{fmt} {t * 1000:8.1f}' for fmt, t in r['save_s'].items())
+        print(f"{chart:<18s} {_format_params(params):<34s} build {r['build_s'] * 1000:8.1f}  "
+              f"draw {r['draw_s'] * 1000:8.1f}  save(ms) {saves}  peak {r['peak_mb']:7.1f} MB")
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'matplotlib': matplotlib.__version__,
+            'platform': platform.platform(),
+            'preset': args.preset,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f'{len(regressions)} 项变慢超过 {args.threshold:.2f} 倍')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+导入耗时基准测试
+
+在全新的子进程中分别测量以下场景的导入耗时（不含解释器启动时间），重复多次取中位数：
+    - eager:    旧版脚本在模块顶层一次性导入的依赖（pyplot、font_manager、mplot3d、dates 等）
+    - package:  import figure_model
+    - modules:  导入 figure_model 下的全部四个图表模块
+    - first_call: 导入 bubble_plot 并首次调用（此时才加载 matplotlib）
+
+用法（在 Python/ 目录下运行）：
+    python benchmarks/bench_import.py [-n 重复次数] [--json 输出文件]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    'eager': (
+        'import numpy as np\n'
+        'import matplotlib.pyplot as plt\n'
+        'import matplotlib.font_manager as fm\n'
+        'from matplotlib.patches import Circle, Polygon\n'
+        'from matplotlib.colors import LinearSegmentedColormap, to_rgb\n'
+        'from mpl_toolkits.mplot3d import Axes3D\n'
+        'from mpl_toolkits.mplot3d.art3d import Poly3DCollection\n'
+        'from datetime import datetime, timedelta\n'
+        'import matplotlib.dates as mdates\n'
+    ),
+    'package': 'import figure_model\n',
+    'modules': (
+        'import figure_model.bubble_plot\n'
+        'import figure_model.diverging_scatter\n'
+        'import figure_model.filled_2D_line\n'
+        'import figure_model.filled_3D_line\n'
+    ),
+    'first_call': (
+        'from figure_model.bubble_plot import bubble_plot\n'
+        'bubble_plot([[0, 0], [1, 1]], [0, 1])\n'
+    ),
+}
+
+_TIMER = (
+    'import time\n'
+    't0 = time.perf_counter()\n'
+    '{code}'
+    'print(time.perf_counter() - t0)\n'
+)
+
+
+def measure(code, repeat):
+    """
+    在 repeat 个全新子进程中执行 code，返回每次耗时（秒）的列表
+    """
+    env = dict(os.environ, MPLBACKEND='Agg')
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', _TIMER.format(code=code)], cwd=PYTHON_DIR, env=env,
+                             capture_output=True, text=True, check=True)
+        times.append(float(out.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='测量 figure_model 的导入耗时')
+    parser.add_argument('-n', '--repeat', type=int, default=7, help='每个场景的重复次数')
+    parser.add_argument('--json', default=None, help='可选，将结果写入该 JSON 文件')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, code in SCENARIOS.items():
+        times = measure(code, args.repeat)
+        results[name] = {'median_ms': statistics.median(times) * 1000, 'min_ms': min(times) * 1000}
+        print(f"{name:<12s} 中位数 {results[name]['median_ms']:8.1f} ms   最小 {results[name]['min_ms']:8.1f} ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
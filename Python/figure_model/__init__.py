@@ -0,0 +1,52 @@
+"""
+Figure_Model Python 可视化工具集
+
+顶层包导入时不加载 matplotlib：各子模块在首次访问时才导入，
+matplotlib（以及三维工具包）在首次调用对应的绘图函数时才导入。
+
+用法：
+    from figure_model.bubble_plot import bubble_plot
+    fig = bubble_plot(points, v)
+
+    # 或通过包属性按需加载子模块
+    import figure_model
+    fig = figure_model.filled_2D_line.filled_2D_line(data_matrix)
+"""
+import importlib
+
+# 可按需加载的子模块
+__all__ = [
+    'async_render',
+    'batch_render',
+    'bubble_plot',
+    'colors',
+    'data_source',
+    'decimate',
+    'diverging_scatter',
+    'figure_pool',
+    'filled_2D_line',
+    'filled_3D_line',
+    'font_cache',
+    'kde',
+    'live_line',
+    'profiling',
+    'quantile_sketch',
+    'ragged',
+    'raster',
+    'render_cache',
+    'sankey_diagram',
+    'scatter_marginals',
+    'spatial_index',
+    'turntable',
+    'violin_heatmap',
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
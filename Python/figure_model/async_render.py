@@ -0,0 +1,236 @@
+import asyncio
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .figure_pool import FigurePool
+from .render_cache import cache_key
+
+# 工作线程 / 工作进程内复用图窗的池，见 _render_job
+_pool = FigurePool()
+
+
+class AsyncRenderer:
+    """
+    asyncio 渲染接口：在有界的线程池或进程池中构建图表并编码为图片字节，不阻塞事件循环
+    - 并发上限：同时在执行器中运行的渲染数不超过 max_workers，其余请求在事件循环中排队等待
+    - 背压：排队与运行中的渲染总数达到 max_pending 时，新请求立即以 asyncio.QueueFull 拒绝，
+      而不是无限排队拉长延迟
+    - 合并：图表、参数、数据与输出格式都相同的请求在渲染完成前只执行一次，结果共享
+      （键与 render_cache.cache_key 相同；参数无法计算键时该请求不参与合并）
+    - 超时与取消：每个请求可以单独设置超时；等待者全部超时或被取消时取消尚未开始的渲染。
+      已在工作线程 / 进程中开始的渲染无法中断，会运行到结束后丢弃结果，期间仍占用一个并发名额
+
+    输入参数：
+        max_workers: 可选，工作线程 / 进程数（同时也是并发上限），默认为 CPU 核数
+        executor: 可选，'process'（默认，多核并行，参数需要可 pickle）或 'thread'（无需复制数据，
+                  但受 GIL 限制，主要用于让事件循环保持响应）
+        max_pending: 可选，排队与运行中的渲染总数上限，默认为 max_workers 的 4 倍
+        timeout: 可选，默认的单个请求超时时间（秒），None 表示不超时
+
+    示例：
+        renderer = AsyncRenderer(max_workers=4)
+        png = await renderer.render('bubble_plot', points, v, r=5, format='png')
+        webp = await renderer.render(filled_2D_line, data_matrix, format='webp', timeout=5)
+        await renderer.aclose()
+
+        async with AsyncRenderer(executor='thread') as renderer:   # 或作为异步上下文管理器使用
+            svg = await renderer.render('diverging_scatter', centers, data_matrix, format='svg')
+    """
+
+    def __init__(self, max_workers=None, executor='process', max_pending=None, timeout=None):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = int(max_workers)
+        self.max_pending = 4 * self.max_workers if max_pending is None else int(max_pending)
+        self.timeout = timeout
+        if executor == 'process':
+            from .batch_render import _init_worker
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+        elif executor == 'thread':
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='figure_model_render')
+        else:
+            raise ValueError("executor 必须是 'process' 或 'thread'")
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._inflight = {}
+        self._pending = 0
+        self._closed = False
+        self.rendered = 0
+        self.merged = 0
+        self.rejected = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    @property
+    def pending(self):
+        """
+        当前排队与运行中的渲染数（合并的请求只计一次）
+        """
+        return self._pending
+
+    async def render(self, chart, *args, format='png', dpi=None, savefig_kwargs=None, timeout=None, **kwargs):
+        """
+        渲染图表并返回图片字节
+
+        输入参数：
+            chart: 图表名（取值见 batch_render.CHARTS，如 'bubble_plot'）或模块级的图表函数
+            *args, **kwargs: 传给图表函数的参数
+            format: 输出格式，如 'png'、'svg'、'webp'、'pdf'
+            dpi: 可选，保存图片时使用的 dpi
+            savefig_kwargs: 可选，其他传给 Figure.savefig 的参数
+            timeout: 可选，本次请求的超时时间（秒），缺省时使用构造时的 timeout
+
+        输出：
+            图片字节；超时时抛出 asyncio.TimeoutError，排队已满时抛出 asyncio.QueueFull
+        """
+        if self._closed:
+            raise RuntimeError('AsyncRenderer 已关闭')
+        savefig_kwargs = dict(savefig_kwargs or {})
+        try:
+            key = cache_key(_chart_name(chart), args, kwargs, format=format, dpi=dpi, savefig_kwargs=savefig_kwargs)
+        except TypeError:
+            key = None
+
+        job = self._inflight.get(key) if key is not None else None
+        if job is not None:
+            self.merged += 1
+        else:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise asyncio.QueueFull(f'排队中的渲染已达上限 {self.max_pending}')
+            job = _Job(asyncio.ensure_future(self._run(chart, args, kwargs, format, dpi, savefig_kwargs)))
+            self._pending += 1
+            if key is not None:
+                self._inflight[key] = job
+            job.task.add_done_callback(lambda task: self._finish(key, job))
+
+        job.waiters += 1
+        try:
+            # shield：一个等待者超时或被取消不会影响共享同一渲染的其他等待者
+            return await asyncio.wait_for(asyncio.shield(job.task), self.timeout if timeout is None else timeout)
+        finally:
+            job.waiters -= 1
+            if job.waiters == 0 and not job.task.done():
+                job.task.cancel()
+
+    async def aclose(self):
+        """
+        拒绝新的请求，取消所有未完成的渲染并关闭执行器
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for job in list(self._inflight.values()):
+            job.task.cancel()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, lambda: self._executor.shutdown(wait=True, cancel_futures=True))
+
+    async def _run(self, chart, args, kwargs, format, dpi, savefig_kwargs):
+        loop = asyncio.get_running_loop()
+        await self._slots.acquire()
+        try:
+            future = self._executor.submit(_render_job, chart, args, kwargs, format, dpi, savefig_kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        # 并发名额在工作线程 / 进程真正结束后才归还，被取消但已开始的渲染仍计入并发上限
+        future.add_done_callback(lambda f: _call_soon(loop, self._slots.release))
+        data = await asyncio.wrap_future(future)
+        self.rendered += 1
+        return data
+
+    def _finish(self, key, job):
+        self._pending -= 1
+        if key is not None and self._inflight.get(key) is job:
+            del self._inflight[key]
+
+
+class _Job:
+    """
+    一次共享的渲染：asyncio 任务与当前等待它的请求数
+    """
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+def _chart_name(chart):
+    # 图表名直接使用；函数按模块与限定名计入合并键
+    if isinstance(chart, str):
+        return chart
+    return f'{chart.__module__}.{chart.__qualname__}'
+
+
+def _call_soon(loop, callback):
+    # 执行器线程中回调事件循环；事件循环已关闭时忽略
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(callback)
+
+
+def _render_job(chart, args, kwargs, format, dpi, savefig_kwargs):
+    """
+    在工作线程 / 进程中构建图表并保存为图片字节，图窗取自 FigurePool 并在结束后归还
+    """
+    if isinstance(chart, str):
+        from .batch_render import CHARTS
+
+        if chart not in CHARTS:
+            raise ValueError(f'未知的图表类型: {chart}')
+        module_name, func_name = CHARTS[chart]
+        chart = getattr(importlib.import_module(module_name), func_name)
+    return _pool.render(chart, *args, format=format, dpi=dpi, savefig_kwargs=savefig_kwargs, **kwargs)
+
+
+# 测试代码：本地 asyncio 压测，观察延迟分布、请求合并与事件循环的响应
+if __name__ == '__main__':
+    import time
+
+    import numpy as np
+
+    async def heartbeat(stop, lags):
+        # 每 10 ms 醒来一次，记录事件循环被阻塞的时间
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - start - 0.01)
+
+    async def timed(renderer, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            await renderer.render(*args, **kwargs)
+            return time.perf_counter() - start, None
+        except Exception as exc:
+            return time.perf_counter() - start, type(exc).__name__
+
+    async def main():
+        rng = np.random.default_rng(0)
+        points = rng.random((2000, 2)) * 100
+        v = rng.random(2000)
+
+        def lines():
+            # 5 条 200 个点的折线：n x m x 2
+            x = np.broadcast_to(np.arange(200.0), (5, 200))
+            return np.stack((x, np.cumsum(rng.standard_normal((5, 200)), axis=1)), axis=2)
+
+        stop, lags = asyncio.Event(), []
+        beat = asyncio.ensure_future(heartbeat(stop, lags))
+        async with AsyncRenderer(max_workers=4, max_pending=12) as renderer:
+            requests = [timed(renderer, 'bubble_plot', points, v, r=2, format='png') for _ in range(8)]
+            requests += [timed(renderer, 'filled_2D_line', lines(), format='webp') for _ in range(8)]
+            requests += [timed(renderer, 'filled_2D_line', lines(), format='svg', timeout=0.001)]
+            results = await asyncio.gather(*requests)
+            stop.set()
+            await beat
+            latencies = np.array([t for t, error in results if error is None])
+            errors = [error for _, error in results if error is not None]
+            print(f'成功 {len(latencies)} 个，p50 {np.percentile(latencies, 50):.3f}s，p99 {np.percentile(latencies, 99):.3f}s')
+            print(f'失败：{errors}')
+            print(f'渲染 {renderer.rendered} 次，合并 {renderer.merged} 个请求，拒绝 {renderer.rejected} 个请求')
+            print(f'事件循环最大阻塞 {max(lags) * 1000:.1f} ms')
+
+    asyncio.run(main())
@@ -0,0 +1,225 @@
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .figure_pool import FigurePool
+from .font_cache import get_chinese_font
+
+# 图表类型 -> (模块名, 函数名)
+CHARTS = {
+    'bubble_plot': ('figure_model.bubble_plot', 'bubble_plot'),
+    'diverging_scatter': ('figure_model.diverging_scatter', 'diverging_scatter'),
+    'diverging_scatter_from_labels': ('figure_model.diverging_scatter', 'diverging_scatter_from_labels'),
+    'filled_2D_line': ('figure_model.filled_2D_line', 'filled_2D_line'),
+    'filled_3D_line': ('figure_model.filled_3D_line', 'filled_3D_line'),
+    'sankey_diagram': ('figure_model.sankey_diagram', 'sankey_diagram'),
+    'scatter_with_boxplot': ('figure_model.scatter_marginals', 'scatter_with_boxplot'),
+    'scatter_with_histograms': ('figure_model.scatter_marginals', 'scatter_with_histograms'),
+    'violin_heatmap': ('figure_model.violin_heatmap', 'violin_heatmap'),
+}
+
+# 工作进程内复用图窗的池，见 _run_job
+_pool = FigurePool()
+
+
+def render_batch(jobs, workers=None, base_dir=None):
+    """
+    在进程池中无界面批量渲染图表
+
+    输入参数：
+        jobs: 任务列表，每个任务是一个字典，包含：
+              - chart: 图表类型，取值见 CHARTS（如 'bubble_plot'）
+              - input: 输入数据文件路径（.npz 或 .json），键名对应图表函数的参数名
+              - output: 输出图片路径，格式由扩展名决定（如 .png / .svg / .pdf）
+              - params: 可选，额外的关键字参数字典（如 {'r': 5, 'alpha_value': 0.5}）
+              - dpi: 可选，保存图片时使用的 dpi，默认使用图窗自身的 dpi
+        workers: 可选，工作进程数，默认为 CPU 核数
+        base_dir: 可选，相对路径的基准目录，默认为当前工作目录
+
+    输出：
+        results: 与 jobs 顺序一致的结果列表，每个元素是一个字典，包含
+                 index、chart、output、ok、build_time、save_time、total_time、error
+
+    说明：
+        每个工作进程启动时只初始化一次 Agg 后端、图表模块与中文字体，之后的任务直接复用。
+        单个任务失败只会记录在对应结果的 error 中，不会影响其他任务。
+    """
+    if base_dir is None:
+        base_dir = os.getcwd()
+    jobs = [_normalize_job(job, base_dir) for job in jobs]
+    results = [None] * len(jobs)
+    if len(jobs) == 0:
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {executor.submit(_run_job, i, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as exc:
+                # 工作进程异常退出（如崩溃）时同样只记录为该任务失败
+                results[i] = _failed_result(i, jobs[i], 0.0, f'{type(exc).__name__}: {exc}')
+    return results
+
+
+def load_manifest(path):
+    """
+    读取任务清单文件（JSON）
+    清单可以是任务列表，也可以是包含 'jobs' 键的字典。
+    输出：(jobs, base_dir)，base_dir 为清单文件所在目录，用于解析相对路径
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if isinstance(manifest, dict):
+        manifest = manifest.get('jobs')
+    if not isinstance(manifest, list):
+        raise ValueError('任务清单必须是任务列表或包含 jobs 列表的字典')
+    return manifest, os.path.dirname(os.path.abspath(path))
+
+
+def load_chart_input(path):
+    """
+    读取图表输入数据文件
+    .npz 文件中的每个数组、.json 文件中的每个键都作为同名关键字参数传给图表函数。
+    datetime64 数组会转换为 datetime 对象列表（供 filled_3D_line 的 timeVector 使用）。
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npz':
+        with np.load(path, allow_pickle=False) as npz:
+            inputs = {key: npz[key] for key in npz.files}
+    elif ext == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            inputs = json.load(f)
+        if not isinstance(inputs, dict):
+            raise ValueError('JSON 输入文件必须是参数名到数据的字典')
+    else:
+        raise ValueError(f'不支持的输入文件格式: {ext}')
+
+    for key, value in inputs.items():
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind == 'M':
+                inputs[key] = value.astype('datetime64[us]').tolist()
+            elif value.dtype.kind == 'U':
+                inputs[key] = value.tolist()
+    return inputs
+
+
+def _normalize_job(job, base_dir):
+    """
+    检查单个任务并将相对路径转换为绝对路径
+    """
+    if not isinstance(job, dict):
+        raise ValueError('每个任务必须是字典')
+    for key in ('chart', 'input', 'output'):
+        if key not in job:
+            raise ValueError(f'任务缺少 {key} 字段')
+    if job['chart'] not in CHARTS:
+        raise ValueError(f"未知的图表类型: {job['chart']}")
+    job = dict(job)
+    job['input'] = os.path.join(base_dir, job['input'])
+    job['output'] = os.path.join(base_dir, job['output'])
+    job.setdefault('params', {})
+    return job
+
+
+def _init_worker():
+    """
+    工作进程初始化：切换到 Agg 后端并预先导入所有图表模块
+    模块导入与字体查找的开销在每个进程中只付出一次。
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    for module_name, _ in CHARTS.values():
+        importlib.import_module(module_name)
+    get_chinese_font()
+
+
+def _run_job(index, job):
+    """
+    在工作进程中执行单个任务，捕获所有异常并返回结果字典
+    图窗从进程内的 FigurePool 取得并在任务结束后归还复用，长时间运行的工作进程内存保持平稳。
+    """
+    start = time.perf_counter()
+    try:
+        with _pool.session():
+            module_name, func_name = CHARTS[job['chart']]
+            chart_func = getattr(importlib.import_module(module_name), func_name)
+            inputs = load_chart_input(job['input'])
+            inputs.update(job['params'])
+
+            fig = chart_func(**inputs)
+            build_end = time.perf_counter()
+
+            out_dir = os.path.dirname(job['output'])
+            if out_dir:
+                os.makedirs(out_dir, exist_ok=True)
+            savefig_kwargs = {}
+            if job.get('dpi') is not None:
+                savefig_kwargs['dpi'] = job['dpi']
+            fig.savefig(job['output'], **savefig_kwargs)
+            save_end = time.perf_counter()
+    except Exception:
+        return _failed_result(index, job, time.perf_counter() - start, traceback.format_exc())
+
+    return {
+        'index': index,
+        'chart': job['chart'],
+        'output': job['output'],
+        'ok': True,
+        'build_time': build_end - start,
+        'save_time': save_end - build_end,
+        'total_time': save_end - start,
+        'error': None,
+    }
+
+
+def _failed_result(index, job, elapsed, error):
+    return {
+        'index': index,
+        'chart': job['chart'],
+        'output': job['output'],
+        'ok': False,
+        'build_time': None,
+        'save_time': None,
+        'total_time': elapsed,
+        'error': error,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='按任务清单批量无界面渲染图表')
+    parser.add_argument('manifest', help='任务清单 JSON 文件路径')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='工作进程数，默认为 CPU 核数')
+    parser.add_argument('--report', default=None, help='可选，将每个任务的结果写入该 JSON 文件')
+    args = parser.parse_args(argv)
+
+    jobs, base_dir = load_manifest(args.manifest)
+    start = time.perf_counter()
+    results = render_batch(jobs, workers=args.workers, base_dir=base_dir)
+    elapsed = time.perf_counter() - start
+
+    n_failed = 0
+    for res in results:
+        if res['ok']:
+            print(f"[{res['index']}] {res['chart']} -> {res['output']} ({res['total_time']:.3f}s)")
+        else:
+            n_failed += 1
+            print(f"[{res['index']}] {res['chart']} 失败:\n{res['error']}", file=sys.stderr)
+    print(f'完成 {len(results) - n_failed}/{len(results)} 个任务，总耗时 {elapsed:.2f}s')
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 1 if n_failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,342 @@
+import numpy as np
+
+# create_hex_colormap 已移至 colors.py，这里保留导入以兼容旧的调用方式
+from .colors import colors_to_rgb, create_hex_colormap, map_colors
+from .data_source import as_array, chunked_min_max, chunked_normalize, iter_chunks
+from .figure_pool import new_figure
+from .font_cache import get_chinese_font
+from .profiling import start_call
+from .raster import axes_pixel_shape, draw_raster, rasterize_points, shade_raster, use_raster
+from .spatial_index import GridIndex
+
+def bubble_plot(points, v, colormap_param=None, r=10, alpha_value=0.6, raster='auto', extent=None, index=None,
+                min_radius_px='auto'):
+    """
+    绘制气泡图
+    该函数根据点的坐标和数值向量绘制气泡图，气泡半径由数值向量归一化后缩放，颜色可自定义。
+
+    输入参数：
+        points: 2 x n 或 n x 2 数组，表示 n 个点的 [x, y] 坐标。
+                也可以是 np.memmap 或数据文件路径（见 data_source.load_array），已是数组时不复制。
+        v: 1 x n 或 n x 1 数值向量，用于控制气泡半径的缩放，同样支持 np.memmap 或文件路径。
+        colormap_param: 可选，颜色参数，可以是：
+                        - None 或缺失：所有点使用默认颜色（从 '#00F260' 到 '#0575E6' 的渐变色，基于 x 轴映射）
+                        - 2元素或3元素列表或元组：生成经过这些颜色的渐变色，并基于 x 轴映射颜色
+                        - n元素列表：每个元素是颜色字符串（如 '#ff0000'）或 RGB 元组（如 (1.0, 0.0, 0.0)），按索引直接使用
+                        - n x 3 数组：直接作为颜色映射，每行是一个 RGB 颜色
+        r: 可选，基础半径值，默认值为 10。实际半径为 r * v_nor_i。
+        alpha_value: 可选，透明度值，范围 0-1，默认值为 0.6。
+        raster: 可选，是否使用密度栅格模式，可以是：
+                - 'auto'：点数达到 raster.RASTER_THRESHOLD（100 万）时使用（默认）
+                - True：按 v_nor 加权把气泡中心聚合到像素网格，用一张图像显示，
+                  像素不透明度按对数密度增长到 alpha_value；耗时与内存只与输出像素数有关
+                - False：逐个绘制气泡
+                按窗口裁剪时以裁剪后可见的气泡数判断
+        extent: 可选，显示窗口 (x_min, x_max, y_min, y_max)，默认显示全部气泡。
+                只绘制与窗口相交的气泡，适合对大量气泡做局部放大渲染
+        index: 可选，预先构建的 BubbleIndex。给出时忽略 points 与 v（可以传 None），
+               半径归一化与颜色映射沿用索引中的全局范围，窗口裁剪只访问窗口附近的网格桶，
+               多次渲染同一数据的不同窗口时每次的耗时只与窗口内的气泡数有关
+        min_radius_px: 可选，以像素计的最小半径，更小的气泡不绘制（半径为 0 的气泡总是跳过）：
+                       - 'auto'：按 alpha_value 取完全覆盖时也改变不了任何像素一个色阶的半径（默认，输出不变）
+                       - 数值：如 0.5 表示跳过直径不足一个像素的气泡
+                       密度栅格模式按中心聚合，不受此参数影响
+
+    输出：
+        fig: matplotlib 图窗对象
+
+    示例：
+        points = np.array([[1, 2], [3, 4], [5, 6]])  # 3x2 数组，三个点
+        v = np.array([0.1, 0.5, 0.9])  # 3x1 向量
+        colormap_param = ['#ff0000', '#0000ff']  # 红到蓝渐变
+        r = 15
+        alpha_value = 0.5
+        fig = bubble_plot(points, v, colormap_param, r, alpha_value)
+
+        index = BubbleIndex(points, v)                                  # 同一数据的多个局部窗口
+        fig = bubble_plot(None, None, colormap_param, r, alpha_value, extent=(0, 10, 0, 10), index=index)
+    """
+    timer = start_call('bubble_plot')
+    from matplotlib.collections import EllipseCollection
+    timer.mark('import')
+
+    if index is not None:
+        # 归一化半径与坐标范围已在构建索引时计算
+        n = len(index)
+        v_nor = index.v_nor
+        (x_lo, y_lo), (x_hi, y_hi) = index.grid.bounds
+    else:
+        points, v = _check_inputs(points, v)
+        n = len(points)
+        if n == 0:
+            raise ValueError('points 不能为空')
+
+        # 归一化 v: v_nor = (v - min(v)) / (max(v) - min(v))，分块计算
+        # 如果所有 v 值相同，v_nor 为 0.5 避免除零
+        v_nor = chunked_normalize(v)
+
+        # 分块计算坐标范围，用于颜色映射与轴范围
+        (x_lo, y_lo), (x_hi, y_hi) = chunked_min_max(points)
+    timer.mark('input')
+    
+    # 处理可选参数 colormap_param、r、alpha_value
+    if colormap_param is None:
+        colormap_param = []  # 设置为空列表以触发默认颜色处理
+    
+    # 颜色处理逻辑：渐变色记录颜色节点，绘制时通过缓存的查找表一次性映射 x 坐标（所有 x 相同时取中间颜色）
+    stops = None
+    colors = None
+    if colormap_param is None or (isinstance(colormap_param, list) and len(colormap_param) == 0):
+        # 默认颜色：使用从 '#00F260' 到 '#0575E6' 的渐变色，基于 x 轴映射
+        stops = ('#00F260', '#0575E6')
+    elif isinstance(colormap_param, (list, tuple)) and (len(colormap_param) == 2 or len(colormap_param) == 3):
+        # 两个或三个颜色列表：生成多色渐变并基于 x 轴映射
+        stops = colormap_param
+    elif isinstance(colormap_param, (list, tuple)) and len(colormap_param) == n:
+        # n 个颜色列表：直接使用指定颜色（颜色字符串或 RGB 元组）
+        colors = colors_to_rgb(colormap_param)
+    elif isinstance(colormap_param, np.ndarray) and colormap_param.shape == (n, 3):
+        # n x 3 数组：直接作为颜色映射
+        colors = colormap_param
+    else:
+        raise ValueError('无效的 colormap_param 参数')
+    timer.mark('colors')
+    
+    # 创建图窗（激活 FigurePool 时复用池中的无界面图窗）
+    fig, ax = new_figure((8, 6), dpi=200, window_title='气泡图')
+    timer.mark('figure')
+    
+    # 设置轴标签和标题（使用中文）
+    chinese_font = get_chinese_font()
+    ax.set_xlabel('X 坐标', fontproperties=chinese_font)
+    ax.set_ylabel('Y 坐标', fontproperties=chinese_font)
+    ax.set_title('气泡图', fontproperties=chinese_font)
+    timer.mark('font')
+    
+    # 调整轴范围以适应所有气泡，考虑半径；指定窗口时直接使用窗口
+    if index is not None:
+        max_rad = r * index.max_v_nor
+    else:
+        max_rad = r * np.max(v_nor) if n > 0 else 0  # 最大半径
+    if extent is not None:
+        x_min, x_max, y_min, y_max = (float(e) for e in extent)
+    else:
+        x_min = x_lo - max_rad
+        x_max = x_hi + max_rad
+        y_min = y_lo - max_rad
+        y_max = y_hi + max_rad
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
+    ax.set_aspect('equal')  # 保持纵横比
+    timer.mark('limits')
+
+    # 窗口裁剪：只保留中心落在按最大半径扩展的窗口内的气泡
+    ids = None
+    if index is not None:
+        pos = index.grid.query(x_min - max_rad, x_max + max_rad, y_min - max_rad, y_max + max_rad)
+        # 按原始顺序绘制，重叠的半透明气泡与不使用索引时叠加结果一致
+        pos = pos[np.argsort(index.grid.order[pos], kind='stable')]
+        points, v_nor, ids = index.grid.xy[pos], index.v_nor[pos], index.grid.order[pos]
+    elif extent is not None:
+        ids = _window_ids(points, (x_min - max_rad, x_max + max_rad, y_min - max_rad, y_max + max_rad))
+        points, v_nor = np.asarray(points[ids], dtype=float), v_nor[ids]
+    if ids is not None and colors is not None:
+        colors = np.asarray(colors)[ids]
+    n = len(points)
+    timer.mark('cull')
+
+    if use_raster(raster, n):
+        # 密度栅格模式：按 v_nor 加权把气泡中心分箱到绘图区域的像素网格，用一个 imshow 显示
+        shape = axes_pixel_shape(ax)
+        extent = (x_min, x_max, y_min, y_max)
+        density, color_sum = rasterize_points(points, extent, shape, weights=v_nor, colors=colors)
+        column_colors = None
+        if stops is not None:
+            # 渐变色只取决于 x，直接按像素列中心的 x 坐标取色
+            x_centers = x_min + (np.arange(shape[1]) + 0.5) * (x_max - x_min) / shape[1]
+            column_colors = map_colors(x_centers, stops, x_lo, x_hi)[:, :3]
+        img = shade_raster(density, shape, alpha_value, color_sum=color_sum, column_colors=column_colors)
+        draw_raster(ax, img, extent)
+        timer.mark('raster')
+        timer.finish(fig)
+        return fig
+    
+    # 跳过半径为 0、小于像素阈值或与窗口不相交的气泡
+    min_radius = _min_radius(ax, min_radius_px, alpha_value, x_min, x_max)
+    keep = _visible(points, r * v_nor, (x_min, x_max, y_min, y_max), min_radius)
+    if not keep.all():
+        points, v_nor = points[keep], v_nor[keep]
+        if colors is not None:
+            colors = np.asarray(colors)[keep]
+        n = len(points)
+
+    # 所有气泡合并为一个 EllipseCollection，宽高以数据单位计（直径 = 2 * r * v_nor）
+    if stops is not None:
+        colors = map_colors(points[:, 0], stops, x_lo, x_hi)[:, :3]
+    radii = r * v_nor
+    facecolors = np.column_stack((colors, np.full(n, alpha_value)))
+    bubbles = EllipseCollection(2 * radii, 2 * radii, np.zeros(n), units='xy',
+                                offsets=points, offset_transform=ax.transData,
+                                facecolors=facecolors, edgecolors='none')
+    ax.add_collection(bubbles, autolim=False)
+    timer.mark('artists')
+    
+    timer.finish(fig)
+    return fig
+
+class BubbleIndex:
+    """
+    预先构建的气泡空间索引，用于对同一份（大量）气泡数据反复渲染不同的局部窗口
+    一次性计算归一化半径与坐标范围，并把气泡中心放入网格桶（spatial_index.GridIndex）；
+    bubble_plot(..., extent=窗口, index=索引) 只取出窗口（按最大半径扩展）覆盖的网格桶中的气泡。
+
+    输入参数：
+        points, v: 同 bubble_plot
+
+    示例：
+        index = BubbleIndex(points, v)
+        for extent in crops:
+            fig = bubble_plot(None, None, ['#009FFF', '#EC2F4B'], r=2, extent=extent, index=index)
+    """
+
+    def __init__(self, points, v):
+        points, v = _check_inputs(points, v)
+        self.grid = GridIndex(points)
+        # 按网格排序后的归一化半径，与 grid.xy 一一对应
+        v_nor = chunked_normalize(v)
+        self.max_v_nor = float(np.max(v_nor)) if len(v_nor) else 0.0
+        self.v_nor = v_nor[self.grid.order]
+
+    def __len__(self):
+        return len(self.grid)
+
+def _check_inputs(points, v):
+    """
+    检查并统一输入：points 转为 n x 2（已是数组或 memmap 时不复制），v 为长度 n 的向量
+    """
+    # 参数检查：必须提供 points 和 v
+    if points is None or v is None:
+        raise ValueError('必须提供 points 和 v 参数')
+
+    # 将 points 转换为 numpy 数组以便处理（已是数组或 memmap 时不复制）
+    points = as_array(points, 'points')
+    v = as_array(v, 'v')
+
+    # 检查 points 是否为 2xn 或 nx2 数组
+    if points.ndim != 2 or (points.shape[0] != 2 and points.shape[1] != 2):
+        raise ValueError('points 必须是 2 x n 或 n x 2 数组')
+
+    # 统一 points 为 n x 2 数组（每行是一个点 [x, y]）
+    if points.shape[0] == 2:
+        points = points.T  # 转置为 n x 2
+    n = points.shape[0]
+
+    # 检查 v 是否为向量且长度匹配 points 的点数 n
+    if v.ndim != 1 or len(v) != n:
+        raise ValueError('v 必须是长度为 n 的向量')
+    return points, v
+
+def _window_ids(points, window):
+    """
+    没有索引时分块筛选中心落在窗口内的气泡，返回下标
+    """
+    x_min, x_max, y_min, y_max = window
+    ids, start = [], 0
+    for chunk in iter_chunks(points):
+        inside = (chunk[:, 0] >= x_min) & (chunk[:, 0] <= x_max) & (chunk[:, 1] >= y_min) & (chunk[:, 1] <= y_max)
+        ids.append(start + np.flatnonzero(inside))
+        start += len(chunk)
+    return np.concatenate(ids) if ids else np.zeros(0, dtype=np.int64)
+
+def _min_radius(ax, min_radius_px, alpha_value, x_min, x_max):
+    """
+    把像素半径阈值换算为数据单位
+    'auto' 时取面积 pi * r^2 * alpha 不足半个 8 位色阶的半径：这样的气泡即使完全落在一个像素内也不改变输出
+    """
+    if min_radius_px == 'auto':
+        min_radius_px = np.sqrt(0.5 / 255 / (np.pi * max(float(alpha_value), 1e-12)))
+    if not min_radius_px > 0:
+        return 0.0
+    # 纵横比相等时两个方向的像素比例相同，按 x 方向换算
+    nx = axes_pixel_shape(ax)[1]
+    return float(min_radius_px) * (x_max - x_min) / nx
+
+def _visible(points, radii, window, min_radius):
+    """
+    半径大于阈值（且大于 0）并与窗口相交的气泡：圆心到窗口矩形的距离不超过半径
+    """
+    x_min, x_max, y_min, y_max = window
+    dx = np.maximum(np.maximum(x_min - points[:, 0], points[:, 0] - x_max), 0)
+    dy = np.maximum(np.maximum(y_min - points[:, 1], points[:, 1] - y_max), 0)
+    return (radii > min_radius) & (radii > 0) & (dx * dx + dy * dy <= radii * radii)
+
+if __name__ == '__main__':
+    # 测试气泡图函数 bubble_plot
+    import matplotlib.pyplot as plt
+    chinese_font = get_chinese_font()
+    # 设置随机种子以确保结果可重现
+    np.random.seed(42)
+    
+    # 生成 n 个随机点 (x, y)
+    n = 200
+    x = np.random.rand(n) * 100  # x坐标在0-100之间
+    y = np.random.rand(n) * 100  # y坐标在0-100之间
+    points = np.column_stack((x, y))
+    
+    # 生成权重向量v，模拟不同大小的气泡
+    # 使用正态分布生成权重，然后归一化到0-1范围
+    v = np.abs(np.random.randn(n))
+    v = (v - np.min(v)) / (np.max(v) - np.min(v))
+    
+    # 设置基础半径和透明度
+    r = 5
+    alpha_value = 0.6
+    
+    # 测试用例1: 使用默认颜色
+    fig1 = bubble_plot(points, v, None, r, alpha_value)  # 使用 None 而不是 {}
+    plt.title('测试用例1: 默认颜色', fontproperties=chinese_font)
+    plt.show()
+    
+    # 测试用例2: 使用双色渐变，基于x轴映射
+    colormap_param2 = ['#009FFF', '#EC2F4B']  # 蓝到红渐变
+    fig2 = bubble_plot(points, v, colormap_param2, r, alpha_value)
+    plt.title('测试用例2: 蓝到红渐变 (基于x轴映射)', fontproperties=chinese_font)
+    plt.show()
+    
+    # 测试用例3: 使用三色渐变，基于x轴映射
+    colormap_param3 = ['#FEAC5E', '#C779D0', '#4BC0C8']  # 3色渐变
+    fig3 = bubble_plot(points, v, colormap_param3, r, alpha_value)
+    plt.title('测试用例3: 3色渐变 (基于x轴映射)', fontproperties=chinese_font)
+    plt.show()
+    
+    # 测试用例4: 为每个点指定单独的颜色
+    # 生成随机颜色
+    colors = np.random.rand(n, 3)  # 生成n个RGB颜色
+    colormap_param4 = [tuple(color) for color in colors]  # 转换为列表 of tuples
+    fig4 = bubble_plot(points, v, colormap_param4, r, alpha_value)
+    plt.title('测试用例4: 随机颜色 (每个点单独指定)', fontproperties=chinese_font)
+    plt.show()
+    
+    # 测试用例5: 使用预定义的彩虹色
+    # 生成彩虹色映射
+    rainbow_colors = plt.cm.hsv(np.linspace(0, 1, n))[:, :3]  # 使用HSV颜色空间生成彩虹色，忽略alpha
+    colormap_param5 = rainbow_colors
+    fig5 = bubble_plot(points, v, colormap_param5, r, alpha_value)
+    plt.title('测试用例5: 彩虹色', fontproperties=chinese_font)
+    plt.show()
+    
+    # 测试用例6: 使用不同的半径和透明度
+    r_large = 8  # 更大的半径
+    alpha_low = 0.3  # 更低的透明度
+    fig6 = bubble_plot(points, v, colormap_param2, r_large, alpha_low)
+    plt.title('测试用例6: 更大半径和更低透明度', fontproperties=chinese_font)
+    plt.show()
+    
+    # 显示数据统计信息
+    print('测试数据统计:')
+    print(f'点数: {n}')
+    print(f'x坐标范围: [{np.min(x):.2f}, {np.max(x):.2f}]')
+    print(f'y坐标范围: [{np.min(y):.2f}, {np.max(y):.2f}]')
+    print(f'权重范围: [{np.min(v):.2f}, {np.max(v):.2f}]')
+    print(f'基础半径: {r:.2f}')
+    print(f'透明度: {alpha_value:.2f}')
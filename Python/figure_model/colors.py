@@ -0,0 +1,183 @@
+from functools import lru_cache
+
+import numpy as np
+
+# 渐变查找表的默认分辨率
+DEFAULT_LUT_SIZE = 256
+
+
+def colors_to_rgb(colors):
+    """
+    将颜色列表一次性转换为 n x 3 的 RGB 数组
+
+    输入参数：
+        colors: 列表，每个元素是颜色字符串（如 '#ff0000'）或 RGB 元组（如 (1.0, 0.0, 0.0)），
+                也可以是 n x 3 数组
+
+    输出：
+        n x 3 float 数组
+    """
+    from matplotlib.colors import to_rgba_array
+
+    if len(colors) == 0:
+        return np.zeros((0, 3))
+    # 全部是 '#rrggbb' 字符串时按字符码向量化解析
+    rgb = _parse_hex(colors)
+    if rgb is not None:
+        return rgb
+    # 全部是数值元组时直接转换，否则交给 matplotlib 一次性解析颜色字符串
+    try:
+        rgb = np.asarray(colors, dtype=float)
+    except (TypeError, ValueError):
+        rgb = None
+    if rgb is not None and rgb.ndim == 2 and rgb.shape[1] == 3:
+        return rgb
+    if rgb is None:
+        try:
+            rgb = to_rgba_array(list(colors))[:, :3]
+        except (TypeError, ValueError):
+            rgb = None
+    if rgb is None or rgb.ndim != 2 or rgb.shape[1] != 3:
+        raise ValueError('colormap_param 列表元素必须是颜色字符串或 RGB 元组')
+    return rgb
+
+
+def hsv_to_rgb(h, s, v):
+    """
+    将 HSV 颜色转换为 RGB 颜色（向量化，h、s、v 可以是标量或可广播的数组）
+    输入：h (色调, 0-1), s (饱和度, 0-1), v (值, 0-1)
+    输出：形状为 (..., 3) 的 RGB 数组，每个值在0-1之间
+    """
+    h, s, v = np.broadcast_arrays(np.asarray(h, dtype=float), np.asarray(s, dtype=float),
+                                  np.asarray(v, dtype=float))
+    # 基于标准HSV到RGB转换算法，按色调所在的六分之一扇区选取分量
+    h6 = h * 6
+    i = np.floor(h6).astype(np.int64) % 6
+    f = h6 - np.floor(h6)
+    p = v * (1 - s)
+    q = v * (1 - s * f)
+    t = v * (1 - s * (1 - f))
+
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    return np.stack((r, g, b), axis=-1)
+
+
+def gradient_lut(stops, n_colors=DEFAULT_LUT_SIZE):
+    """
+    返回多色渐变的查找表（带缓存）
+    各颜色节点在 [0, 1] 上均匀分布，第 i 个颜色为位置 i / (n_colors - 1) 处的线性插值结果。
+    相同的 stops 与分辨率只计算一次，返回的数组为只读，需要修改时请先复制。
+
+    输入参数：
+        stops: 颜色节点序列（至少 2 个），元素为颜色字符串或 RGB 元组，如 ('#FEAC5E', '#C779D0', '#4BC0C8')
+        n_colors: 查找表的颜色数量
+
+    输出：
+        n_colors x 3 的只读 RGB 数组
+    """
+    return _compile_lut(_stops_key(stops), int(n_colors))
+
+
+def gradient_colors(stops, n):
+    """
+    从多色渐变中均匀采样 n 个颜色（第一个为起始颜色，最后一个为结束颜色）
+    输出：n x 3 的 RGB 数组（可修改的副本）
+    """
+    return np.array(gradient_lut(stops, n))
+
+
+def map_colors(values, stops, vmin=None, vmax=None, alpha=None, n_colors=DEFAULT_LUT_SIZE):
+    """
+    将整组数值一次性映射为 RGBA 颜色
+    数值按 [vmin, vmax] 归一化并截断到 [0, 1]，再按最近的查找表索引取色。
+    vmin 与 vmax 相等时全部取渐变中间的颜色。
+
+    输入参数：
+        values: 一维数值数组（如所有点的 x 坐标）
+        stops: 颜色节点序列，见 gradient_lut
+        vmin, vmax: 可选，归一化范围，缺省时取 values 的最小/最大值
+        alpha: 可选，透明度，标量或与 values 等长的数组；缺省时为 1
+        n_colors: 查找表的颜色数量
+
+    输出：
+        n x 4 的 RGBA 数组
+
+    示例：
+        rgba = map_colors(points[:, 0], ['#ff0000', '#0000ff'], alpha=0.6)
+    """
+    values = np.asarray(values, dtype=float)
+    lut = gradient_lut(stops, n_colors)
+    if len(values) > 0 and (vmin is None or vmax is None):
+        vmin = np.min(values) if vmin is None else vmin
+        vmax = np.max(values) if vmax is None else vmax
+    if len(values) == 0 or vmax == vmin:
+        idx = np.full(len(values), int(round(0.5 * (len(lut) - 1))), dtype=np.int64)
+    else:
+        pos = (values - vmin) * ((len(lut) - 1) / (vmax - vmin))
+        idx = np.rint(np.clip(pos, 0, len(lut) - 1)).astype(np.int64)
+
+    rgba = np.empty((len(values), 4))
+    rgba[:, :3] = lut[idx]
+    rgba[:, 3] = 1.0 if alpha is None else alpha
+    return rgba
+
+
+def create_hex_colormap(hex1, hex2, n_colors=DEFAULT_LUT_SIZE):
+    """
+    创建从 hex1 到 hex2 的渐变色图
+    输入：hex1 和 hex2 为颜色字符串，n_colors 为颜色数量
+    输出：ListedColormap 对象（颜色表取自 gradient_lut 的缓存）
+    """
+    from matplotlib.colors import ListedColormap
+
+    return ListedColormap(gradient_lut((hex1, hex2), n_colors), name='custom_cmap')
+
+
+def clear_lut_cache():
+    """
+    清空渐变查找表缓存
+    """
+    _compile_lut.cache_clear()
+
+
+def _parse_hex(colors):
+    # 不是等长的 '#rrggbb' 字符串数组时返回 None，由调用方走通用解析
+    try:
+        arr = np.asarray(colors)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim != 1 or arr.dtype != np.dtype('<U7'):
+        return None
+    codes = arr.view(np.uint32).reshape(-1, 7)
+    lower = codes[:, 1:] | 0x20  # 'A'-'F' 转为小写，数字不受影响
+    is_digit = (codes[:, 1:] >= 0x30) & (codes[:, 1:] <= 0x39)
+    is_alpha = (lower >= 0x61) & (lower <= 0x66)
+    if not (np.all(codes[:, 0] == ord('#')) and np.all(is_digit | is_alpha)):
+        return None
+    nibbles = np.where(is_digit, codes[:, 1:] - 0x30, lower - 0x57)
+    return (nibbles[:, 0::2] * 16 + nibbles[:, 1::2]) / 255.0
+
+
+def _stops_key(stops):
+    # 把颜色节点转换为可哈希的缓存键：字符串保持原样，RGB 序列转换为浮点元组
+    if isinstance(stops, np.ndarray):
+        stops = stops.tolist()
+    key = tuple(c if isinstance(c, str) else tuple(float(x) for x in c) for c in stops)
+    if len(key) < 2:
+        raise ValueError('渐变至少需要 2 个颜色')
+    return key
+
+
+@lru_cache(maxsize=64)
+def _compile_lut(key, n_colors):
+    if n_colors < 1:
+        raise ValueError('n_colors 必须为正整数')
+    rgb = colors_to_rgb(list(key))
+    # 各节点均匀分布在 [0, 1] 上，三个通道分别做分段线性插值
+    t = np.linspace(0, 1, n_colors)
+    knots = np.linspace(0, 1, len(rgb))
+    lut = np.column_stack([np.interp(t, knots, rgb[:, c]) for c in range(3)])
+    lut.flags.writeable = False
+    return lut
@@ -0,0 +1,166 @@
+import os
+
+import numpy as np
+
+# 分块归约时每块的默认字节数
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def as_array(data, name='data', numeric=True):
+    """
+    将输入转换为 NumPy 数组，尽量不复制
+    已经是数值型 ndarray（包括 np.memmap）时直接返回原对象；路径则交给 load_array 读取。
+
+    输入参数：
+        data: 数组、嵌套列表、np.memmap，或 .npy / .npz / .csv / .parquet / .arrow / .feather 文件路径
+        name: 参数名，用于错误信息
+        numeric: 是否要求数值类型；非数值（如 object）数组会尝试转换为 float
+
+    输出：
+        ndarray
+    """
+    if isinstance(data, (str, os.PathLike)):
+        data = load_array(data)
+    arr = np.asarray(data)
+    if numeric and arr.dtype.kind not in 'biuf':
+        try:
+            arr = arr.astype(float)
+        except (TypeError, ValueError):
+            raise ValueError(f'{name} 必须是数值数组')
+    return arr
+
+
+def load_array(path, columns=None, key=None):
+    """
+    从文件读取数组，能内存映射的格式不读入内存
+
+    输入参数：
+        path: 文件路径，支持：
+              - .npy: 以只读 np.memmap 方式打开
+              - .npz: 读取 key 指定的数组（只有一个数组时可省略）
+              - .csv: 逗号分隔文本；columns 为列名时第一行视为表头
+              - .parquet: 读取 columns 指定的列（需要 pyarrow）
+              - .arrow / .feather: Arrow IPC 文件，以内存映射方式打开（需要 pyarrow）
+        columns: 可选，要读取的列（列名或列序号）；多列时按列堆叠为 n x k 数组
+        key: 可选，.npz 文件中的数组名
+
+    输出：
+        ndarray 或 np.memmap
+    """
+    path = os.fspath(path)
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npy':
+        arr = np.load(path, mmap_mode='r')
+        return arr if columns is None else arr[:, columns]
+    if ext == '.npz':
+        with np.load(path, allow_pickle=False) as npz:
+            if key is None:
+                if len(npz.files) != 1:
+                    raise ValueError('.npz 文件包含多个数组时必须指定 key')
+                key = npz.files[0]
+            arr = npz[key]
+        return arr if columns is None else arr[:, columns]
+    if ext == '.csv':
+        return _load_csv(path, columns)
+    if ext in ('.parquet', '.arrow', '.feather'):
+        return _load_arrow(path, ext, columns)
+    raise ValueError(f'不支持的数据文件格式: {ext}')
+
+
+def iter_chunks(arr, chunk_rows=None):
+    """
+    沿第 0 维按块迭代数组，每块是原数组的切片视图
+
+    输入参数：
+        arr: ndarray 或 np.memmap
+        chunk_rows: 可选，每块的行数；默认按 DEFAULT_CHUNK_BYTES 估算
+
+    输出：
+        生成器，依次产生 arr[i:i+chunk_rows]
+    """
+    n = len(arr)
+    if chunk_rows is None:
+        row_bytes = max(arr.itemsize * int(np.prod(arr.shape[1:], dtype=np.int64)), 1)
+        chunk_rows = max(DEFAULT_CHUNK_BYTES // row_bytes, 1)
+    for start in range(0, n, chunk_rows):
+        yield arr[start:start + chunk_rows]
+
+
+def chunked_min_max(arr, chunk_rows=None):
+    """
+    分块计算最小值与最大值，不产生与整个数组同样大小的临时数组
+    一维数组返回标量；多维数组按第 0 维归约，返回每列（或每个后续位置）的最小/最大值。
+    NaN（如缺测段）被忽略，整列都是 NaN 时该列结果为 NaN。
+
+    输出：
+        (min, max)；数组为空时返回 (None, None)
+    """
+    lo = None
+    hi = None
+    for chunk in iter_chunks(arr, chunk_rows):
+        if len(chunk) == 0:
+            continue
+        # fmin / fmax 在两个操作数中只有一个是 NaN 时返回另一个，不会产生全 NaN 切片的警告
+        c_lo = np.fmin.reduce(chunk, axis=0)
+        c_hi = np.fmax.reduce(chunk, axis=0)
+        lo = c_lo if lo is None else np.fmin(lo, c_lo)
+        hi = c_hi if hi is None else np.fmax(hi, c_hi)
+    return lo, hi
+
+
+def chunked_normalize(v, v_min=None, v_max=None, chunk_rows=None, out=None):
+    """
+    分块做最小-最大归一化：(v - v_min) / (v_max - v_min)
+    v_min 与 v_max 相等时结果全为 0.5（与 bubble_plot 的约定一致）。
+
+    输入参数：
+        v: 一维数组或 np.memmap
+        v_min, v_max: 可选，归一化范围；缺省时用 chunked_min_max 计算
+        out: 可选，输出数组；缺省时新建 float 数组
+
+    输出：
+        归一化后的 float 数组
+    """
+    if v_min is None or v_max is None:
+        v_min, v_max = chunked_min_max(v, chunk_rows)
+    if out is None:
+        out = np.empty(len(v), dtype=float)
+    if v_min is None or v_max == v_min:
+        out[...] = 0.5
+        return out
+    scale = 1.0 / (v_max - v_min)
+    start = 0
+    for chunk in iter_chunks(v, chunk_rows):
+        stop = start + len(chunk)
+        np.subtract(chunk, v_min, out=out[start:stop])
+        out[start:stop] *= scale
+        start = stop
+    return out
+
+
+def _load_csv(path, columns):
+    if columns is not None and any(isinstance(c, str) for c in np.atleast_1d(columns)):
+        table = np.genfromtxt(path, delimiter=',', names=True)
+        names = [columns] if isinstance(columns, str) else list(columns)
+        return np.column_stack([table[c] for c in names]) if len(names) > 1 else table[names[0]]
+    arr = np.loadtxt(path, delimiter=',', usecols=columns, ndmin=1)
+    return arr
+
+
+def _load_arrow(path, ext, columns):
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError('读取 Parquet / Arrow 文件需要安装 pyarrow')
+    if ext == '.parquet':
+        import pyarrow.parquet as pq
+        table = pq.read_table(path, columns=columns, memory_map=True)
+    else:
+        table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+        if columns is not None:
+            table = table.select(columns)
+    # 单块、无空值的数值列转换为 NumPy 时不复制
+    arrays = [table.column(i).combine_chunks().to_numpy(zero_copy_only=False) for i in range(table.num_columns)]
+    if len(arrays) == 1:
+        return arrays[0]
+    return np.column_stack(arrays)
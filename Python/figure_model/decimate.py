@@ -0,0 +1,184 @@
+import numpy as np
+
+
+def minmax_decimate(x, y, n_buckets):
+    """
+    按最小/最大值分桶降采样
+    将折线按索引均分为 n_buckets 个桶，每个桶保留 y 最小和最大的两个点（按原顺序），
+    并始终保留首尾点。以像素宽度作为桶数时，结果在该分辨率下与原始折线在视觉上一致。
+
+    输入参数：
+        x, y: 长度为 k 的一维数组
+        n_buckets: 桶数（通常取绘图区域的像素宽度）
+
+    输出：
+        (x_out, y_out): 降采样后的坐标，点数不超过 2 * n_buckets + 2
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    k = len(x)
+    n_buckets = int(n_buckets)
+    if n_buckets < 1 or k <= 2 * n_buckets + 2:
+        return x, y
+
+    # 补齐到 n_buckets * size 后重塑为二维，一次性求每个桶的最小/最大值位置
+    size = -(-k // n_buckets)
+    n_buckets = -(-k // size)
+    padded = np.empty(n_buckets * size)
+    padded[:k] = y
+    padded[k:] = np.nan
+    buckets = padded.reshape(n_buckets, size)
+    base = np.arange(n_buckets) * size
+    # 用 ±inf 代替 NaN 求极值位置（整个桶都是 NaN 时 nanargmin 会报错，如长于一个桶的缺测段）；
+    # 全 NaN 的桶保留其第一个点，折线在缺测处仍然断开
+    nan = np.isnan(buckets)
+    i_min = base + np.argmin(np.where(nan, np.inf, buckets), axis=1)
+    i_max = base + np.argmax(np.where(nan, -np.inf, buckets), axis=1)
+    all_nan = nan.all(axis=1)
+    i_min[all_nan] = base[all_nan]
+    i_max[all_nan] = base[all_nan]
+
+    # 每个桶内按原顺序输出两个点，再并上首尾点
+    keep = np.concatenate(([0], np.sort(np.stack((i_min, i_max), axis=1), axis=1).ravel(), [k - 1]))
+    keep = keep[np.concatenate(([True], np.diff(keep) != 0))]
+    return x[keep], y[keep]
+
+
+def lttb_decimate(x, y, n_out):
+    """
+    最大三角形三桶（LTTB）降采样
+    首尾点固定，中间 n_out - 2 个桶每桶选出与前一个已选点、后一个桶均值点构成三角形面积最大的点。
+    每个桶内的面积计算是向量化的，Python 循环次数只与 n_out 有关，与原始点数无关。
+
+    输入参数：
+        x, y: 长度为 k 的一维数组（x 应单调）
+        n_out: 输出点数（至少为 3）
+
+    输出：
+        (x_out, y_out): 降采样后的坐标
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    k = len(x)
+    n_out = int(n_out)
+    if n_out < 3 or k <= n_out:
+        return x, y
+
+    # 中间点 [1, k-1) 均分为 n_out - 2 个桶
+    edges = np.linspace(1, k - 1, n_out - 1).astype(np.int64)
+    # 每个桶的均值点，末尾追加最后一个点作为“后一个桶”
+    counts = np.diff(edges)
+    x_mean = np.append(np.add.reduceat(x[1:k - 1], edges[:-1] - 1) / counts, x[-1])
+    y_mean = np.append(np.add.reduceat(y[1:k - 1], edges[:-1] - 1) / counts, y[-1])
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = k - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        # 三角形面积（省略常数 1/2）
+        area = np.abs((x[a] - x_mean[b + 1]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (y_mean[b + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[b + 1] = a
+    return x[keep], y[keep]
+
+
+def decimate_line(x, y, n_pixels, method='minmax'):
+    """
+    按像素预算对单条折线降采样
+
+    输入参数：
+        x, y: 一维坐标数组
+        n_pixels: 绘图区域的像素宽度
+        method: 'minmax'（每像素保留最小/最大值，默认）或 'lttb'
+
+    输出：
+        (x_out, y_out)
+    """
+    if method == 'minmax':
+        return minmax_decimate(x, y, n_pixels)
+    elif method == 'lttb':
+        # LTTB 每桶只保留一个点，取两倍像素宽度的点数以保留峰谷
+        return lttb_decimate(x, y, 2 * n_pixels)
+    else:
+        raise ValueError("method 必须是 'minmax' 或 'lttb'")
+
+
+def axes_pixel_width(ax):
+    """
+    返回坐标轴绘图区域在保存/显示分辨率下的像素宽度
+    """
+    fig = ax.figure
+    return max(1, int(np.ceil(fig.get_figwidth() * fig.dpi * ax.get_position().width)))
+
+
+def time_bins(t, bins, calendar=False):
+    """
+    按时间轴分箱，返回每个箱第一个样本的下标（供 bin_reduce 使用）
+    t 必须单调不减；没有样本的箱会被跳过。
+
+    输入参数：
+        t: 长度为 k 的数值时间向量；calendar 为 True 时为 matplotlib 日期数值（单位为天，见 mdates.date2num）
+        bins: 整数时把时间范围等分为 bins 个箱；calendar 为 True 时可以是 'day'、'week'（周一开始）或 'month'
+        calendar: 可选，t 是否为日期数值，默认 False
+
+    输出：
+        starts: 长度为箱数的整数数组，starts[0] == 0
+    """
+    t = np.asarray(t, dtype=float)
+    k = len(t)
+    if k == 0:
+        return np.zeros(0, dtype=np.int64)
+    if isinstance(bins, str):
+        if not calendar:
+            raise ValueError('按日 / 周 / 月分箱要求时间向量为日期时间')
+        import matplotlib.dates as mdates
+
+        # 日期数值相对 matplotlib 的纪元计数，换算为 1970-01-01 起的整数天
+        days = np.floor(t).astype(np.int64) + np.datetime64(mdates.get_epoch(), 'D').astype(np.int64)
+        if bins == 'day':
+            keys = days
+        elif bins == 'week':
+            # 1970-01-01 是周四，平移 3 天使每周从周一开始
+            keys = (days + 3) // 7
+        elif bins == 'month':
+            keys = days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+        else:
+            raise ValueError("日历分箱必须是 'day'、'week' 或 'month'")
+    else:
+        bins = int(bins)
+        if bins < 1:
+            raise ValueError('箱数必须是正整数')
+        span = t[-1] - t[0]
+        if not span > 0:
+            return np.zeros(1, dtype=np.int64)
+        keys = np.minimum(((t - t[0]) / span * bins).astype(np.int64), bins - 1)
+    # 键单调不减，键变化的位置即为新箱的起点
+    return np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+
+
+def bin_reduce(values, starts, agg='mean'):
+    """
+    按箱起点对数组的第 0 维做向量化分段聚合（np.ufunc.reduceat，不逐箱循环）
+
+    输入参数：
+        values: k 行的一维或二维数组（如 n_time x n_cat 的数据矩阵，每列独立聚合）
+        starts: time_bins 返回的箱起点
+        agg: 'mean'（默认）、'sum'、'min' 或 'max'
+
+    输出：
+        第 0 维长度为箱数的数组（浮点型）
+    """
+    values = np.asarray(values)
+    if agg in ('mean', 'sum'):
+        total = np.add.reduceat(values, starts, axis=0, dtype=float)
+        if agg == 'sum':
+            return total
+        counts = np.diff(np.append(starts, len(values)))
+        return total / counts.reshape((-1,) + (1,) * (values.ndim - 1))
+    if agg == 'min':
+        return np.minimum.reduceat(values, starts, axis=0).astype(float, copy=False)
+    if agg == 'max':
+        return np.maximum.reduceat(values, starts, axis=0).astype(float, copy=False)
+    raise ValueError("agg 必须是 'mean'、'sum'、'min' 或 'max'")
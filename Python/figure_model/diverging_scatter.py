@@ -0,0 +1,451 @@
+import numpy as np
+
+from .colors import colors_to_rgb, gradient_colors
+from .data_source import as_array, chunked_min_max, iter_chunks
+from .figure_pool import new_figure
+from .font_cache import get_chinese_font
+from .profiling import start_call
+from .raster import axes_pixel_shape, draw_raster, rasterize_points, shade_raster, use_raster
+
+def diverging_scatter(center_points, data_matrix, colormap_param, center_visible, raster='auto'):
+    """
+    绘制发散PCA散点图（二维点版本）
+    该函数绘制发散散点图，每个类有一个二维中心点，多个二维数据点，并用线连接中心点与数据点。
+    类大小相差悬殊或数据是扁平的 (类标签, 坐标) 形式时，请使用 diverging_scatter_from_labels。
+
+    输入参数：
+        center_points: 2 x n 或 n x 2 数组，表示 n 个二维中心点。每列或每行是一个中心点的 [x, y] 坐标。
+        data_matrix: n x m x 2 数组，表示数据点。n 是类数，m 是每个类的点数，第三维是坐标 [x, y]。
+                     空值用 [0, 0] 表示，会被跳过。
+                     两个数组参数也可以是 np.memmap 或数据文件路径（见 data_source.py）。
+        colormap_param: 颜色参数，可以是：
+                        - None：使用默认颜色渐变
+                        - 2元素列表：使用 generate_gradient_colors 生成渐变色，并均匀采样 n 个颜色
+                        - n元素列表：每个元素是颜色字符串（如 '#ff0000'）或 RGB 元组（如 (1.0, 0.0, 0.0)），按索引直接使用
+                        - n x 3 数组：直接作为颜色映射，每行是一个 RGB 颜色
+        center_visible: 布尔值或 0/1，控制中心点是否可见
+        raster: 可选，是否使用密度栅格模式，可以是：
+                - 'auto'：数据点总数（n x m）达到 raster.RASTER_THRESHOLD（100 万）时使用（默认）
+                - True：按类别颜色把数据点聚合到像素网格，用一张图像显示，不绘制连线；
+                  耗时与内存只与输出像素数有关
+                - False：绘制所有连线与数据点
+
+    输出：
+        fig: matplotlib 图窗对象
+
+    示例：
+        center_points = np.array([[1, 2], [3, 4]])  # 2x2 数组，两个中心点
+        data_matrix = np.array([[[5, 6], [7, 8]], [[9, 10], [11, 12]]])  # 2x2x2 数组
+        colormap_param = ['#ff6e7f', '#bfe9ff']
+        center_visible = True
+        fig = diverging_scatter(center_points, data_matrix, colormap_param, center_visible)
+    """
+    timer = start_call('diverging_scatter')
+    # 参数检查：必须提供所有参数
+    if center_points is None or data_matrix is None or colormap_param is None or center_visible is None:
+        raise ValueError('必须提供所有参数')
+    
+    # 将输入转换为 numpy 数组（已是数组或 memmap 时不复制）
+    center_points = as_array(center_points, 'center_points')
+    data_matrix = as_array(data_matrix, 'data_matrix')
+    
+    # 检查 center_points 是否为 2xn 或 nx2 数组
+    if center_points.ndim != 2 or (center_points.shape[0] != 2 and center_points.shape[1] != 2):
+        raise ValueError('center_points 必须是 2 x n 或 n x 2 数组')
+    
+    # 统一 center_points 为 n x 2 数组（每行是一个中心点）
+    if center_points.shape[0] == 2:
+        n = center_points.shape[1]
+        center_points = center_points.T  # 转置为 n x 2
+    else:
+        n = center_points.shape[0]
+        if center_points.shape[1] != 2:
+            raise ValueError('center_points 必须是 2 x n 或 n x 2 数组')
+    
+    # 检查 data_matrix 是否为 n x m x 2 数组
+    if data_matrix.ndim != 3 or data_matrix.shape[2] != 2:
+        raise ValueError('data_matrix 必须是 n x m x 2 数组')
+    if data_matrix.shape[0] != n:
+        raise ValueError('data_matrix 的第一个维度必须与 center_points 的类数 n 一致')
+    m = data_matrix.shape[1]  # 每个类的点数
+    
+    # 检查 center_visible 是否为布尔值或 0/1
+    if isinstance(center_visible, int):
+        if center_visible == 0 or center_visible == 1:
+            center_visible = bool(center_visible)
+        else:
+            raise ValueError('center_visible 必须是布尔值或 0/1')
+    elif not isinstance(center_visible, bool):
+        raise ValueError('center_visible 必须是布尔值或 0/1')
+    timer.mark('input')
+    
+    # 处理颜色参数
+    groupColors = _group_colors(colormap_param, n)
+    timer.mark('colors')
+    
+    # 创建图窗（激活 FigurePool 时复用池中的无界面图窗）
+    fig, ax = new_figure((8, 6), window_title='发散聚类散点图')
+    timer.mark('figure')
+    
+    # 设置中文字体
+    chinese_font = get_chinese_font()
+    timer.mark('font')
+    
+    # 设置透明度参数
+    line_alpha = 0.3
+    point_alpha = 0.75
+    
+    if use_raster(raster, n * m):
+        _draw_diverging_raster(ax, center_points, data_matrix, groupColors, center_visible, point_alpha)
+        ax.set_xlabel('X 坐标', fontproperties=chinese_font)
+        ax.set_ylabel('Y 坐标', fontproperties=chinese_font)
+        timer.mark('raster')
+        timer.finish(fig)
+        return fig
+    
+    # 用一个布尔掩码一次性跳过空值 [0, 0]，得到扁平的 (类标签, 坐标) 数组
+    valid_mask = np.any(data_matrix != 0, axis=2)
+    labels = np.nonzero(valid_mask)[0]
+    points = data_matrix[valid_mask].astype(float)
+    timer.mark('mask')
+    
+    _draw_diverging(ax, center_points, labels, points, groupColors, center_visible, line_alpha, point_alpha)
+    
+    # 设置轴标签
+    ax.set_xlabel('X 坐标', fontproperties=chinese_font)
+    ax.set_ylabel('Y 坐标', fontproperties=chinese_font)
+    timer.mark('artists')
+    
+    # 设置轴范围
+    all_x = np.concatenate([center_points[:, 0], points[:, 0]])
+    all_y = np.concatenate([center_points[:, 1], points[:, 1]])
+    if len(all_x) > 0 and len(all_y) > 0:
+        x_min = np.min(all_x)
+        x_max = np.max(all_x)
+        y_min = np.min(all_y)
+        y_max = np.max(all_y)
+        x_range = x_max - x_min
+        y_range = y_max - y_min
+        margin_x = 0.1 * x_range
+        margin_y = 0.1 * y_range
+        ax.set_xlim(x_min - margin_x, x_max + margin_x)
+        ax.set_ylim(y_min - margin_y, y_max + margin_y)
+    timer.mark('limits')
+    
+    timer.finish(fig)
+    return fig
+
+def diverging_scatter_from_labels(labels, xy, colormap_param=None, center_visible=True, center='centroid', raster='auto'):
+    """
+    由扁平的 (类标签, 坐标) 数据绘制发散散点图（如 PCA 降维 + k-means 聚类的结果）
+    类中心按标签向量化分组计算（见 cluster_centers），绘制直接使用扁平数组，
+    不构造补零的 n x m x 2 数组，类大小相差悬殊（如一类 50 万个点、数百类各约 10 个点）时内存只与点数有关。
+
+    输入参数：
+        labels: 长度为 k 的类标签数组（整数或字符串，如 k-means 的输出），也可以是 np.memmap 或数据文件路径
+        xy: k x 2 数组，每行是一个数据点的 [x, y] 坐标，也可以是 np.memmap 或数据文件路径
+        colormap_param: 可选，颜色参数，取值同 diverging_scatter，其中 n 为类数（不同标签的个数），
+                        类按标签升序排列
+        center_visible: 可选，是否绘制中心点，默认 True
+        center: 可选，类中心的计算方式：'centroid'（均值，默认）、'median'（逐坐标中位数）
+                或 'medoid'（类内离均值最近的数据点），也可以直接给出 n x 2 的中心点数组
+        raster: 可选，是否使用密度栅格模式，取值同 diverging_scatter（'auto' 按点数 k 判断）
+
+    输出：
+        fig: matplotlib 图窗对象
+
+    示例：
+        labels = KMeans(n_clusters=8).fit_predict(features)
+        xy = PCA(n_components=2).fit_transform(features)
+        fig = diverging_scatter_from_labels(labels, xy, ['#ff6e7f', '#bfe9ff'], center='medoid')
+    """
+    timer = start_call('diverging_scatter_from_labels')
+    labels = as_array(labels, 'labels', numeric=False)
+    xy = as_array(xy, 'xy')
+    if labels.ndim != 1:
+        raise ValueError('labels 必须是一维数组')
+    if xy.ndim != 2 or xy.shape[1] != 2 or len(xy) != len(labels):
+        raise ValueError('xy 必须是 k x 2 数组，且行数与 labels 的长度一致')
+    center_visible = bool(center_visible)
+
+    # 类标签映射为 0 ~ n-1 的类索引，并计算类中心
+    classes, index = _group_labels(labels)
+    n = len(classes)
+    if isinstance(center, str):
+        center_points = _centers_from_index(index, xy, n, center)
+    else:
+        center_points = as_array(center, 'center').astype(float, copy=False)
+        if center_points.shape != (n, 2):
+            raise ValueError('center 为数组时必须是 n x 2，n 为类数')
+    timer.mark('input')
+
+    groupColors = _group_colors(colormap_param, n)
+    timer.mark('colors')
+
+    fig, ax = new_figure((8, 6), window_title='发散聚类散点图')
+    timer.mark('figure')
+
+    chinese_font = get_chinese_font()
+    ax.set_xlabel('X 坐标', fontproperties=chinese_font)
+    ax.set_ylabel('Y 坐标', fontproperties=chinese_font)
+    timer.mark('font')
+
+    # 轴范围：中心点与数据点的整体范围四周各留 10%，分块计算
+    lo, hi = chunked_min_max(xy)
+    if lo is None:
+        lo, hi = np.min(center_points, axis=0, initial=np.inf), np.max(center_points, axis=0, initial=-np.inf)
+    elif n > 0:
+        lo = np.minimum(lo, center_points.min(axis=0))
+        hi = np.maximum(hi, center_points.max(axis=0))
+    if np.all(np.isfinite(lo)) and np.all(np.isfinite(hi)):
+        margin = 0.1 * (hi - lo)
+        ax.set_xlim(lo[0] - margin[0], hi[0] + margin[0])
+        ax.set_ylim(lo[1] - margin[1], hi[1] + margin[1])
+    timer.mark('limits')
+
+    if use_raster(raster, len(xy)):
+        # 按块查表得到每个点的颜色并分箱到像素网格，不生成整个数组大小的颜色数组
+        lightColors = np.clip(np.asarray(groupColors, dtype=float) + 0.15, 0, 0.8)
+        shape = axes_pixel_shape(ax)
+        extent = (*ax.get_xlim(), *ax.get_ylim())
+        out = None
+        start = 0
+        for chunk in iter_chunks(xy):
+            stop = start + len(chunk)
+            out = rasterize_points(chunk, extent, shape, colors=lightColors[index[start:stop]], out=out)
+            start = stop
+        if out is not None:
+            density, color_sum = out
+            draw_raster(ax, shade_raster(density, shape, 0.75, color_sum=color_sum), extent)
+        if center_visible:
+            ax.scatter(center_points[:, 0], center_points[:, 1], s=80, marker='o', edgecolor='white',
+                       facecolor=np.clip(np.asarray(groupColors, dtype=float) * 0.9, 0, 1))
+        timer.mark('raster')
+        timer.finish(fig)
+        return fig
+
+    _draw_diverging(ax, center_points, index, np.asarray(xy, dtype=float), groupColors, center_visible)
+    timer.mark('artists')
+
+    timer.finish(fig)
+    return fig
+
+def cluster_centers(labels, xy, method='centroid'):
+    """
+    按类标签向量化计算每类的中心（不逐类循环）
+    均值用 np.bincount 加权求和；中位数与 medoid 先按 (类, 数值) 排序，再按每类的起始位置直接取值。
+
+    输入参数：
+        labels: 长度为 k 的类标签数组
+        xy: k x 2 数组，数据点坐标
+        method: 可选，'centroid'（均值，默认）、'median'（逐坐标中位数）或
+                'medoid'（类内离均值最近的实际数据点；严格的距离和最小点需要 O(m^2) 计算，这里不采用）
+
+    输出：
+        (classes, centers)：升序排列的 n 个不同标签，以及 n x 2 的中心点数组
+
+    示例：
+        classes, centers = cluster_centers(kmeans.labels_, xy, method='medoid')
+    """
+    labels = as_array(labels, 'labels', numeric=False)
+    xy = as_array(xy, 'xy')
+    if labels.ndim != 1 or xy.ndim != 2 or xy.shape[1] != 2 or len(xy) != len(labels):
+        raise ValueError('labels 必须是长度为 k 的一维数组，xy 必须是 k x 2 数组')
+    classes, index = _group_labels(labels)
+    return classes, _centers_from_index(index, xy, len(classes), method)
+
+def _group_labels(labels):
+    """
+    将类标签映射为 0 ~ n-1 的类索引
+    非负整数标签用 np.bincount 查表（O(k)），其余标签（负数、字符串等）用 np.unique。
+    输出：(classes, index)
+    """
+    if labels.dtype.kind in 'iu' and len(labels) > 0:
+        lo, hi = labels.min(), labels.max()
+        if lo >= 0 and hi <= 4 * len(labels):
+            codes = labels.astype(np.intp, copy=False)
+            present = np.bincount(codes) > 0
+            classes = np.flatnonzero(present).astype(labels.dtype)
+            lookup = np.cumsum(present) - 1
+            return classes, lookup[codes]
+    classes, index = np.unique(labels, return_inverse=True)
+    return classes, index.ravel()
+
+def _centers_from_index(index, xy, n, method):
+    """
+    由类索引计算 n 个类中心，见 cluster_centers
+    """
+    counts = np.bincount(index, minlength=n)
+    x = np.asarray(xy[:, 0], dtype=float)
+    y = np.asarray(xy[:, 1], dtype=float)
+    centroids = np.column_stack((np.bincount(index, weights=x, minlength=n),
+                                 np.bincount(index, weights=y, minlength=n))) / np.maximum(counts, 1)[:, None]
+    if method == 'centroid':
+        return centroids
+    starts = np.cumsum(counts) - counts
+    if method == 'median':
+        # 每类内按数值排序后取中间一个（偶数个时取中间两个的平均）
+        lo = starts + (counts - 1) // 2
+        hi = starts + counts // 2
+        centers = np.empty((n, 2))
+        for d, v in enumerate((x, y)):
+            v_sorted = v[np.lexsort((v, index))]
+            centers[:, d] = (v_sorted[lo] + v_sorted[hi]) / 2
+        return centers
+    if method == 'medoid':
+        # 每类按到均值的距离排序，每类第一个即为离均值最近的数据点
+        d2 = (x - centroids[index, 0]) ** 2 + (y - centroids[index, 1]) ** 2
+        nearest = np.lexsort((d2, index))[starts]
+        return np.column_stack((x[nearest], y[nearest]))
+    raise ValueError("center 必须是 'centroid'、'median'、'medoid' 或 n x 2 数组")
+
+def _draw_diverging(ax, center_points, labels, points, groupColors, center_visible, line_alpha=0.3, point_alpha=0.75):
+    """
+    以集合对象批量绘制发散散点图
+    所有连线合并为一个 LineCollection，所有数据点合并为一个 PathCollection，
+    中心点再用一个 PathCollection 绘制，艺术家对象数量与点数无关。
+
+    输入参数：
+        ax: matplotlib 坐标轴对象
+        center_points: n x 2 数组，每行是一个中心点
+        labels: 长度为 k 的整数数组，每个数据点所属的类索引 (0 ~ n-1)
+        points: k x 2 数组，数据点坐标
+        groupColors: n x 3 数组，每类的基础颜色
+        center_visible: 布尔值，是否绘制中心点
+        line_alpha, point_alpha: 连线与数据点的透明度
+    """
+    from matplotlib.collections import LineCollection
+
+    groupColors = np.asarray(groupColors, dtype=float)
+    
+    # 按类计算三种派生颜色：连线（较浅）、数据点（较浅）、中心点（较深）
+    lineColors = np.clip(groupColors + 0.3, 0, 0.9)
+    lightColors = np.clip(groupColors + 0.15, 0, 0.8)
+    darkerColors = np.clip(groupColors * 0.9, 0, 1)
+    
+    if len(points) > 0:
+        # 每条连线是 [中心点, 数据点] 两个顶点，构成 k x 2 x 2 的线段数组
+        segments = np.stack((center_points[labels], points), axis=1)
+        lines = LineCollection(segments, colors=lineColors[labels], alpha=line_alpha, linewidths=3)
+        ax.add_collection(lines, autolim=False)
+        
+        # 所有数据点一次性绘制
+        ax.scatter(points[:, 0], points[:, 1], s=150, marker='o', linewidth=2, edgecolor='white',
+                   facecolor=lightColors[labels], alpha=point_alpha)
+    
+    # 绘制中心点
+    if center_visible:
+        ax.scatter(center_points[:, 0], center_points[:, 1], s=80, marker='o', edgecolor='white', facecolor=darkerColors)
+
+def _draw_diverging_raster(ax, center_points, data_matrix, groupColors, center_visible, point_alpha=0.75):
+    """
+    以密度栅格绘制发散散点图的数据点
+    逐类把非空数据点分箱到绘图区域的像素网格，像素颜色为其中各类数据点颜色的加权平均，
+    最后用一个 imshow 显示；中心点仍以散点绘制。轴范围与矢量模式相同（数据范围四周各留 10%）。
+
+    输入参数：
+        ax: matplotlib 坐标轴对象
+        center_points: n x 2 数组，每行是一个中心点
+        data_matrix: n x m x 2 数组（可以是 np.memmap），空值 [0, 0] 会被跳过
+        groupColors: n x 3 数组，每类的基础颜色
+        center_visible: 布尔值，是否绘制中心点
+        point_alpha: 数据点的最大不透明度
+    """
+    groupColors = np.asarray(groupColors, dtype=float)
+    lightColors = np.clip(groupColors + 0.15, 0, 0.8)
+    darkerColors = np.clip(groupColors * 0.9, 0, 1)
+    n = len(center_points)
+    
+    # 第一遍：逐类计算非空数据点与中心点的坐标范围
+    lo = np.min(center_points, axis=0) if n > 0 else None
+    hi = np.max(center_points, axis=0) if n > 0 else None
+    for i in range(n):
+        cluster = data_matrix[i]
+        valid = cluster[np.any(cluster != 0, axis=1)]
+        if len(valid) > 0:
+            lo = np.minimum(lo, valid.min(axis=0))
+            hi = np.maximum(hi, valid.max(axis=0))
+    if lo is None:
+        return
+    margin = 0.1 * (hi - lo)
+    ax.set_xlim(lo[0] - margin[0], hi[0] + margin[0])
+    ax.set_ylim(lo[1] - margin[1], hi[1] + margin[1])
+    
+    # 第二遍：逐类分箱到同一个网格，每类使用各自的数据点颜色
+    shape = axes_pixel_shape(ax)
+    extent = (*ax.get_xlim(), *ax.get_ylim())
+    out = None
+    for i in range(n):
+        out = rasterize_points(data_matrix[i], extent, shape, colors=lightColors[i], skip_zero=True, out=out)
+    density, color_sum = out
+    draw_raster(ax, shade_raster(density, shape, point_alpha, color_sum=color_sum), extent)
+    
+    # 绘制中心点
+    if center_visible:
+        ax.scatter(center_points[:, 0], center_points[:, 1], s=80, marker='o', edgecolor='white', facecolor=darkerColors)
+
+def _group_colors(colormap_param, n):
+    """
+    按 colormap_param 生成 n 个类别的基础颜色（取值规则见 diverging_scatter 的说明）
+    输出：n x 3 的 RGB 数组
+    """
+    if colormap_param is None:
+        # 默认颜色：使用特定颜色或渐变色
+        if n <= 5:
+            hex_colors = ['#37FF00', '#00FFB3', '#FF5100', '#9000FF', '#D2D900']
+            groupColors = colors_to_rgb(hex_colors[:n])  # 取前 n 个颜色
+        else:
+            hex1 = '#00FFB3'
+            hex2 = '#A64568'
+            groupColors = generate_gradient_colors(hex1, hex2, n)
+    elif isinstance(colormap_param, np.ndarray) and colormap_param.shape[1] == 3:
+        # 如果 colormap_param 是 n x 3 数组，直接使用或采样
+        if colormap_param.shape[0] < n:
+            raise ValueError('colormap_param 数组的行数必须至少为 n')
+        indices = np.round(np.linspace(0, colormap_param.shape[0]-1, n)).astype(int)
+        groupColors = colormap_param[indices, :]
+    elif isinstance(colormap_param, list):
+        num_colors = len(colormap_param)
+        if num_colors == 2:
+            # 使用两个颜色生成渐变色
+            hex1 = colormap_param[0]
+            hex2 = colormap_param[1]
+            groupColors = generate_gradient_colors(hex1, hex2, n)
+        elif num_colors == n:
+            # 直接使用 n 个颜色
+            groupColors = colors_to_rgb(colormap_param)
+        else:
+            raise ValueError('colormap_param 列表必须包含 2 个或 n 个元素')
+    else:
+        raise ValueError('colormap_param 必须是 None、列表或 n x 3 数组')
+    return groupColors
+
+def generate_gradient_colors(hex1, hex2, n):
+    """
+    生成从 hex1 到 hex2 的渐变色列表
+    输入：hex1 和 hex2 为颜色字符串，n 为颜色数量
+    输出：n x 3 的 RGB 数组
+    """
+    if n == 1:
+        # 只有一个颜色时取两者的中间色
+        return gradient_colors((hex1, hex2), 3)[1:2]
+    return gradient_colors((hex1, hex2), n)
+
+# 测试代码
+if __name__ == '__main__':
+    # 示例测试
+    import matplotlib.pyplot as plt
+    center_points = np.array([[1, 2], [3, 4]])  # 2个中心点
+    data_matrix = np.array([[[5, 6], [7, 8]], [[9, 10], [11, 12]]])  # 2类，每类2个点
+    colormap_param = ['#ff6e7f', '#bfe9ff']  # 2颜色渐变
+    center_visible = True
+    fig = diverging_scatter(center_points, data_matrix, colormap_param, center_visible)
+    plt.show()
+
+    # 扁平的 (类标签, 坐标) 输入：类大小相差悬殊，中心取 medoid
+    rng = np.random.default_rng(0)
+    sizes = np.r_[2000, rng.integers(5, 15, 30)]
+    labels = np.repeat(np.arange(len(sizes)), sizes)
+    xy = rng.standard_normal((len(labels), 2)) + rng.random((len(sizes), 2))[labels] * 20
+    fig = diverging_scatter_from_labels(labels, xy, colormap_param, center='medoid')
+    plt.show()
@@ -0,0 +1,209 @@
+import io
+import threading
+from contextlib import contextmanager
+
+# 当前线程正在使用的图窗池（见 FigurePool.activate）
+_local = threading.local()
+
+
+def new_figure(figsize, dpi=None, facecolor='white', window_title=None, projection=None, position=None):
+    """
+    创建图表使用的图窗与坐标轴（各图表函数的统一入口）
+    当前线程激活了 FigurePool 时从池中取出复用的图窗（面向对象的 Figure + FigureCanvasAgg，
+    不进入 pyplot 的图窗注册表）；否则与以前一样通过 pyplot 创建，可以用 plt.show() 显示。
+
+    输入参数：
+        figsize: 图窗尺寸（英寸），如 (8, 6)
+        dpi: 可选，分辨率，默认使用 rcParams['figure.dpi']
+        facecolor: 可选，图窗与坐标轴背景色，默认白色
+        window_title: 可选，窗口标题；没有窗口管理器（如无界面画布）时忽略
+        projection: 可选，坐标轴投影，如 '3d'
+        position: 可选，坐标轴位置 [left, bottom, width, height]（图窗坐标），默认为 add_subplot(111) 的位置；
+                  需要自定义布局的图表应通过此参数指定，而不是取得坐标轴后再 set_position，
+                  池会按位置区分图窗模板
+
+    输出：
+        (fig, ax)
+    """
+    pool = current_pool()
+    if pool is not None:
+        fig, ax = pool.acquire(figsize, dpi=dpi, facecolor=facecolor, projection=projection, position=position)
+        return fig, ax
+
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=figsize, dpi=dpi, facecolor=facecolor)
+    if position is None:
+        ax = fig.add_subplot(111, projection=projection)
+    else:
+        ax = fig.add_axes(position, projection=projection)
+    ax.set_facecolor(facecolor)
+    if window_title is not None and getattr(fig.canvas, 'manager', None) is not None:
+        fig.canvas.manager.set_window_title(window_title)
+    return fig, ax
+
+
+def current_pool():
+    """
+    返回当前线程激活的 FigurePool，没有时返回 None
+    """
+    return getattr(_local, 'pool', None)
+
+
+class FigurePool:
+    """
+    可复用的无界面图窗池
+    按 (尺寸, dpi, 背景色, 投影, 坐标轴位置) 缓存图窗模板，归还时清空坐标轴上的内容并放回池中，
+    下一次同规格的图表直接在原图窗上重新绘制，避免反复创建 Figure / Axes。
+    图窗使用 Figure + FigureCanvasAgg 创建，不经过 pyplot，因此不会在 pyplot 的图窗注册表中累积，
+    长时间运行的渲染进程内存保持平稳。
+
+    输入参数：
+        max_idle: 可选，每种规格最多保留的空闲图窗数，默认 2
+
+    示例：
+        pool = FigurePool()
+        png = pool.render(bubble_plot, points, v, format='png')   # 渲染后自动归还图窗
+
+        with pool.session():                                       # 或在代码块中使用，结束时自动归还
+            fig = filled_2D_line(data_matrix)
+            fig.savefig('out.png')
+    """
+
+    def __init__(self, max_idle=2):
+        self.max_idle = int(max_idle)
+        self._idle = {}
+        self._keys = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    @contextmanager
+    def activate(self):
+        """
+        在代码块内让图表函数从本池取得图窗（仅对当前线程生效，可嵌套）
+        """
+        previous = current_pool()
+        _local.pool = self
+        try:
+            yield self
+        finally:
+            _local.pool = previous
+
+    @contextmanager
+    def session(self):
+        """
+        激活本池，并在代码块结束时（包括出现异常时）归还块内取出的所有图窗
+        """
+        previous_pending = getattr(_local, 'pending', None)
+        _local.pending = []
+        try:
+            with self.activate():
+                yield self
+        finally:
+            for fig in _local.pending:
+                self.release(fig)
+            _local.pending = previous_pending
+
+    def acquire(self, figsize, dpi=None, facecolor='white', projection=None, position=None):
+        """
+        取出一个指定规格的空白图窗，池中没有时新建
+        输出：(fig, ax)
+        """
+        if dpi is None:
+            import matplotlib
+            dpi = matplotlib.rcParams['figure.dpi']
+        if position is not None:
+            position = tuple(float(p) for p in position)
+        key = (tuple(float(s) for s in figsize), float(dpi), str(facecolor), projection, position)
+        with self._lock:
+            idle = self._idle.get(key)
+            fig = idle.pop() if idle else None
+        if fig is None:
+            fig = self._create(key)
+            self.created += 1
+        else:
+            self.reused += 1
+        with self._lock:
+            self._keys[id(fig)] = key
+        pending = getattr(_local, 'pending', None)
+        if pending is not None:
+            pending.append(fig)
+        return fig, fig.axes[0]
+
+    def release(self, fig):
+        """
+        归还图窗：清空坐标轴内容并放回池中；不是本池创建的图窗或池已满时直接丢弃
+        """
+        with self._lock:
+            key = self._keys.pop(id(fig), None)
+        if key is None:
+            return
+        facecolor, position = key[2], key[4]
+        # 图表可能额外添加了坐标轴（如颜色条）、图级图例或文字，一并移除
+        for ax in fig.axes[1:]:
+            fig.delaxes(ax)
+        fig.legends.clear()
+        fig.texts.clear()
+        ax = fig.axes[0]
+        ax.clear()
+        # clear() 不会重置纵横比等布局设置（如 bubble_plot 的 set_aspect('equal')），手动恢复默认值
+        ax.set_aspect('auto')
+        ax.set_adjustable('box')
+        ax.set_anchor('C')
+        # 图表可能移动过坐标轴，恢复为模板的位置，否则会带到下一张同规格的图表
+        if position is None:
+            position = ax.get_subplotspec().get_position(fig)
+        ax.set_position(position)
+        ax.set_axis_on()
+        ax.set_facecolor(facecolor)
+        fig.set_facecolor(facecolor)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(fig)
+
+    def render(self, func, *args, format='png', dpi=None, savefig_kwargs=None, **kwargs):
+        """
+        在池中调用图表函数并保存为图片字节，无论成功与否都会归还用到的图窗
+
+        输入参数：
+            func: 图表函数，如 bubble_plot
+            *args, **kwargs: 传给图表函数的参数
+            format: 输出格式，如 'png'、'svg'、'pdf'
+            dpi: 可选，保存图片时使用的 dpi
+            savefig_kwargs: 可选，其他传给 Figure.savefig 的参数
+
+        输出：
+            图片字节
+        """
+        save_kwargs = dict(savefig_kwargs or {})
+        if dpi is not None:
+            save_kwargs['dpi'] = dpi
+        with self.session():
+            fig = func(*args, **kwargs)
+            buf = io.BytesIO()
+            fig.savefig(buf, format=format, **save_kwargs)
+            return buf.getvalue()
+
+    def clear(self):
+        """
+        丢弃所有空闲图窗
+        """
+        with self._lock:
+            self._idle.clear()
+
+    @staticmethod
+    def _create(key):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figsize, dpi, facecolor, projection, position = key
+        fig = Figure(figsize=figsize, dpi=dpi, facecolor=facecolor)
+        FigureCanvasAgg(fig)
+        if position is None:
+            ax = fig.add_subplot(111, projection=projection)
+        else:
+            ax = fig.add_axes(position, projection=projection)
+        ax.set_facecolor(facecolor)
+        return fig
@@ -0,0 +1,269 @@
+import numpy as np
+
+# create_hex_colormap 已移至 colors.py，这里保留导入以兼容旧的调用方式
+from .colors import colors_to_rgb, create_hex_colormap, hsv_to_rgb, map_colors
+from .figure_pool import new_figure
+from .font_cache import get_chinese_font
+from .profiling import start_call
+from .data_source import chunked_min_max
+from .decimate import axes_pixel_width, decimate_line
+from .ragged import as_ragged, ragged_from_padded
+
+def filled_2D_line(data_matrix, colormap_param=None, downsample=None):
+    """
+    绘制带颜色映射和填充的线图
+    该函数绘制 n 条线，每条线有若干个点，并根据颜色参数设置线条颜色和填充区域。
+
+    输入参数：
+        data_matrix: 折线数据，可以是：
+                     - n x m x 2 数组，表示 n 条线，每条线有 m 个二维点 [x, y]，
+                       较短的线在末尾用 [0, 0] 补齐（只有末尾的 [0, 0] 视为补齐，线中间 x = 0 或
+                       y = 0 的点照常绘制并参与坐标范围）
+                     - RaggedLines(coords, offsets)：不等长折线的紧凑表示，见 ragged.py
+                     补零数组也可以是 np.memmap 或 .npy / .npz 等数据文件路径（见 data_source.py）
+        colormap_param: 可选，颜色参数，可以是：
+                        - None 或缺失：使用从红到紫的色环过渡色，映射到 x 轴
+                        - 2元素列表：生成从第一个颜色到第二个颜色的渐变色，并映射到 x 轴
+                        - n元素列表：每个元素是颜色字符串（如 '#ff0000'），按索引直接使用
+                        - n x 3 数组：直接作为颜色映射，每行是一个 RGB 颜色
+        downsample: 可选，长折线的降采样方式，可以是：
+                    - None 或 False：不降采样（默认）
+                    - 'minmax' 或 True：每个像素列保留最小/最大值
+                    - 'lttb'：最大三角形三桶算法
+                    点数预算由图窗宽度、dpi 与每条线在 x 轴上所占的比例决定，
+                    线条与填充区域都使用降采样后的点。
+
+    输出：
+        fig: matplotlib 图窗对象
+
+    示例：
+        data = np.random.rand(3, 10, 2)  # 3条线，每条10个点
+        colormap_param = ['#ff6e7f', '#bfe9ff']
+        fig = filled_2D_line(data, colormap_param)
+    """
+    timer = start_call('filled_2D_line')
+    from matplotlib.patches import Polygon
+    timer.mark('import')
+
+    # 参数检查
+    if data_matrix is None:
+        raise ValueError('必须提供 data_matrix 参数')
+    
+    # 统一转换为不等长折线表示：coords 为所有有效点，第 i 条线为 coords[offsets[i]:offsets[i+1]]
+    lines = as_ragged(data_matrix)
+    coords = lines.coords
+    offsets = lines.offsets
+    n = len(offsets) - 1  # 线的数量
+    lengths = np.diff(offsets)  # 每条线的点数
+    
+    # 所有有效点的坐标范围（分块计算），x 范围同时用于颜色映射
+    if len(coords) == 0:
+        x_min = 0
+        x_max = 1
+    else:
+        (x_min, y_min), (x_max, y_max) = chunked_min_max(coords)
+    timer.mark('input')
+    
+    # 处理颜色参数 colormap_param
+    line_colors = _line_colors(coords, offsets, colormap_param, x_min, x_max)
+    timer.mark('colors')
+    
+    # 创建图窗
+    fig, ax = _create_figure(timer)
+    
+    # 设置填充透明度
+    fill_alpha = 0.3
+    
+    # 降采样：按每条线在 x 轴上占用的像素宽度分配点数预算
+    if downsample is True:
+        downsample = 'minmax'
+    if downsample:
+        axes_pixels = axes_pixel_width(ax)
+        x_span_axis = 1.2 * (x_max - x_min)  # 与下方设置的 x 轴范围（左右各留 10%）一致
+    
+    # 遍历每条线
+    for i in range(n):
+        if lengths[i] == 0:
+            continue  # 跳过没有有效点的线
+        
+        # 当前线的坐标（coords 的切片视图，不复制）
+        x_valid = coords[offsets[i]:offsets[i + 1], 0]
+        y_valid = coords[offsets[i]:offsets[i + 1], 1]
+        
+        if downsample:
+            if x_span_axis > 0:
+                line_span = np.max(x_valid) - np.min(x_valid)
+                n_pixels = int(np.ceil(axes_pixels * line_span / x_span_axis))
+            else:
+                n_pixels = axes_pixels
+            x_valid, y_valid = decimate_line(x_valid, y_valid, max(n_pixels, 1), method=downsample)
+        
+        color = line_colors[i, :]  # 当前线的颜色
+        
+        # 生成较浅的颜色用于填充
+        lighter_color = _lighter_color(color)
+        
+        # 绘制线条
+        ax.plot(x_valid, y_valid, color=color, linewidth=2)
+        
+        # 填充区域：从曲线到x轴
+        # 创建填充的多边形：x_valid 和 y_valid 为上线，x_valid 和 zeros 为下线
+        x_fill = np.concatenate([x_valid, x_valid[::-1]])  # [x_valid, reverse(x_valid)]
+        y_fill = np.concatenate([y_valid, np.zeros_like(x_valid)])  # [y_valid, zeros]
+        poly = Polygon(np.column_stack((x_fill, y_fill)), facecolor=lighter_color, edgecolor='none', alpha=fill_alpha)
+        # 轴范围在最后统一设置，用 add_artist 跳过 add_patch 逐顶点更新数据范围的开销
+        ax.add_artist(poly)
+    timer.mark('artists')
+    
+    # 调整轴范围以适应数据
+    if len(coords) == 0:
+        y_min = 0
+        y_max = 1
+    
+    xlim, ylim = _axis_limits(x_min, x_max, y_min, y_max)
+    ax.set_xlim(*xlim)
+    ax.set_ylim(*ylim)
+    timer.mark('limits')
+    
+    timer.finish(fig)
+    return fig
+
+def _line_colors(coords, offsets, colormap_param, x_min, x_max):
+    """
+    根据颜色参数计算每条线的 RGB 颜色
+
+    输入参数：
+        coords, offsets: 不等长折线表示（见 RaggedLines）
+        colormap_param: 颜色参数，取值同 filled_2D_line
+        x_min, x_max: 用于颜色映射的 x 范围
+
+    输出：
+        line_colors: n x 3 数组；没有点的线为灰色
+    """
+    n = len(offsets) - 1
+    lengths = np.diff(offsets)
+    has_points = lengths > 0
+    # 每条非空线起点的 x 坐标
+    x_start = coords[offsets[:-1][has_points], 0]
+    
+    if colormap_param is None:
+        # 默认情况：使用从红到紫的色环过渡色，映射到 x 轴
+        line_colors = np.full((n, 3), 0.5)  # 没有点的线为默认灰色
+        if x_max == x_min:
+            norm_x = np.full(len(x_start), 0.5)
+        else:
+            norm_x = np.clip((x_start - x_min) / (x_max - x_min), 0, 1)  # 限制在 [0,1] 范围内
+        # 使用HSV颜色空间创建从红到紫的色环过渡
+        # 红色: H=0, 紫色: H≈0.83 (300°/360°)
+        line_colors[has_points] = hsv_to_rgb(norm_x * 0.83, 1, 1)
+    elif isinstance(colormap_param, list) and len(colormap_param) == 2:
+        # 两个颜色元素：生成渐变色并映射到 x 轴（256 级查找表）
+        line_colors = np.full((n, 3), 0.5)
+        line_colors[has_points] = map_colors(x_start, colormap_param, x_min, x_max)[:, :3]
+    elif isinstance(colormap_param, list) and len(colormap_param) == n:
+        # n 个颜色元素：直接使用提供的颜色
+        line_colors = colors_to_rgb(colormap_param)
+    elif isinstance(colormap_param, np.ndarray) and colormap_param.shape[1] == 3 and colormap_param.shape[0] >= n:
+        # n x 3 数组：直接使用前 n 行作为颜色
+        line_colors = colormap_param[:n, :]
+    else:
+        raise ValueError('无效的 colormap_param 参数')
+    
+    return line_colors
+
+def _axis_limits(x_min, x_max, y_min, y_max):
+    """
+    由数据范围计算轴范围：x 轴左右各留 10%，y 轴上方留 10%
+    输出：(xlim, ylim) 两个二元组
+    """
+    x_range = x_max - x_min
+    y_range = y_max - y_min
+    return (x_min - 0.1 * x_range, x_max + 0.1 * x_range), (y_min, y_max + 0.1 * y_range)
+
+def _lighter_color(color):
+    """
+    生成较浅的颜色用于填充
+    """
+    return np.clip(np.asarray(color) + np.array([0.3, 0.3, 0.3]), 0, 1)  # 确保颜色值不超过 1
+
+def _create_figure(timer=None):
+    """
+    创建线图的图窗与坐标轴，并设置中文轴标签和标题
+    timer: 可选，start_call 返回的计时对象，分别记录 figure 与 font 两个阶段
+    """
+    # 激活 FigurePool 时复用池中的无界面图窗
+    fig, ax = new_figure((8, 6), dpi=200, window_title='线图带填充')
+    if timer is not None:
+        timer.mark('figure')
+    
+    # 设置轴标签和标题（使用中文）
+    chinese_font = get_chinese_font()
+    ax.set_xlabel('X 坐标', fontproperties=chinese_font)
+    ax.set_ylabel('Y 坐标', fontproperties=chinese_font)
+    ax.set_title('带颜色映射和填充的线图', fontproperties=chinese_font)
+    if timer is not None:
+        timer.mark('font')
+    return fig, ax
+
+if __name__ == '__main__':
+    # 测试 filled_2D_line 函数，基于 test_fill_2D_line.m 的内容
+    import matplotlib.pyplot as plt
+    chinese_font = get_chinese_font()
+    np.random.seed(44)  # 设置随机种子以确保结果可重现
+    
+    # 参数设置
+    n = 10  # 线段数量
+    min_points = 500  # 每条线段最少点数
+    max_points = 1000  # 每条线段最多点数
+    x_min_global = 0  # x坐标全局最小值
+    x_max_global = 200  # x坐标全局最大值
+    
+    # 生成测试数据 - 正态分布样式且起始点都在x轴
+    data_matrix = np.zeros((n, max_points, 2))  # 预分配空间
+    
+    for i in range(n):
+        # 随机确定当前线段的点数
+        m = np.random.randint(min_points, max_points + 1)
+        
+        # 随机生成起始点和结束点，确保在0~200之间且起始点都在x轴
+        x_start = np.random.rand() * (x_max_global - 50)  # 起始点随机，留有余地确保结束点<=200
+        x_end = x_start + np.random.rand() * (x_max_global - x_start)
+        x_end = min(x_end, x_max_global)  # 确保结束点不超过200
+        
+        # 生成x坐标 - 在起始点和结束点之间均匀分布
+        x = np.linspace(x_start, x_end, m)
+        
+        # 生成y坐标 - 使用正态分布样式，确保起始点和结束点都在x轴(y=0)
+        x_mid = (x_start + x_end) / 2
+        sigma = (x_end - x_start) / 6  # 计算标准差，控制曲线的宽度
+        y = np.random.rand() * 20 * np.exp(-(x - x_mid)**2 / (2 * sigma**2))  # 振幅最大为20
+        
+        # 将数据存入矩阵
+        data_matrix[i, :m, 0] = x
+        data_matrix[i, :m, 1] = y
+        
+        # 剩余部分填充0（函数会跳过0值点）
+        if m < max_points:
+            data_matrix[i, m:, :] = 0
+    
+    # 测试1：使用默认颜色（从红到紫的色环过渡）
+    print('测试1：使用默认颜色（从红到紫的色环过渡）')
+    fig1 = filled_2D_line(data_matrix, None)
+    plt.title('测试1：使用默认颜色（从红到紫的色环过渡）', fontproperties=chinese_font)
+    plt.show()
+    
+    # 测试2：使用两个颜色的渐变映射到x轴
+    print('测试2：使用两个颜色的渐变映射到x轴')
+    colormap_param2 = ['#ff6e7f', '#bfe9ff']  # 粉红色到淡蓝色的渐变
+    fig2 = filled_2D_line(data_matrix, colormap_param2)
+    plt.title('测试2：使用两个颜色的渐变映射到x轴', fontproperties=chinese_font)
+    plt.show()
+    
+    # 测试3：直接传入不等长折线（RaggedLines），无需补零
+    print('测试3：直接传入不等长折线（RaggedLines）')
+    lines = ragged_from_padded(data_matrix)
+    fig3 = filled_2D_line(lines, colormap_param2)
+    plt.title('测试3：直接传入不等长折线（RaggedLines）', fontproperties=chinese_font)
+    plt.show()
+    
+    print('所有测试完成！')
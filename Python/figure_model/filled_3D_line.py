@@ -0,0 +1,470 @@
+import weakref
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from .colors import gradient_colors
+from .data_source import as_array, chunked_min_max
+from .decimate import axes_pixel_width, bin_reduce, time_bins
+from .figure_pool import new_figure
+from .font_cache import get_chinese_font
+from .profiling import start_call
+
+# static_view 模式下每个坐标轴的几何：三维顶点（只生成一次）、承载投影结果的二维集合与供图例定位的轮廓线
+# （集合以弱引用保存，避免通过 collection.axes 反向引用坐标轴，使弱键字典的条目无法释放）
+_StaticView = namedtuple('_StaticView', 'outline centers fill_colors edges splits poly_ref edge_ref outline_ref')
+# 坐标轴 -> _StaticView，供 set_view 改变视角后重新投影
+_static_views = weakref.WeakKeyDictionary()
+# 边线与填充的绘制层级（关闭 computed_zorder 后显式指定）：与原先逐条 ax.plot 的 Line3D（zorder 2）
+# 以及排在坐标轴之上的填充集合相同，边线绘制在半透明填充之下
+_EDGE_ZORDER = 2
+_FILL_ZORDER = 2.5
+
+def filled_3D_line(data, timeVector, fill_colors=None, categories=None, static_view=False, elev=30, azim=-40,
+                   resample=None, agg='mean', band=False):
+    """
+    绘制三维填充折线图，每组数据位于不同的yOz平面
+
+    输入参数:
+        data: 数值矩阵，形状为 (n_time, n_cat)，每列代表一个类别的数据序列（行数代表时间点）；
+              也可以是 np.memmap 或 .npy / .csv 等数据文件路径（见 data_source.py）
+        timeVector: 时间向量，可以是datetime对象列表、datetime64 数组（向量化转换，适合长序列）或数值向量
+        fill_colors: 可选，颜色参数，可以是：
+                     - None: 使用默认颜色（从 '#D9FF88' 到 '#FFFFFF' 的渐变色）
+                     - 列表包含两个十六进制颜色字符串（如 ['#D9FF88', '#FFFFFF']）：生成渐变色
+                     - n_cat x 3 数组：直接作为颜色映射，每行是一个 RGB 颜色（值在0-1范围内）
+        categories: 可选，类别名称的列表，长度应为 n_cat
+        static_view: 可选，默认为 False。为 True 时按 (elev, azim) 视角一次性把所有几何投影到二维，
+                     用普通的 PolyCollection / LineCollection 绘制（三维坐标轴、面板与刻度保留），
+                     绘制开销远小于 Poly3DCollection 每次绘制时的重新投影与逐面片排序；
+                     适用于固定视角的批量导出，交互旋转时填充与边线不会随之更新
+        elev, azim: 可选，视角（仰角与方位角，单位为度），默认为 30 与 -40，对应 Matlab 的 view(-40, 30)
+        resample: 可选，构建多边形前先按时间轴分箱聚合（时间向量须单调不减，否则先排序），默认 None 不重采样：
+                  - 'day' / 'week' / 'month': 按日历日 / 周（周一开始）/ 月分箱，要求时间向量为日期时间
+                  - 整数: 把时间范围等分为该数量的箱
+                  - 'auto': 以坐标轴的像素宽度作为箱数，时间点数不超过该宽度时不重采样
+        agg: 可选，每个箱内的聚合方式：'mean'（默认）、'sum'、'min' 或 'max'
+        band: 可选，默认为 False。为 True 时填充区域为每个箱内的最小 / 最大值包络，数据线为 agg 聚合值；
+              需要与 resample 一起使用
+
+    输出:
+        fig: matplotlib 图窗对象
+
+    示例:
+        n_time = 10
+        n_cat = 3
+        data = np.random.rand(n_time, n_cat) * 100
+        timeVector = [datetime(2023, 1, 1) + timedelta(days=i) for i in range(n_time)]
+        fill_colors = ['#D9FF88', '#FFFFFF']
+        categories = ['Category A', 'Category B', 'Category C']
+        fig = filled_3D_line(data, timeVector, fill_colors, categories)
+        fig = filled_3D_line(data, timeVector, fill_colors, categories, static_view=True)  # 固定视角批量导出
+        fig = filled_3D_line(minute_data, minute_times, resample='day', band=True)       # 分钟级长序列按日聚合
+    """
+    timer = start_call('filled_3D_line')
+    # 三维工具包与日期处理只在绘制三维图时才导入
+    from datetime import datetime
+    import matplotlib.dates as mdates
+    from mpl_toolkits.mplot3d import Axes3D  # 注册 '3d' 投影
+    from matplotlib.lines import Line2D
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+    timer.mark('import')
+
+    # 参数检查
+    if data is None:
+        raise ValueError('必须提供 data 参数')
+    data = as_array(data, 'data')
+    if data.ndim != 2:
+        raise ValueError('data 必须是 n_time x n_cat 矩阵')
+    n_time, n_cat = data.shape
+
+    if timeVector is None or len(timeVector) != n_time:
+        raise ValueError('时间向量长度必须与数据的时间点数一致')
+    if band and resample is None:
+        raise ValueError('band 需要与 resample 一起使用')
+
+    if categories is None:
+        categories = [f'Category {i+1}' for i in range(n_cat)]
+    elif len(categories) != n_cat:
+        raise ValueError('categories 长度必须与 data 的列数一致')
+    timer.mark('input')
+
+    # 处理 fill_colors 参数
+    if fill_colors is None:
+        # 使用默认颜色
+        hex1 = '#D9FF88'
+        hex2 = '#FFFFFF'
+        fill_colors = generate_color_map(hex1, hex2, n_cat)
+    elif isinstance(fill_colors, list) and len(fill_colors) == 2:
+        # 如果 fill_colors 是列表且有两个元素，假设是十六进制颜色
+        hex1 = fill_colors[0]
+        hex2 = fill_colors[1]
+        fill_colors = generate_color_map(hex1, hex2, n_cat)
+    else:
+        # 检查 fill_colors 是否为数组
+        fill_colors = np.array(fill_colors)
+        if fill_colors.ndim == 2:
+            if fill_colors.shape == (n_cat, 3):
+                # 尺寸正确，n_cat x 3
+                pass
+            elif fill_colors.shape == (3, n_cat):
+                fill_colors = fill_colors.T  # 转置为 n_cat x 3
+            else:
+                raise ValueError('fill_colors 矩阵必须是 n_cat x 3 或 3 x n_cat 的尺寸')
+        else:
+            raise ValueError('无效的 fill_colors 参数')
+        # 归一化颜色值到 [0,1] 范围（如果值大于1）
+        if np.max(fill_colors) > 1:
+            fill_colors = fill_colors / 255.0
+    timer.mark('colors')
+
+    # 将时间向量转换为数值（对于datetime对象；datetime64 数组整体向量化转换）
+    is_datetime = (isinstance(timeVector, np.ndarray) and timeVector.dtype.kind == 'M') or \
+        (n_time > 0 and isinstance(timeVector[0], datetime))
+    if is_datetime:
+        timeVector_num = mdates.date2num(timeVector)
+    else:
+        timeVector_num = np.array(timeVector)
+
+    # 创建三维图形
+    # 激活 FigurePool 时复用池中的无界面图窗
+    fig, ax = new_figure((12, 6), dpi=100, window_title='三维填充折线图', projection='3d')
+    timer.mark('figure')
+
+    # 设置中文字体
+    chinese_font = get_chinese_font()
+    ax.set_xlabel('类别', fontproperties=chinese_font)
+    ax.set_ylabel('时间', fontproperties=chinese_font)
+    ax.set_zlabel('销售额', fontproperties=chinese_font)
+    timer.mark('font')
+
+    # 设置x轴位置（每组数据在x轴上的位置）
+    x_positions = np.arange(1, n_cat + 1)
+    timeVector_num = np.asarray(timeVector_num, dtype=float)
+
+    # 时间轴重采样：每个类别的序列按箱分段聚合后再构建多边形
+    z_top, z_bottom, z_line = data, None, None
+    if resample is not None:
+        n_bins = axes_pixel_width(ax) if resample == 'auto' else resample
+        if resample != 'auto' or n_time > n_bins:
+            if np.any(np.diff(timeVector_num) < 0):
+                order = np.argsort(timeVector_num, kind='stable')
+                timeVector_num, data = timeVector_num[order], data[order]
+            starts = time_bins(timeVector_num, n_bins, calendar=is_datetime)
+            z_top = bin_reduce(data, starts, agg)
+            if band:
+                z_bottom, z_line = bin_reduce(data, starts, 'min'), z_top
+                z_top = bin_reduce(data, starts, 'max')
+            timeVector_num = bin_reduce(timeVector_num, starts, 'mean')
+    if z_bottom is None:
+        z_bottom = np.zeros_like(z_top, dtype=float)
+    timer.mark('resample')
+
+    # 设置x轴刻度和标签
+    ax.set_xticks(x_positions)
+    ax.set_xticklabels(categories, fontproperties=chinese_font)
+
+    # 设置y轴为时间格式
+    if is_datetime:
+        # 使用日期格式化器
+        ax.yaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        
+        # 自动选择合适的时间间隔（日期数值的单位为天）
+        time_range = np.floor(np.max(timeVector_num) - np.min(timeVector_num)) if len(timeVector_num) else 0
+
+        if time_range < 60:
+            # 小于60天，显示日期间隔为每周
+            ax.yaxis.set_major_locator(mdates.WeekdayLocator())
+        elif time_range < 365:
+            # 小于1年，显示月间隔
+            ax.yaxis.set_major_locator(mdates.MonthLocator())
+        elif time_range < 365 * 3:
+            # 1-3年，显示季度间隔
+            ax.yaxis.set_major_locator(mdates.MonthLocator(interval=3))
+        else:
+            # 大于3年，显示年间隔
+            ax.yaxis.set_major_locator(mdates.YearLocator())
+    else:
+        # 数值型时间格式
+        ax.set_ylabel('时间点', fontproperties=chinese_font)
+
+    # 设置坐标轴范围
+    ax.set_xlim(0, n_cat + 1)
+    ax.set_ylim(np.min(timeVector_num), np.max(timeVector_num))
+    ax.set_zlim(0, np.max(chunked_min_max(z_top)[1]) * 1.1)  # z轴从0开始，稍微扩展上限
+
+    # 设置视角
+    ax.view_init(elev=elev, azim=azim)  # 默认对应Matlab的view(-40, 30)
+    timer.mark('limits')
+
+    # 池中复用的坐标轴可能登记过上一张图的几何
+    _static_views.pop(ax, None)
+    # 集合之间的绘制顺序由 zorder 显式决定，不使用 mplot3d 按集合深度计算的 zorder
+    ax.computed_zorder = False
+    if static_view:
+        # 坐标轴范围与视角确定后，投影矩阵即固定，几何只需投影一次
+        _add_static_artists(ax, x_positions, timeVector_num, z_top, z_bottom, fill_colors, z_line)
+    else:
+        # 所有类别的四边形面片一次性生成：(n_cat * (n_time - 1)) x 4 x 3 的顶点数组，
+        # 放在一个 Poly3DCollection 中，由它在绘制时按面片深度排序
+        quads = _quad_strips(x_positions, timeVector_num, z_top, z_bottom)
+        poly_collection = Poly3DCollection(quads, alpha=0.7, linewidths=0, zorder=_FILL_ZORDER)
+        # 每个面片的颜色：每个类别的颜色重复 n_time - 1 次
+        poly_collection.set_facecolor(np.repeat(fill_colors, max(len(timeVector_num) - 1, 0), axis=0))
+        ax.add_collection3d(poly_collection)
+
+        # 数据线、底面虚线与前后侧边线合并为一个 Line3DCollection，绘制在填充之下
+        segments, line_colors, line_widths, line_styles = _edge_lines(x_positions, timeVector_num, z_top, z_bottom,
+                                                                      fill_colors, z_line)
+        edge_collection = Line3DCollection(segments, colors=line_colors, linewidths=line_widths,
+                                           linestyles=line_styles, zorder=_EDGE_ZORDER)
+        ax.add_collection3d(edge_collection)
+    timer.mark('artists')
+
+    # 图例使用与数据线样式一致的代理线条
+    legend_handles = [Line2D([], [], color=fill_colors[i] * 0.7, linewidth=1.5, label=categories[i]) for i in range(n_cat)]
+    ax.legend(handles=legend_handles, prop=chinese_font)
+    timer.mark('legend')
+
+    timer.finish(fig)
+    return fig
+
+def _quad_strips(x_positions, t, z_top, z_bottom):
+    """
+    向量化生成所有类别的填充四边形
+    第 i 个类别位于 x = x_positions[i] 的 yOz 平面上，第 j 个四边形的顶点依次为
+    top[j]、top[j+1]、bottom[j+1]、bottom[j]。
+
+    输入参数：
+        x_positions: 长度为 n_cat 的数组
+        t: 长度为 n_time 的数值时间向量
+        z_top, z_bottom: n_time x n_cat 数组，填充区域的上、下边界
+
+    输出：
+        (n_cat * (n_time - 1)) x 4 x 3 的顶点数组，按类别依次排列
+    """
+    n_time, n_cat = z_top.shape
+    n_quads = max(n_time - 1, 0)
+    zt = np.asarray(z_top, dtype=float).T
+    zb = np.asarray(z_bottom, dtype=float).T
+    verts = np.empty((n_cat, n_quads, 4, 3))
+    verts[..., 0] = np.asarray(x_positions, dtype=float)[:, None, None]
+    verts[:, :, 0, 1] = t[:-1]
+    verts[:, :, 1, 1] = t[1:]
+    verts[:, :, 2, 1] = t[1:]
+    verts[:, :, 3, 1] = t[:-1]
+    verts[:, :, 0, 2] = zt[:, :-1]
+    verts[:, :, 1, 2] = zt[:, 1:]
+    verts[:, :, 2, 2] = zb[:, 1:]
+    verts[:, :, 3, 2] = zb[:, :-1]
+    return verts.reshape(n_cat * n_quads, 4, 3)
+
+def _edge_lines(x_positions, t, z_top, z_bottom, fill_colors, z_line=None):
+    """
+    生成所有类别的边线：数据线（默认为顶部，z_line 给出时为 z_line）、底部虚线、前后两条侧边线
+
+    输出：
+        segments: 线段列表（每个元素是 k x 3 数组），按类别依次排列，
+                  每个类别依次为数据线、底部线、前后两条侧边线（与原先逐条 ax.plot 的绘制顺序相同）
+        colors, linewidths, linestyles: 与 segments 一一对应的样式
+    """
+    n_time, n_cat = z_top.shape
+    x = np.broadcast_to(np.asarray(x_positions, dtype=float)[:, None], (n_cat, n_time))
+    tt = np.broadcast_to(t, (n_cat, n_time))
+    top = np.stack((x, tt, np.asarray(z_top, dtype=float).T), axis=-1)
+    bottom = np.stack((x, tt, np.asarray(z_bottom, dtype=float).T), axis=-1)
+    line = top if z_line is None else np.stack((x, tt, np.asarray(z_line, dtype=float).T), axis=-1)
+    # 侧边线：每个类别在首、尾时间点从底部连到顶部
+    sides = np.stack((bottom[:, [0, -1], :], top[:, [0, -1], :]), axis=2).reshape(2 * n_cat, 2, 3)
+
+    segments = [seg for i in range(n_cat) for seg in (line[i], bottom[i], sides[2 * i], sides[2 * i + 1])]
+    colors = np.stack((np.asarray(fill_colors, dtype=float) * 0.7,
+                       np.tile([0.5, 0.5, 0.5], (n_cat, 1)),
+                       np.tile([0.7, 0.7, 0.7], (n_cat, 1)),
+                       np.tile([0.7, 0.7, 0.7], (n_cat, 1))), axis=1).reshape(4 * n_cat, 3)
+    linewidths = [1.5, 0.5, 0.5, 0.5] * n_cat
+    linestyles = ['-', '--', '-', '-'] * n_cat
+    return segments, colors, linewidths, linestyles
+
+def set_view(fig, elev, azim):
+    """
+    修改 filled_3D_line 图窗的视角，不重新构建图形
+    static_view 模式的图窗会按新视角把缓存的三维顶点重新投影到原有的二维集合上；
+    普通三维模式的图窗由 mplot3d 在下一次绘制时重新投影。
+
+    输入参数：
+        fig: filled_3D_line 返回的图窗
+        elev, azim: 新的仰角与方位角（度）
+
+    示例：
+        fig = filled_3D_line(data, timeVector, static_view=True)
+        for azim in range(0, 360, 30):
+            set_view(fig, 30, azim)
+            fig.savefig(f'view_{azim:03d}.png')
+    """
+    ax = fig.axes[0]
+    ax.view_init(elev=elev, azim=azim)
+    view = _static_views.get(ax)
+    if view is not None:
+        _project_static(ax, view)
+
+def _add_static_artists(ax, x_positions, t, z_top, z_bottom, fill_colors, z_line=None):
+    """
+    构建 static_view 模式的二维集合：三维顶点只生成一次并登记到 _static_views，
+    之后按坐标轴当前的投影矩阵投影（见 _project_static），改变视角时只需重新投影
+
+    输入参数：
+        ax: 已设置坐标轴范围与视角的三维坐标轴
+        x_positions, t, z_top, z_bottom, fill_colors, z_line: 同 _edge_lines
+    """
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.lines import Line2D
+
+    n_time, n_cat = z_top.shape
+    # 填充多边形：n_cat x (2 * n_time) x 3，顶部沿时间正向、底部沿时间反向
+    x = np.broadcast_to(np.asarray(x_positions, dtype=float)[:, None], (n_cat, 2 * n_time))
+    tt = np.concatenate((t, t[::-1]))
+    zz = np.concatenate((np.asarray(z_top, dtype=float).T, np.asarray(z_bottom, dtype=float).T[:, ::-1]), axis=1)
+    outline = np.stack((x, np.broadcast_to(tt, (n_cat, 2 * n_time)), zz), axis=-1)
+    # 各类别平面上的参考点，用于确定平面之间的前后顺序：所有平面取相同的 t 与 z，
+    # 深度只随 x 变化，不受各类别数据高度的影响
+    centers = np.column_stack((x_positions,
+                               np.full(n_cat, (t.min() + t.max()) / 2 if n_time else 0.0),
+                               np.zeros(n_cat))).astype(float)
+
+    # 边线：所有线段拼接为一个顶点数组，投影后按原长度切分
+    segments, line_colors, line_widths, line_styles = _edge_lines(x_positions, t, z_top, z_bottom, fill_colors, z_line)
+    edges = np.concatenate(segments) if segments else np.empty((0, 3))
+    splits = np.cumsum([len(seg) for seg in segments])[:-1]
+
+    # 与三维模式相同的显式层级：边线先绘制，半透明填充盖在其上
+    poly_collection = PolyCollection([], alpha=0.7, linewidths=0, zorder=_FILL_ZORDER)
+    edge_collection = LineCollection([], colors=line_colors, linewidths=line_widths, linestyles=line_styles,
+                                     zorder=_EDGE_ZORDER)
+    # Axes3D 绘制时（即使关闭 computed_zorder）会对每个直接添加的集合调用 do_3d_projection，
+    # 因此二维集合不直接加入坐标轴，而是由一个普通艺术家对象按 zorder 代为绘制
+    ax.add_artist(_projected_artists_class()(ax, [poly_collection, edge_collection]))
+    # 图例的 loc='best' 只检查坐标轴的直接子对象，用一条不可见的填充轮廓线让图例继续避开填充区域
+    outline_line = Line2D([], [], visible=False)
+    ax.add_artist(outline_line)
+
+    view = _StaticView(outline, centers, np.asarray(fill_colors, dtype=float), edges, splits,
+                       weakref.ref(poly_collection), weakref.ref(edge_collection), weakref.ref(outline_line))
+    _static_views[ax] = view
+    _project_static(ax, view)
+
+@lru_cache(maxsize=None)
+def _projected_artists_class():
+    """
+    返回承载 static_view 模式二维集合的艺术家类（首次调用时才导入 matplotlib）
+    其中的集合使用坐标轴的 transData 并按坐标轴区域裁剪，绘制时按各自的 zorder 依次绘制。
+    """
+    from matplotlib.artist import Artist
+
+    class _ProjectedArtists(Artist):
+        def __init__(self, ax, artists):
+            super().__init__()
+            self._artists = sorted(artists, key=lambda a: a.get_zorder())
+            self.set_zorder(self._artists[0].get_zorder())
+            for artist in self._artists:
+                artist.set_figure(ax.figure)
+                artist.axes = ax
+                artist.set_transform(ax.transData)
+                artist.set_clip_path(ax.patch)
+                # 集合内容更新时（如 set_view 重新投影）通知坐标轴重绘
+                artist.stale_callback = lambda _, stale: setattr(self, 'stale', stale)
+
+        def get_children(self):
+            return list(self._artists)
+
+        def draw(self, renderer):
+            if not self.get_visible():
+                return
+            for artist in self._artists:
+                artist.draw(renderer)
+            self.stale = False
+
+    return _ProjectedArtists
+
+def _project_static(ax, view):
+    """
+    按坐标轴当前的投影矩阵投影 static_view 模式的几何，更新二维集合
+    每个类别的填充区域是 x = x_positions[i] 平面上的一个多边形，同一平面内的面片互不遮挡，
+    因此只需按平面参考点的深度从远到近排列类别（画家算法），不再逐面片排序；
+    边线整体绘制在填充之下，与三维模式（以及逐条 ax.plot 绘制边线的原始实现）的绘制顺序一致。
+    """
+    from mpl_toolkits.mplot3d import proj3d
+
+    poly_collection, edge_collection, outline_line = view.poly_ref(), view.edge_ref(), view.outline_ref()
+    if poly_collection is None or edge_collection is None or outline_line is None:
+        return
+    proj = ax.get_proj()
+
+    def project(xyz):
+        # k x 3 顶点 -> k x 2 投影坐标（即三维坐标轴的 transData 坐标）与深度
+        xs, ys, zs = proj3d.proj_transform(xyz[:, 0], xyz[:, 1], xyz[:, 2], proj)
+        return np.column_stack((xs, ys)), zs
+
+    n_cat, n_vert = view.outline.shape[:2]
+    polygons, _ = project(view.outline.reshape(-1, 3))
+    polygons = polygons.reshape(n_cat, n_vert, 2)
+    # 参考点的深度越大越远，先绘制
+    _, depth = project(view.centers)
+    order = np.argsort(-depth, kind='stable')
+    poly_collection.set_verts(polygons[order])
+    poly_collection.set_facecolor(view.fill_colors[order])
+    # 轮廓线：各多边形首尾闭合，之间以 NaN 断开
+    closed = np.concatenate((polygons, polygons[:, :1], np.full((n_cat, 1, 2), np.nan)), axis=1).reshape(-1, 2)
+    outline_line.set_data(closed[:, 0], closed[:, 1])
+
+    flat, _ = project(view.edges)
+    edge_collection.set_segments(np.split(flat, view.splits))
+
+def generate_color_map(hex1, hex2, n):
+    """
+    生成从 hex1 到 hex2 的渐变色图
+
+    输入:
+        hex1: 起始颜色字符串（如 '#D9FF88'）
+        hex2: 结束颜色字符串（如 '#FFFFFF'）
+        n: 颜色数量
+
+    输出:
+        cmap: n x 3 数组，每行是一个 RGB 颜色
+    """
+    return gradient_colors((hex1, hex2), n)
+
+if __name__ == '__main__':
+    # 测试 filled_3D_line 函数，基于附件 test_filled_3D_line.m
+    from datetime import datetime, timedelta
+    import matplotlib.pyplot as plt
+    chinese_font = get_chinese_font()
+    np.random.seed(42)  # 设置随机种子以确保可重现
+
+    n_time = 10  # 时间点数
+    n_cat = 3    # 类别数
+    data = np.random.rand(n_time, n_cat) * 100  # 随机数据，范围0-100
+
+    # 创建时间向量：使用datetime对象
+    start_date = datetime(2023, 1, 1)
+    timeVector = [start_date + timedelta(days=i) for i in range(n_time)]
+
+    categories = ['Category A', 'Category B', 'Category C']  # 类别名称
+
+    # 指定十六进制颜色
+    hex1 = '#D9FF88'
+    hex2 = '#FFFFFF'
+    fill_colors = [hex1, hex2]  # 作为列表传递
+
+    # 调用函数
+    fig = filled_3D_line(data, timeVector, fill_colors, categories)
+    plt.title('三维填充折线图测试', fontproperties=chinese_font)
+    plt.show()
+
+    # 输出数据信息
+    print('测试数据统计:')
+    print(f'时间点数: {n_time}')
+    print(f'类别数: {n_cat}')
+    print(f'数据范围: [{np.min(data):.2f}, {np.max(data):.2f}]')
+    print(f'时间范围: {timeVector[0]} 到 {timeVector[-1]}')
@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+
+# 按优先级尝试的中文字体
+CHINESE_FONT_FAMILIES = ('SimHei', 'Microsoft YaHei')
+
+# 磁盘缓存文件名，位于 matplotlib 的缓存目录下
+_CACHE_FILENAME = 'figure_model_fonts.json'
+
+# 进程内缓存，首次调用 get_chinese_font 时才解析
+_chinese_font = None
+
+
+def get_chinese_font():
+    """
+    获取中文字体（惰性解析，进程内只解析一次）
+    首次调用时才导入 matplotlib.font_manager；解析结果按字体管理器状态缓存在磁盘上，
+    之后的进程在字体环境未变化时无需再调用 findfont。
+
+    输出：
+        FontProperties 对象；未找到中文字体时为默认字体
+    """
+    global _chinese_font
+    if _chinese_font is None:
+        _chinese_font = _resolve_chinese_font()
+    return _chinese_font
+
+
+def set_chinese_font():
+    """
+    兼容旧接口，等价于 get_chinese_font()
+    """
+    return get_chinese_font()
+
+
+def clear_font_cache():
+    """
+    清除进程内缓存与磁盘缓存，下一次 get_chinese_font 会重新查找字体
+    """
+    global _chinese_font
+    _chinese_font = None
+    try:
+        os.remove(_cache_path())
+    except OSError:
+        pass
+
+
+def _resolve_chinese_font():
+    """
+    查找中文字体：先查磁盘缓存，未命中时依次用 findfont 查找候选字体并写回缓存
+    """
+    import matplotlib.font_manager as fm
+
+    key = _font_manager_key(fm)
+    cache = _read_cache()
+    entry = cache.get(key)
+    if entry is not None and (entry['path'] is None or os.path.exists(entry['path'])):
+        if entry['path'] is None:
+            return fm.FontProperties()
+        return fm.FontProperties(fname=entry['path'])
+
+    font_path = None
+    for family in CHINESE_FONT_FAMILIES:
+        try:
+            # fallback_to_default=False：找不到时抛出异常，而不是静默回退到 DejaVu Sans
+            font_path = fm.findfont(fm.FontProperties(family=family), fallback_to_default=False)
+        except ValueError:
+            continue
+        print(f'使用中文字体: {family}')
+        break
+    if font_path is None:
+        print('警告: 未找到中文字体，使用默认字体，中文可能显示异常')
+
+    cache[key] = {'path': font_path}
+    _write_cache(cache)
+
+    if font_path is None:
+        return fm.FontProperties()
+    return fm.FontProperties(fname=font_path)
+
+
+def _font_manager_key(fm):
+    """
+    根据字体管理器状态（版本号与已注册字体文件列表）和候选字体生成缓存键
+    安装或删除字体后键会变化，缓存自动失效。
+    """
+    manager = fm.fontManager
+    h = hashlib.sha1()
+    h.update(str(getattr(manager, '_version', '')).encode('utf-8'))
+    h.update('|'.join(CHINESE_FONT_FAMILIES).encode('utf-8'))
+    for entry in sorted(f'{font.fname}:{font.name}' for font in manager.ttflist + manager.afmlist):
+        h.update(entry.encode('utf-8', 'surrogateescape'))
+        h.update(b'\n')
+    return h.hexdigest()
+
+
+def _cache_path():
+    import matplotlib
+    return os.path.join(matplotlib.get_cachedir(), _CACHE_FILENAME)
+
+
+def _read_cache():
+    try:
+        with open(_cache_path(), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(cache):
+    # 先写临时文件再替换，避免多个进程同时写入时读到半个文件
+    path = _cache_path()
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -0,0 +1,235 @@
+import numpy as np
+
+from .filled_2D_line import _axis_limits, _create_figure, _lighter_color, _line_colors
+from .ragged import RaggedLines, as_ragged
+
+
+class LiveFilledLine:
+    """
+    可增量追加数据的填充线图（用于定时刷新的监控看板）
+    与 filled_2D_line 外观一致，但保留每条线的 Line2D 与填充路径，新数据通过 append 追加，
+    只更新受影响的线条数据与填充路径，并按需增量扩展轴范围，可选使用 blitting 刷新。
+
+    每条线的顶点保存在按倍数扩容的缓冲区中，append 只写入新数据并把该线标记为待更新，
+    因此每次追加的开销只与新数据量有关，与历史点数无关；refresh 时才把待更新线条的
+    缓冲区视图交给 Line2D 与填充路径。
+
+    输入参数：
+        data_matrix: 可选，初始数据，n x m x 2 补零数组或 RaggedLines
+        colormap_param: 可选，颜色参数，取值同 filled_2D_line。
+                        渐变色按构造时每条线起点的 x 映射；构造时为空的线使用灰色，
+                        因此从空数据开始时建议传入 n 个颜色的列表或 n x 3 数组
+        n_lines: 可选，线的数量；不提供 data_matrix 时必须提供
+        blit: 可选，是否使用 blitting 刷新，默认 False
+
+    示例：
+        chart = LiveFilledLine(n_lines=2, colormap_param=['#ff6e7f', '#bfe9ff'])
+        chart.append(0, [1, 2, 3], [0.5, 2.0, 1.0])
+        chart.append(1, [2, 3], [1.0, 0.2])
+        chart.refresh()
+        chart.savefig('live.png')
+    """
+
+    # 每条线缓冲区的初始容量（顶点数）
+    _MIN_CAPACITY = 1024
+
+    def __init__(self, data_matrix=None, colormap_param=None, n_lines=None, blit=False):
+        from matplotlib.patches import PathPatch
+        from matplotlib.path import Path
+
+        if data_matrix is None:
+            if n_lines is None:
+                raise ValueError('必须提供 data_matrix 或 n_lines 参数')
+            lines = RaggedLines(np.zeros((0, 2)), np.zeros(n_lines + 1, dtype=np.int64))
+        else:
+            lines = as_ragged(data_matrix)
+            if n_lines is not None and n_lines != len(lines.offsets) - 1:
+                raise ValueError('n_lines 必须与 data_matrix 的线数一致')
+        coords = lines.coords
+        offsets = lines.offsets
+        n = len(offsets) - 1
+
+        if len(coords) == 0:
+            x_min, x_max = 0, 1
+        else:
+            x_min = np.min(coords[:, 0])
+            x_max = np.max(coords[:, 0])
+        self.line_colors = _line_colors(coords, offsets, colormap_param, x_min, x_max)
+        self.fig, self.ax = _create_figure()
+        self.blit = bool(blit)
+
+        # 每条线的顶点缓冲区：第 0 个顶点为 (x_0, 0)，随后是曲线上的 k 个点，最后是 (x_k, 0)，
+        # 这样的闭合多边形与 filled_2D_line 中“曲线 + 反向 x 轴”的填充区域相同
+        self._buffers = [np.empty((0, 2)) for _ in range(n)]
+        self._counts = np.zeros(n, dtype=np.int64)
+        self._dirty = set()
+        self._lines = []
+        self._fills = []
+        for i in range(n):
+            color = self.line_colors[i, :]
+            line, = self.ax.plot([], [], color=color, linewidth=2, animated=self.blit)
+            fill = PathPatch(Path(np.zeros((0, 2))), facecolor=_lighter_color(color), edgecolor='none',
+                             alpha=0.3, animated=self.blit)
+            self.ax.add_artist(fill)
+            self._lines.append(line)
+            self._fills.append(fill)
+
+        # 数据范围 [x_min, x_max, y_min, y_max]，首次追加数据前为 None
+        self._bounds = None
+        for i in range(n):
+            if offsets[i + 1] > offsets[i]:
+                segment = coords[offsets[i]:offsets[i + 1]]
+                self.append(i, segment[:, 0], segment[:, 1])
+        self._sync_artists()
+        self._update_limits(force=True)
+
+        self._background = None
+        self._saving = False
+        if self.blit:
+            self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+    @property
+    def n_lines(self):
+        return len(self._lines)
+
+    def line_data(self, line_id):
+        """
+        返回第 line_id 条线当前的 k x 2 坐标（缓冲区视图，请勿修改）
+        """
+        k = self._counts[line_id]
+        return self._buffers[line_id][1:k + 1]
+
+    def append(self, line_id, xs, ys):
+        """
+        向第 line_id 条线追加新的采样点
+        只写入该线的缓冲区并标记为待更新；线条数据、填充路径、轴范围与画面在 refresh 时更新。
+
+        输入参数：
+            line_id: 线的索引（0 ~ n_lines-1）
+            xs, ys: 新采样点的坐标，一维数组或标量
+        """
+        if not 0 <= line_id < self.n_lines:
+            raise ValueError('line_id 超出范围')
+        xs = np.asarray(xs, dtype=float).ravel()
+        ys = np.asarray(ys, dtype=float).ravel()
+        if len(xs) != len(ys):
+            raise ValueError('xs 和 ys 的长度必须一致')
+        m = len(xs)
+        if m == 0:
+            return
+
+        k = self._counts[line_id]
+        buf = self._buffers[line_id]
+        need = k + m + 2
+        if len(buf) < need:
+            # 按倍数扩容，均摊后每个新点的复制开销为常数
+            grown = np.empty((max(need, 2 * len(buf), self._MIN_CAPACITY), 2))
+            if k > 0:
+                grown[:k + 1] = buf[:k + 1]
+            buf = grown
+            self._buffers[line_id] = buf
+
+        if k == 0:
+            buf[0] = (xs[0], 0.0)
+        buf[k + 1:k + m + 1, 0] = xs
+        buf[k + 1:k + m + 1, 1] = ys
+        buf[k + m + 1] = (xs[-1], 0.0)
+        self._counts[line_id] = k + m
+        self._dirty.add(line_id)
+
+        chunk = (xs.min(), xs.max(), ys.min(), ys.max())
+        if self._bounds is None:
+            self._bounds = list(chunk)
+        else:
+            self._bounds[0] = min(self._bounds[0], chunk[0])
+            self._bounds[1] = max(self._bounds[1], chunk[1])
+            self._bounds[2] = min(self._bounds[2], chunk[2])
+            self._bounds[3] = max(self._bounds[3], chunk[3])
+
+    def refresh(self):
+        """
+        刷新画面
+        数据超出当前轴范围时扩展轴范围并整体重绘；否则在 blit 模式下只恢复背景并重绘线条与填充。
+        """
+        self._sync_artists()
+        limits_changed = self._update_limits()
+        canvas = self.fig.canvas
+        if not self.blit:
+            canvas.draw_idle()
+            return
+        if limits_changed or self._background is None:
+            # 整体重绘会触发 draw_event，在 _on_draw 中重新截取背景并绘制线条
+            canvas.draw()
+            canvas.blit(self.fig.bbox)
+        else:
+            canvas.restore_region(self._background)
+            self._draw_animated()
+            canvas.blit(self.ax.bbox)
+        canvas.flush_events()
+
+    def savefig(self, *args, **kwargs):
+        """
+        保存图片，参数同 Figure.savefig
+        blit 模式下线条与填充被标记为动画对象，普通绘制会跳过它们，这里保存时临时取消该标记。
+        """
+        self._sync_artists()
+        self._update_limits()
+        artists = self._fills + self._lines
+        for artist in artists:
+            artist.set_animated(False)
+        self._saving = True
+        try:
+            self.fig.savefig(*args, **kwargs)
+        finally:
+            self._saving = False
+            for artist in artists:
+                artist.set_animated(self.blit)
+
+    def _sync_artists(self):
+        """
+        把待更新线条的缓冲区视图交给对应的 Line2D 与填充路径
+        """
+        from matplotlib.path import Path
+
+        for line_id in self._dirty:
+            k = self._counts[line_id]
+            buf = self._buffers[line_id]
+            curve = buf[1:k + 1]
+            self._lines[line_id].set_data(curve[:, 0], curve[:, 1])
+            self._fills[line_id].set_path(Path(buf[:k + 2]))
+        self._dirty.clear()
+
+    def _update_limits(self, force=False):
+        """
+        数据超出当前轴范围时，按 filled_2D_line 的留白规则重新设置轴范围
+        数据仍在当前轴范围内时不做任何改动，避免每次刷新都整体重绘。
+        输出：轴范围是否改变
+        """
+        if self._bounds is None:
+            bounds = (0, 1, 0, 1)
+        else:
+            bounds = self._bounds
+        x_min, x_max, y_min, y_max = bounds
+        if not force:
+            cur_x = self.ax.get_xlim()
+            cur_y = self.ax.get_ylim()
+            if cur_x[0] <= x_min and x_max <= cur_x[1] and cur_y[0] <= y_min and y_max <= cur_y[1]:
+                return False
+        xlim, ylim = _axis_limits(x_min, x_max, y_min, y_max)
+        self.ax.set_xlim(*xlim)
+        self.ax.set_ylim(*ylim)
+        return True
+
+    def _on_draw(self, event):
+        # 保存图片时线条已随普通绘制画出，不能再叠加绘制一次
+        if self._saving:
+            return
+        # 截取不含线条的背景，再把线条与填充画上去
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for fill in self._fills:
+            self.ax.draw_artist(fill)
+        for line in self._lines:
+            self.ax.draw_artist(line)
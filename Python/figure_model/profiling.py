@@ -0,0 +1,226 @@
+import time
+import tracemalloc
+
+# 当前接收记录的回调；为空时图表函数中的计时调用都是空操作
+_hooks = []
+
+
+def add_hook(func):
+    """
+    注册回调，每次图表函数调用结束时以记录字典调用 func(record)
+    记录字典的字段见 profile_charts。返回 func，可用作装饰器。
+    """
+    _hooks.append(func)
+    return func
+
+
+def remove_hook(func):
+    """
+    注销由 add_hook 注册的回调
+    """
+    _hooks.remove(func)
+
+
+def start_call(chart):
+    """
+    图表函数开始时调用，返回用于标记阶段的计时对象
+    没有注册任何回调时返回共享的空对象，mark / finish 不做任何事，开销可以忽略。
+
+    示例（图表函数内部）：
+        timer = start_call('bubble_plot')
+        ...                      # 输入转换
+        timer.mark('input')
+        ...                      # 颜色处理
+        timer.mark('colors')
+        timer.finish(fig)
+    """
+    if not _hooks:
+        return _NULL_CALL
+    return _ChartCall(chart)
+
+
+class _NullCall:
+    __slots__ = ()
+
+    def mark(self, name):
+        pass
+
+    def finish(self, fig=None):
+        pass
+
+
+_NULL_CALL = _NullCall()
+
+
+class _ChartCall:
+    """
+    一次图表函数调用的计时：每次 mark 记录自上一次 mark 以来的耗时
+    """
+
+    def __init__(self, chart):
+        self.chart = chart
+        self.phases = {}
+        self.trace_memory = tracemalloc.is_tracing()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            self.memory_start = tracemalloc.get_traced_memory()[0]
+        self.start = self.last = time.perf_counter()
+
+    def mark(self, name):
+        now = time.perf_counter()
+        # 同名阶段出现多次时累加
+        self.phases[name] = self.phases.get(name, 0.0) + (now - self.last)
+        self.last = now
+
+    def finish(self, fig=None):
+        total = time.perf_counter() - self.start
+        record = {
+            'chart': self.chart,
+            'phases': self.phases,
+            'total': total,
+            'artists': 0,
+            'vertices': 0,
+            'figure': fig,
+        }
+        if fig is not None:
+            record['artists'], record['vertices'] = count_artists(fig)
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            record['memory_mb'] = (current - self.memory_start) / 2 ** 20
+            record['peak_memory_mb'] = (peak - self.memory_start) / 2 ** 20
+        for hook in list(_hooks):
+            hook(record)
+
+
+def count_artists(fig):
+    """
+    统计图窗中的艺术家对象数量与顶点数量
+
+    顶点数：折线为点数，补丁为路径顶点数，集合对象为各路径顶点数之和
+    （只有一个路径、多个偏移量的集合，如散点，按“路径顶点数 x 偏移量个数”计）。
+    三维集合对象在首次绘制之前尚未投影，其顶点数要在绘制之后才能统计到。
+
+    输出：
+        (artists, vertices)
+    """
+    from matplotlib.collections import Collection
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+
+    artists = 0
+    vertices = 0
+    for artist in fig.findobj():
+        artists += 1
+        if isinstance(artist, Line2D):
+            vertices += len(artist.get_xdata())
+        elif isinstance(artist, Patch):
+            vertices += len(artist.get_path().vertices)
+        elif isinstance(artist, Collection):
+            paths = artist.get_paths()
+            n_offsets = len(artist.get_offsets())
+            if len(paths) == 1 and n_offsets > 1:
+                vertices += len(paths[0].vertices) * n_offsets
+            else:
+                vertices += sum(len(p.vertices) for p in paths)
+    return artists, vertices
+
+
+class profile_charts:
+    """
+    收集图表函数调用的分阶段耗时、艺术家数量与顶点数量
+
+    每条记录是一个字典：
+        chart: 图表函数名
+        phases: {阶段名: 秒}，按发生顺序排列，例如 input、colors、figure、font、artists、limits
+        total: 函数总耗时（秒）
+        artists, vertices: 返回图窗中的艺术家数量与顶点数量（见 count_artists）
+        render: 调用 render() 后为首次绘制到 Agg 的耗时（秒）
+        memory_mb, peak_memory_mb: trace_memory=True 时为调用期间的内存增量与峰值（MB）
+        figure: 返回的图窗对象（to_dicts() 导出时去掉）
+
+    输入参数：
+        cprofile: 可选，是否同时用 cProfile 记录函数级调用统计，之后用 stats() / dump_stats() 查看
+        trace_memory: 可选，是否用 tracemalloc 记录每次调用的内存峰值
+                      （已经在 tracemalloc 下运行时会自动记录）
+
+    示例：
+        with profile_charts() as prof:
+            fig = bubble_plot(points, v)
+            prof.render(fig)
+        print(prof.summary())
+        records = prof.to_dicts()
+    """
+
+    def __init__(self, cprofile=False, trace_memory=False):
+        self.records = []
+        self.cprofile = cprofile
+        self.trace_memory = trace_memory
+        self._profiler = None
+        self._started_tracing = False
+
+    def __enter__(self):
+        add_hook(self.records.append)
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.cprofile:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        remove_hook(self.records.append)
+        return False
+
+    def render(self, fig):
+        """
+        把图窗绘制到 Agg 画布并记录耗时，同时更新该图窗记录的艺术家与顶点数量
+        """
+        start = time.perf_counter()
+        fig.canvas.draw()
+        elapsed = time.perf_counter() - start
+        for record in self.records:
+            if record['figure'] is fig:
+                record['render'] = elapsed
+                record['artists'], record['vertices'] = count_artists(fig)
+        return elapsed
+
+    def to_dicts(self):
+        """
+        返回不含图窗对象、可直接写入 JSON 的记录列表
+        """
+        return [{k: v for k, v in record.items() if k != 'figure'} for record in self.records]
+
+    def stats(self, sort='cumulative'):
+        """
+        返回 cProfile 的 pstats.Stats 对象（需要 cprofile=True）
+        """
+        import pstats
+
+        if self._profiler is None:
+            raise ValueError('创建 profile_charts 时需要指定 cprofile=True')
+        return pstats.Stats(self._profiler).sort_stats(sort)
+
+    def dump_stats(self, path):
+        """
+        将 cProfile 统计写入文件，可用 snakeviz、pstats 等工具查看
+        """
+        self.stats().dump_stats(path)
+
+    def summary(self):
+        """
+        返回每条记录各阶段耗时的文本表格（毫秒）
+        """
+        lines = []
+        for record in self.records:
+            phases = '  '.join(f'{name} {t * 1000:.1f}' for name, t in record['phases'].items())
+            extra = f"  render {record['render'] * 1000:.1f}" if 'render' in record else ''
+            lines.append(f"{record['chart']:<18s} total {record['total'] * 1000:8.1f} ms  "
+                         f"artists {record['artists']:6d}  vertices {record['vertices']:9d}  {phases}{extra}")
+        return '\n'.join(lines)
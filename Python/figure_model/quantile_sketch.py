@@ -0,0 +1,141 @@
+import numpy as np
+
+# 样本数不超过该值时分位数草图保留全部样本，分位数为精确值
+EXACT_LIMIT = 1_000_000
+
+# 分位数草图每层保留的样本数（越大越精确，内存约为 3 倍 k 个 float）
+DEFAULT_SKETCH_K = 4096
+
+
+class QuantileSketch:
+    """
+    流式分位数草图
+    样本数不超过 exact_limit 时保留全部样本（精确模式，结果与 np.quantile 的线性插值相同）；
+    超过后转为 KLL 式的分层压缩：每层满时排序并隔一个保留一个，保留下来的样本权重加倍，
+    内存只与 k 有关，分位数的秩误差约为 O(log(n / k) / k)。
+    每次 update 处理一整块数据，不逐个插入样本。
+
+    输入参数：
+        k: 可选，最高层保留的样本数，默认 4096
+        exact_limit: 可选，精确模式的样本数上限，默认 100 万
+        seed: 可选，压缩时随机选择奇偶位置使用的随机种子
+
+    示例：
+        sketch = QuantileSketch()
+        for chunk in iter_chunks(values):
+            sketch.update(chunk)
+        q1, med, q3 = sketch.quantile([0.25, 0.5, 0.75])
+    """
+
+    def __init__(self, k=DEFAULT_SKETCH_K, exact_limit=EXACT_LIMIT, seed=0):
+        self.k = int(k)
+        self.exact_limit = int(exact_limit)
+        self.n = 0
+        self.min = np.nan
+        self.max = np.nan
+        self._exact = []
+        self._levels = None
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def exact(self):
+        """
+        是否仍处于精确模式
+        """
+        return self._levels is None
+
+    def update(self, values):
+        """
+        加入一块样本，NaN 被忽略
+        """
+        # 布尔索引总是返回副本，保留下来的样本不会引用调用方的缓冲区（如 np.memmap）
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        if self._levels is None:
+            self._exact.append(values)
+            if self.n <= self.exact_limit:
+                return
+            # 超过精确模式上限：全部样本作为第 0 层转入分层压缩
+            values = np.concatenate(self._exact)
+            self._exact = []
+            self._levels = [np.empty(0)]
+        # 第 0 层为空时直接接管本块样本（已是副本），不再复制
+        self._levels[0] = np.concatenate((self._levels[0], values)) if len(self._levels[0]) else values
+        self._compress()
+
+    def quantile(self, q):
+        """
+        返回分位数（q 可以是标量或数组，取值范围 [0, 1]）；没有样本时返回 NaN
+        """
+        q = np.asarray(q, dtype=float)
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        values, weights = self.items()
+        # 每个样本代表 weight 个连续的秩，取其中心；全部权重为 1 时与 np.quantile 的线性插值相同
+        centers = np.cumsum(weights) - (weights + 1) / 2
+        return np.interp(q * (self.n - 1), centers, values)
+
+    def items(self):
+        """
+        返回当前保留的样本及其权重，按数值升序：(values, weights)
+        精确模式下权重全为 1
+        """
+        if self._levels is None:
+            values = np.sort(np.concatenate(self._exact)) if self._exact else np.empty(0)
+            return values, np.ones(len(values))
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self._levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], weights[order]
+
+    def _capacity(self, h):
+        # 越低的层容量越小（几何递减），最高层为 k
+        depth = len(self._levels) - 1 - h
+        return max(8, int(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        h = 0
+        while h < len(self._levels):
+            level = self._levels[h]
+            if len(level) <= self._capacity(h):
+                h += 1
+                continue
+            level.sort()
+            # 奇数个样本时留下一个在本层，其余两两合并为上一层的一个样本（权重加倍）
+            keep = level[:1].copy() if len(level) % 2 else np.empty(0)
+            pairs = level[len(keep):]
+            promoted = pairs[self._rng.integers(2)::2]
+            self._levels[h] = keep
+            if h + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[h + 1] = np.concatenate((self._levels[h + 1], promoted))
+            h += 1
+
+
+def box_stats(sketch, whis=1.5):
+    """
+    由分位数草图计算箱线图统计量（与 Matlab boxplot 相同的规则）
+    须线端点取落在 [q1 - whis * iqr, q3 + whis * iqr] 内的最小/最大样本，之外的样本为离群点。
+    草图处于压缩模式时，须线端点与离群点取自草图保留的样本（外加精确的最小值与最大值），为近似结果。
+
+    输出：
+        字典：q1、med、q3、whislo、whishi、fliers（离群点数组）；没有样本时各值为 NaN
+    """
+    q1, med, q3 = sketch.quantile([0.25, 0.5, 0.75])
+    if sketch.n == 0:
+        return {'q1': q1, 'med': med, 'q3': q3, 'whislo': np.nan, 'whishi': np.nan, 'fliers': np.empty(0)}
+    values, _ = sketch.items()
+    if not sketch.exact:
+        values = np.union1d(values, [sketch.min, sketch.max])
+    lo_fence = q1 - whis * (q3 - q1)
+    hi_fence = q3 + whis * (q3 - q1)
+    inside = values[(values >= lo_fence) & (values <= hi_fence)]
+    whislo = inside.min() if len(inside) > 0 else q1
+    whishi = inside.max() if len(inside) > 0 else q3
+    fliers = values[(values < whislo) | (values > whishi)]
+    return {'q1': q1, 'med': med, 'q3': q3, 'whislo': whislo, 'whishi': whishi, 'fliers': np.unique(fliers)}
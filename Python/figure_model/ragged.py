@@ -0,0 +1,94 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .data_source import as_array
+
+RaggedLines = namedtuple('RaggedLines', ['coords', 'offsets'])
+RaggedLines.__doc__ = """
+不等长折线的紧凑表示（类似 CSR 稀疏格式）
+
+字段：
+    coords: N x 2 数组，所有线的 [x, y] 坐标首尾相接存放
+    offsets: 长度为 n+1 的整数数组，第 i 条线为 coords[offsets[i]:offsets[i+1]]，
+             offsets[0] == 0，offsets[-1] == N
+
+示例：
+    lines = RaggedLines(coords=np.array([[0, 1], [1, 2], [5, 0]]), offsets=np.array([0, 2, 3]))
+    # 第 0 条线有 2 个点，第 1 条线有 1 个点
+"""
+
+
+def as_ragged(data):
+    """
+    将输入统一转换为 RaggedLines
+
+    输入参数：
+        data: RaggedLines，或 n x m x 2 的补零数组（每条线末尾用 [0, 0] 补齐），
+              补零数组也可以是 np.memmap 或数据文件路径
+
+    输出：
+        RaggedLines 对象（coords 为浮点数组，offsets 为 int64 数组）
+    """
+    if isinstance(data, RaggedLines):
+        coords = np.asarray(data.coords, dtype=float)
+        offsets = np.asarray(data.offsets, dtype=np.int64)
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError('RaggedLines.coords 必须是 N x 2 数组')
+        if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(coords):
+            raise ValueError('RaggedLines.offsets 必须是以 0 开头、以 N 结尾的一维数组')
+        if np.any(np.diff(offsets) < 0):
+            raise ValueError('RaggedLines.offsets 必须单调不减')
+        return RaggedLines(coords, offsets)
+
+    data = as_array(data, 'data_matrix')
+    if data.ndim != 3 or data.shape[2] != 2:
+        raise ValueError('data_matrix 必须是 n x m x 2 数组或 RaggedLines')
+    return ragged_from_padded(data)
+
+
+def ragged_from_padded(data_matrix):
+    """
+    将 n x m x 2 的补零数组一次性向量化地转换为 RaggedLines
+    每条线的长度取到最后一个非 [0, 0] 点为止，只有末尾的 [0, 0] 被视为补齐，
+    因此线中间 x = 0 或 y = 0 的合法采样点会被保留。
+
+    输入参数：
+        data_matrix: n x m x 2 数组
+
+    输出：
+        RaggedLines 对象
+    """
+    data_matrix = np.asarray(data_matrix)
+    if data_matrix.ndim != 3 or data_matrix.shape[2] != 2:
+        raise ValueError('data_matrix 必须是 n x m x 2 数组')
+    n, m = data_matrix.shape[:2]
+
+    # 每条线最后一个非零点的位置 + 1 即为该线的长度
+    nonzero = np.any(data_matrix != 0, axis=2)
+    has_points = nonzero.any(axis=1)
+    lengths = np.where(has_points, m - np.argmax(nonzero[:, ::-1], axis=1), 0)
+
+    keep = np.arange(m) < lengths[:, None]
+    coords = data_matrix[keep].astype(float)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return RaggedLines(coords, offsets)
+
+
+def ragged_from_lines(lines):
+    """
+    由每条线各自的 k_i x 2 坐标数组构造 RaggedLines
+
+    输入参数：
+        lines: 列表，每个元素是一条线的 k_i x 2 数组（k_i 可以为 0）
+
+    输出：
+        RaggedLines 对象
+    """
+    arrays = [np.asarray(line, dtype=float).reshape(-1, 2) for line in lines]
+    lengths = np.array([len(a) for a in arrays], dtype=np.int64)
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    coords = np.concatenate(arrays, axis=0) if arrays else np.zeros((0, 2))
+    return RaggedLines(coords, offsets)
@@ -0,0 +1,134 @@
+import numpy as np
+
+from .data_source import DEFAULT_CHUNK_BYTES
+
+# 点数达到该值时 raster='auto' 改用密度栅格绘制
+RASTER_THRESHOLD = 1_000_000
+
+
+def use_raster(raster, n_points):
+    """
+    根据 raster 参数与点数决定是否使用密度栅格模式
+
+    输入参数：
+        raster: 'auto'（点数达到 RASTER_THRESHOLD 时使用栅格）、True 或 False
+        n_points: 点数
+    """
+    if isinstance(raster, str):
+        if raster != 'auto':
+            raise ValueError("raster 必须是 'auto'、True 或 False")
+        return n_points >= RASTER_THRESHOLD
+    return bool(raster)
+
+
+def axes_pixel_shape(ax):
+    """
+    返回坐标轴绘图区域在保存/显示分辨率下的像素尺寸 (ny, nx)
+    会先应用坐标轴的纵横比设置，因此应在设置完轴范围之后调用。
+    """
+    ax.apply_aspect()
+    fig = ax.figure
+    pos = ax.get_position()
+    nx = max(1, int(np.ceil(fig.get_figwidth() * fig.dpi * pos.width)))
+    ny = max(1, int(np.ceil(fig.get_figheight() * fig.dpi * pos.height)))
+    return ny, nx
+
+
+def rasterize_points(xy, extent, shape, weights=None, colors=None, skip_zero=False, out=None):
+    """
+    将点按像素网格分箱累加（按块处理，内存只与网格大小有关）
+    每个点落入的像素累加其权重，给出颜色时同时累加“权重 x 颜色”，用于之后计算像素的平均颜色。
+    范围之外的点被忽略。
+
+    输入参数：
+        xy: k x 2 坐标数组（可以是 np.memmap）
+        extent: (x0, x1, y0, y1)，网格覆盖的数据范围
+        shape: (ny, nx)，网格的像素尺寸
+        weights: 可选，长度为 k 的权重；缺省时每个点权重为 1
+        colors: 可选，单个 RGB 颜色（所有点相同）或 k x 3 数组（每个点的颜色）
+        skip_zero: 是否跳过坐标为 [0, 0] 的点（补零数组的空值约定）
+        out: 可选，(density, color_sum) 累加目标，由之前的调用返回，用于把多组点画到同一网格
+
+    输出：
+        (density, color_sum)：长度为 ny * nx 的权重和，以及 (ny * nx) x 3 的颜色加权和（未给出颜色时为 None）
+    """
+    x0, x1, y0, y1 = extent
+    ny, nx = shape
+    n_pix = ny * nx
+    if out is None:
+        density = np.zeros(n_pix)
+        color_sum = None if colors is None else np.zeros((n_pix, 3))
+    else:
+        density, color_sum = out
+    if colors is not None:
+        colors = np.asarray(colors, dtype=float)
+        if color_sum is None:
+            raise ValueError('out 中没有颜色累加数组')
+    sx = nx / (x1 - x0) if x1 > x0 else 0.0
+    sy = ny / (y1 - y0) if y1 > y0 else 0.0
+
+    chunk_rows = max(DEFAULT_CHUNK_BYTES // (16 * xy.itemsize), 1)
+    for start in range(0, len(xy), chunk_rows):
+        stop = min(start + chunk_rows, len(xy))
+        chunk = xy[start:stop]
+        fx = (chunk[:, 0] - x0) * sx
+        fy = (chunk[:, 1] - y0) * sy
+        keep = (fx >= 0) & (fx <= nx) & (fy >= 0) & (fy <= ny)
+        if skip_zero:
+            keep &= np.any(chunk != 0, axis=1)
+        # 恰好落在右/上边界的点归入最后一列/行
+        idx = np.minimum(fy[keep].astype(np.int64), ny - 1) * nx + np.minimum(fx[keep].astype(np.int64), nx - 1)
+        w = None if weights is None else np.asarray(weights[start:stop], dtype=float)[keep]
+        density += np.bincount(idx, weights=w, minlength=n_pix)
+        if colors is None:
+            continue
+        if colors.ndim == 1:
+            # 单一颜色：像素的颜色加权和等于该组点的权重和乘以颜色
+            group = np.bincount(idx, weights=w, minlength=n_pix)
+            color_sum += group[:, None] * colors
+        else:
+            c = colors[start:stop][keep]
+            for ch in range(3):
+                cw = c[:, ch] if w is None else c[:, ch] * w
+                color_sum[:, ch] += np.bincount(idx, weights=cw, minlength=n_pix)
+    return density, color_sum
+
+
+def shade_raster(density, shape, alpha, color_sum=None, column_colors=None):
+    """
+    将分箱结果着色为 RGBA 图像
+    像素颜色为其中各点颜色的加权平均（或按列给定的渐变色），
+    不透明度按对数密度从 0 增长到 alpha，没有点的像素完全透明。
+
+    输入参数：
+        density, color_sum: rasterize_points 的输出
+        shape: (ny, nx)
+        alpha: 最大不透明度
+        column_colors: 可选，nx x 3 数组，每个像素列的颜色（用于沿 x 轴映射的渐变色）
+
+    输出：
+        ny x nx x 4 的 RGBA 图像（第 0 行对应 y 最小处，配合 imshow(origin='lower') 使用）
+    """
+    ny, nx = shape
+    img = np.zeros((ny * nx, 4))
+    filled = density > 0
+    if color_sum is not None:
+        img[filled, :3] = color_sum[filled] / density[filled, None]
+    elif column_colors is not None:
+        img[:, :3] = np.tile(np.asarray(column_colors, dtype=float), (ny, 1))
+    d_max = density.max() if len(density) > 0 else 0
+    if d_max > 0:
+        img[filled, 3] = alpha * np.log1p(density[filled]) / np.log1p(d_max)
+    return img.reshape(ny, nx, 4)
+
+
+def draw_raster(ax, img, extent):
+    """
+    用一个 imshow 显示栅格图像，并保持坐标轴原有的纵横比与轴范围
+    """
+    xlim = ax.get_xlim()
+    ylim = ax.get_ylim()
+    image = ax.imshow(img, extent=extent, origin='lower', interpolation='nearest', aspect=ax.get_aspect())
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+    return image
@@ -0,0 +1,304 @@
+import datetime
+import hashlib
+import importlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .figure_pool import FigurePool
+
+# 缓存格式版本，键的计算方式或输出内容变化时递增，使旧条目失效
+CACHE_VERSION = 1
+
+# 默认磁盘缓存大小上限（字节）
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# 缓存未命中时渲染使用的图窗池
+_pool = FigurePool()
+
+# 作为文件路径参数时按文件状态（而不是路径字符串）计入缓存键的扩展名，与 data_source.load_array 一致
+_DATA_EXTENSIONS = ('.npy', '.npz', '.csv', '.parquet', '.arrow', '.feather')
+
+
+class RenderCache:
+    """
+    按内容寻址的图表渲染缓存
+    以图表名、全部输入数据与参数、输出格式与 dpi 计算 BLAKE2b 哈希作为键，把渲染得到的图片字节
+    保存在磁盘目录中（总大小超过上限时按最近使用时间淘汰），并可选地在进程内保留一份内存缓存。
+    命中时直接返回字节，不导入 pyplot，也不构建图窗。
+
+    输入参数：
+        directory: 可选，磁盘缓存目录，默认为 $XDG_CACHE_HOME/figure_model/renders
+                   （未设置时为 ~/.cache/figure_model/renders）；传入 False 时只使用内存缓存
+        max_bytes: 可选，磁盘缓存总大小上限（字节），默认 512 MB
+        memory_bytes: 可选，内存缓存总大小上限（字节），默认 0 表示不使用内存缓存
+
+    示例：
+        cache = RenderCache(memory_bytes=64 * 1024 * 1024)
+        png = cache.render('filled_2D_line', data_matrix, ['#ff6e7f', '#bfe9ff'], format='png', dpi=100)
+        svg = cache.render('bubble_plot', points, v, r=5, alpha_value=0.5, format='svg')
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES, memory_bytes=0):
+        if directory is None:
+            directory = default_cache_dir()
+        self.directory = directory or None
+        self.max_bytes = int(max_bytes)
+        self.memory_bytes = int(memory_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._disk_size = None  # 首次写入时才扫描目录
+        self._lock = threading.Lock()
+
+    def render(self, chart, *args, format='png', dpi=None, savefig_kwargs=None, **kwargs):
+        """
+        返回图表渲染结果的字节，缓存命中时不重新绘制
+
+        输入参数：
+            chart: 图表名，取值见 batch_render.CHARTS（如 'bubble_plot'）
+            *args, **kwargs: 传给图表函数的参数
+            format: 输出格式，如 'png'、'svg'、'pdf'
+            dpi: 可选，保存图片时使用的 dpi，默认使用图窗自身的 dpi
+            savefig_kwargs: 可选，其他传给 Figure.savefig 的参数（同样计入缓存键）
+
+        输出：
+            图片字节
+        """
+        savefig_kwargs = dict(savefig_kwargs or {})
+        key = cache_key(chart, args, kwargs, format=format, dpi=dpi, savefig_kwargs=savefig_kwargs)
+        data = self.get(key, format)
+        if data is not None:
+            return data
+        data = _render_bytes(chart, args, kwargs, format, dpi, savefig_kwargs)
+        self.put(key, format, data)
+        return data
+
+    def get(self, key, format):
+        """
+        按键读取缓存的图片字节，未命中时返回 None
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+        data = None
+        if self.directory is not None:
+            path = self._path(key, format)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                # 用修改时间记录最近使用时间，供 LRU 淘汰使用
+                os.utime(path)
+            except OSError:
+                data = None
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key, format, data):
+        """
+        写入缓存；磁盘缓存超过大小上限时淘汰最久未使用的条目
+        """
+        with self._lock:
+            self._remember(key, data)
+        if self.directory is None:
+            return
+        path = self._path(key, format)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 先写临时文件再替换，多个进程共享缓存目录时不会读到写了一半的文件
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._disk_size is None:
+                self._disk_size = sum(size for _, size, _ in self._scan())
+            else:
+                self._disk_size += len(data)
+            if self._disk_size > self.max_bytes:
+                self._evict()
+
+    def clear(self):
+        """
+        清空内存缓存与磁盘缓存
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            for path, _, _ in self._scan():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._disk_size = 0
+
+    def _path(self, key, format):
+        return os.path.join(self.directory, key[:2], f'{key}.{format}')
+
+    def _remember(self, key, data):
+        # 调用方持有 self._lock
+        if len(data) > self.memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_size -= len(old)
+        self._memory[key] = data
+        self._memory_size += len(data)
+        while self._memory_size > self.memory_bytes:
+            _, dropped = self._memory.popitem(last=False)
+            self._memory_size -= len(dropped)
+
+    def _scan(self):
+        """
+        列出磁盘缓存中的所有条目：(路径, 大小, 最近使用时间)
+        """
+        entries = []
+        if self.directory is None or not os.path.isdir(self.directory):
+            return entries
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.path, st.st_size, st.st_mtime))
+        return entries
+
+    def _evict(self):
+        # 调用方持有 self._lock；淘汰到上限的 90%，避免每次写入都扫描目录
+        entries = sorted(self._scan(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = 0.9 * self.max_bytes
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._disk_size = total
+
+
+def default_cache_dir():
+    """
+    返回默认磁盘缓存目录（不导入 matplotlib）
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'figure_model', 'renders')
+
+
+def cache_key(chart, args, kwargs, format='png', dpi=None, savefig_kwargs=None):
+    """
+    计算渲染缓存键（十六进制字符串）
+    数组按 dtype、形状与原始字节计入（连续数组直接哈希缓冲区，不复制）；
+    数据文件路径按路径、大小与修改时间计入；其余参数按类型与取值递归计入。
+
+    输出：
+        40 个字符的十六进制字符串
+    """
+    h = hashlib.blake2b(digest_size=20)
+    _update(h, (CACHE_VERSION, _matplotlib_version(), chart, format, dpi))
+    _update(h, savefig_kwargs or {})
+    _update(h, tuple(args))
+    _update(h, kwargs)
+    return h.hexdigest()
+
+
+def _update(h, obj):
+    """
+    把一个参数递归地写入哈希对象；每种类型带有标记，避免不同类型的值产生相同的字节序列
+    """
+    if isinstance(obj, np.ndarray):
+        h.update(b'A')
+        h.update(f'{obj.dtype.str}{obj.shape}'.encode())
+        if obj.dtype.hasobject:
+            for item in obj.ravel():
+                _update(h, item)
+            return
+        if not obj.flags.c_contiguous:
+            obj = np.ascontiguousarray(obj)
+        # 以字节视图直接哈希缓冲区（对 datetime64 等类型同样适用）
+        h.update(obj.reshape(-1).view(np.uint8))
+    elif obj is None or isinstance(obj, (bool, int, float, complex)):
+        h.update(f'S{type(obj).__name__}:{obj!r};'.encode())
+    elif isinstance(obj, np.generic):
+        _update(h, np.asarray(obj))
+    elif isinstance(obj, str):
+        h.update(b'U')
+        h.update(obj.encode('utf-8', 'surrogatepass'))
+        h.update(b';')
+        if obj.lower().endswith(_DATA_EXTENSIONS) and os.path.isfile(obj):
+            _update_file(h, obj)
+    elif isinstance(obj, os.PathLike):
+        path = os.fspath(obj)
+        h.update(b'P')
+        _update(h, path)
+        _update_file(h, path)
+    elif isinstance(obj, bytes):
+        h.update(b'B%d:' % len(obj))
+        h.update(obj)
+    elif isinstance(obj, (list, tuple)):
+        # 命名元组（如 RaggedLines）额外计入类型名
+        h.update(f'L{type(obj).__name__}{len(obj)}('.encode())
+        for item in obj:
+            _update(h, item)
+        h.update(b')')
+    elif isinstance(obj, dict):
+        h.update(f'D{len(obj)}('.encode())
+        for k in sorted(obj, key=repr):
+            _update(h, k)
+            _update(h, obj[k])
+        h.update(b')')
+    elif isinstance(obj, (datetime.date, datetime.time, datetime.timedelta)):
+        h.update(f'T{obj!r};'.encode())
+    else:
+        raise TypeError(f'无法为 {type(obj).__name__} 类型的参数计算缓存键')
+
+
+def _update_file(h, path):
+    # 数据文件按大小与修改时间计入，文件被改写后缓存自动失效
+    st = os.stat(path)
+    h.update(f'F{st.st_size}:{st.st_mtime_ns};'.encode())
+
+
+_mpl_version = None
+
+
+def _matplotlib_version():
+    # 渲染结果依赖 matplotlib 版本；用包元数据读取版本号，避免导入 matplotlib
+    global _mpl_version
+    if _mpl_version is None:
+        from importlib.metadata import PackageNotFoundError, version
+        try:
+            _mpl_version = version('matplotlib')
+        except PackageNotFoundError:
+            _mpl_version = ''
+    return _mpl_version
+
+
+def _render_bytes(chart, args, kwargs, format, dpi, savefig_kwargs):
+    """
+    构建图表并保存为图片字节（缓存未命中时调用），图窗取自进程内的 FigurePool
+    """
+    from .batch_render import CHARTS
+
+    if chart not in CHARTS:
+        raise ValueError(f'未知的图表类型: {chart}')
+    module_name, func_name = CHARTS[chart]
+    func = getattr(importlib.import_module(module_name), func_name)
+    return _pool.render(func, *args, format=format, dpi=dpi, savefig_kwargs=savefig_kwargs, **kwargs)
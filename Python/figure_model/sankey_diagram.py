@@ -0,0 +1,319 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .colors import colors_to_rgb
+from .data_source import as_array
+from .figure_pool import new_figure
+from .profiling import start_call
+
+SankeyLayout = namedtuple('SankeyLayout', [
+    'x_positions', 'node_width', 'gap', 'node_bottoms', 'node_heights',
+    'layer', 'src', 'dst', 'flow', 'src_y', 'dst_y', 'extent',
+])
+SankeyLayout.__doc__ = """
+桑基图的布局结果（由 sankey_layout 计算）
+
+字段：
+    x_positions: 长度为 n 的数组，各层级节点中心的 x 坐标
+    node_width: 节点矩形的宽度（x 方向）
+    gap: 同层级相邻节点之间的空隙
+    node_bottoms, node_heights: n x m 数组，各节点矩形的底部 y 坐标与高度（不存在的节点为 0）
+    layer, src, dst, flow: 长度为 k 的数组，合并重复项并去掉非正流量后的边，
+                           按 (layer, src, dst) 排序
+    src_y, dst_y: k x 2 数组，每条连接带在源节点右侧、目标节点左侧的 [下边界, 上边界] y 坐标
+    extent: (x_min, x_max, y_min, y_max)，节点所在的绘图范围
+"""
+
+
+def sankey_diagram(data, connection, colormap_param=None):
+    """
+    绘制桑基图
+    连接以稀疏边列表给出，节点位置与连接带的堆叠偏移量都用向量化的累积和计算，
+    所有连接带合并为一个由二次贝塞尔路径组成的 PathCollection，所有节点合并为一个 PolyCollection，
+    每层数千个节点、数万条边时艺术家对象数量仍然固定。
+
+    输入参数：
+        data: n x m 数组，n 是层级数，m 是每层最大节点数。data[i, j] > 0 表示节点存在，值为流量。
+              也可以是 np.memmap 或数据文件路径（见 data_source.py）。
+        connection: 层级 i 节点 j 到层级 i+1 节点 k 的流量（索引从 0 开始），可以是：
+                    - 元组 (layer, src, dst, flow)：4 个等长的一维数组（COO 格式）
+                    - k x 4 数组：每行为 [layer, src, dst, flow]
+                    - 长度为 n-1 的列表：第 i 个元素是 m x m 的稀疏矩阵（如 scipy.sparse 的 CSR / COO 矩阵，
+                      需要提供 tocoo() 方法），行为源节点、列为目标节点
+                    - (n-1) x m x m 的稠密数组（与 Matlab 版本的 connection 参数相同）
+                    重复的边流量相加，流量不大于 0 的边被忽略。
+        colormap_param: 可选，两个颜色值（如 ['#FF0000', '#0000FF']），生成沿 x 轴从第一个颜色
+                        到第二个颜色的渐变；缺省时使用 '#43CBFF' 到 '#9708CC' 的渐变
+
+    输出：
+        fig: matplotlib 图窗对象
+
+    示例：
+        data = np.array([[10, 20], [15, 15]])
+        connection = (np.array([0, 0, 0, 0]), np.array([0, 0, 1, 1]),
+                      np.array([0, 1, 0, 1]), np.array([5, 5, 10, 10]))
+        fig = sankey_diagram(data, connection, ['#FF0000', '#0000FF'])
+    """
+    timer = start_call('sankey_diagram')
+    from matplotlib.collections import PathCollection, PolyCollection
+    timer.mark('import')
+
+    layout = sankey_layout(data, connection)
+    timer.mark('layout')
+
+    # 处理颜色参数：颜色按 x 位置在两个颜色之间线性插值
+    if colormap_param is None:
+        colormap_param = ['#43CBFF', '#9708CC']
+    if len(colormap_param) != 2:
+        raise ValueError('colormap_param 必须包含两个颜色值（hex 码）')
+    color1, color2 = colors_to_rgb(list(colormap_param))
+    x_min, x_max, y_min, y_max = layout.extent
+
+    def colormap_fn(x):
+        t = ((x - x_min) / (x_max - x_min))[:, None]
+        return (1 - t) * color1 + t * color2
+    timer.mark('colors')
+
+    # 创建图窗（激活 FigurePool 时复用池中的无界面图窗）
+    fig, ax = new_figure((8, 6), window_title='桑基图')
+    timer.mark('figure')
+
+    # 所有节点矩形一次性绘制，颜色取节点中心 x 位置对应的颜色
+    layer_idx, node_idx = np.nonzero(layout.node_heights > 0)
+    x_left = layout.x_positions[layer_idx] - layout.node_width / 2
+    x_right = x_left + layout.node_width
+    y_bottom = layout.node_bottoms[layer_idx, node_idx]
+    y_top = y_bottom + layout.node_heights[layer_idx, node_idx]
+    rects = np.stack((
+        np.stack((x_left, y_bottom), axis=1),
+        np.stack((x_right, y_bottom), axis=1),
+        np.stack((x_right, y_top), axis=1),
+        np.stack((x_left, y_top), axis=1),
+    ), axis=1)
+    nodes = PolyCollection(rects, facecolors=colormap_fn(layout.x_positions[layer_idx]), edgecolors='none')
+    ax.add_collection(nodes, autolim=False)
+
+    # 所有连接带一次性绘制，颜色取连接带中点 x 位置对应的颜色
+    if len(layout.flow) > 0:
+        paths, x_mid = _ribbon_paths(layout, m=layout.node_heights.shape[1])
+        ribbons = PathCollection(paths, facecolors=colormap_fn(x_mid), edgecolors='none', alpha=0.7)
+        ax.add_collection(ribbons, autolim=False)
+    timer.mark('artists')
+
+    gap = layout.gap
+    ax.set_aspect('equal')
+    ax.set_xlim(x_min - gap, x_max + gap)
+    ax.set_ylim(y_min - gap, y_max + gap)
+    ax.set_axis_off()
+    timer.mark('limits')
+
+    timer.finish(fig)
+    return fig
+
+
+def sankey_layout(data, connection):
+    """
+    计算桑基图的节点与连接带布局（不导入 matplotlib）
+    绘图范围、节点宽度与空隙沿用 Matlab 版本：x 方向 [0, 1.5m]，y 方向 [0, m]，节点宽 0.1m，空隙 0.05m；
+    同层节点较多、空隙总和超过高度一半时，空隙按比例缩小，使所有节点仍能放进绘图范围。
+    源节点的流出连接带按目标节点序号自下而上堆叠，目标节点的流入连接带按源节点序号堆叠，
+    各自占满节点高度。
+
+    输入参数：
+        data, connection: 见 sankey_diagram
+
+    输出：
+        SankeyLayout 对象
+    """
+    data = as_array(data, 'data')
+    if data.ndim != 2:
+        raise ValueError('data 必须是 n x m 矩阵')
+    n, m = data.shape
+    layer, src, dst, flow = _edge_arrays(connection, n, m)
+
+    # 检查边两端的节点是否存在
+    missing = (data[layer, src] <= 0) | (data[layer + 1, dst] <= 0)
+    if np.any(missing):
+        i = np.flatnonzero(missing)[0]
+        raise ValueError(f'连接从层级 {layer[i]} 节点 {src[i]} 到层级 {layer[i] + 1} 节点 {dst[i]} 的流量为正，'
+                         f'但节点不存在')
+
+    # 设置绘图参数
+    x_min, x_max = 0.0, 1.5 * m
+    y_min, y_max = 0.0, float(m)
+    node_width = 0.1 * m
+    valid = data > 0
+    num_valid = valid.sum(axis=1)
+    gap = 0.05 * m
+    if num_valid.max(initial=0) * gap > 0.5 * (y_max - y_min):
+        gap = 0.5 * (y_max - y_min) / num_valid.max()
+    x_positions = np.linspace(x_min + node_width / 2, x_max - node_width / 2, n)
+
+    # 节点高度按层内流量占比分配可用高度，底部位置为同层前面节点（含空隙）的累积和
+    values = np.where(valid, data, 0).astype(float)
+    layer_sums = values.sum(axis=1, keepdims=True)
+    available = (y_max - y_min) - num_valid[:, None] * gap
+    node_heights = np.divide(values, layer_sums, out=np.zeros_like(values), where=layer_sums > 0) * available
+    stacked = np.cumsum(node_heights + gap * valid, axis=1)
+    node_bottoms = np.where(valid, y_min + stacked - (node_heights + gap * valid), 0.0)
+
+    # 连接带在源节点一侧与目标节点一侧的 y 范围
+    src_key = layer * m + src
+    dst_key = (layer + 1) * m + dst
+    src_y = _stack_offsets(src_key, flow, node_bottoms, node_heights)
+    dst_order = np.lexsort((src, dst_key))
+    dst_y = np.empty_like(src_y)
+    dst_y[dst_order] = _stack_offsets(dst_key[dst_order], flow[dst_order], node_bottoms, node_heights)
+
+    return SankeyLayout(x_positions, node_width, gap, node_bottoms, node_heights,
+                        layer, src, dst, flow, src_y, dst_y, (x_min, x_max, y_min, y_max))
+
+
+def _edge_arrays(connection, n, m):
+    """
+    将各种格式的连接统一为按 (layer, src, dst) 排序、合并重复项、只含正流量的 COO 数组
+    """
+    if isinstance(connection, tuple) and len(connection) == 4:
+        layer, src, dst, flow = (np.asarray(a).ravel() for a in connection)
+        if not (len(layer) == len(src) == len(dst) == len(flow)):
+            raise ValueError('connection 的 layer、src、dst、flow 长度必须一致')
+    elif isinstance(connection, list) and len(connection) > 0 and hasattr(connection[0], 'tocoo'):
+        # 每层一个稀疏矩阵（CSR / COO 等），逐层取出非零项后拼接
+        if len(connection) != n - 1:
+            raise ValueError('connection 稀疏矩阵列表的长度必须为 n-1')
+        coos = [mat.tocoo() for mat in connection]
+        if any(coo.shape != (m, m) for coo in coos):
+            raise ValueError('connection 中的每个稀疏矩阵必须是 m x m')
+        layer = np.repeat(np.arange(n - 1), [coo.nnz for coo in coos])
+        src = np.concatenate([coo.row for coo in coos])
+        dst = np.concatenate([coo.col for coo in coos])
+        flow = np.concatenate([coo.data for coo in coos])
+    else:
+        connection = as_array(connection, 'connection')
+        if connection.ndim == 3:
+            # 稠密连接矩阵：一次性取出所有非零项
+            if connection.shape != (n - 1, m, m):
+                raise ValueError('connection 矩阵的维度必须为 (n-1) x m x m')
+            layer, src, dst = np.nonzero(connection > 0)
+            flow = connection[layer, src, dst]
+        elif connection.ndim == 2 and connection.shape[1] == 4:
+            layer, src, dst, flow = connection.T
+        elif connection.size == 0:
+            layer = src = dst = flow = np.zeros(0)
+        else:
+            raise ValueError('connection 必须是 (layer, src, dst, flow) 元组、k x 4 数组、'
+                             '稀疏矩阵列表或 (n-1) x m x m 数组')
+
+    flow = np.asarray(flow, dtype=float)
+    if not np.all(np.isfinite(flow)):
+        raise ValueError('connection 中的流量必须是有限数值')
+    indices = []
+    for name, idx, upper in (('层级', layer, n - 1), ('节点', src, m), ('节点', dst, m)):
+        idx = np.asarray(idx)
+        if idx.dtype.kind == 'f' and np.any(idx != np.round(idx)) or idx.dtype.kind not in 'iuf':
+            raise ValueError(f'connection 中的{name}索引必须是整数')
+        idx = idx.astype(np.int64)
+        if len(idx) > 0 and (idx.min() < 0 or idx.max() >= upper):
+            raise ValueError(f'connection 中的{name}索引超出范围')
+        indices.append(idx)
+    layer, src, dst = indices
+
+    # 只保留正流量，按 (layer, src, dst) 排序后合并重复的边
+    keep = flow > 0
+    layer, src, dst, flow = layer[keep], src[keep], dst[keep], flow[keep]
+    order = np.lexsort((dst, src, layer))
+    layer, src, dst, flow = layer[order], src[order], dst[order], flow[order]
+    if len(flow) > 1:
+        key = (layer * m + src) * m + dst
+        starts = np.flatnonzero(np.concatenate(([True], key[1:] != key[:-1])))
+        if len(starts) < len(flow):
+            flow = np.add.reduceat(flow, starts)
+            layer, src, dst = layer[starts], src[starts], dst[starts]
+    return layer, src, dst, flow
+
+
+def _stack_offsets(node_key, flow, node_bottoms, node_heights):
+    """
+    计算连接带在节点上的堆叠范围
+    node_key 已按节点分组排好序（同一节点的边相邻），每个节点的连接带按顺序自下而上占满节点高度。
+
+    输出：
+        与输入顺序一致的 k x 2 数组，每行为 [下边界, 上边界]
+    """
+    if len(flow) == 0:
+        return np.zeros((0, 2))
+    n_nodes = node_bottoms.size
+    totals = np.bincount(node_key, weights=flow, minlength=n_nodes)
+    # 组内的排他累积和 = 全局排他累积和 - 该组之前所有组的流量之和
+    before_group = np.cumsum(totals) - totals
+    before_edge = np.cumsum(flow) - flow - before_group[node_key]
+    total = totals[node_key]
+    bottom = node_bottoms.ravel()[node_key]
+    height = node_heights.ravel()[node_key]
+    y0 = bottom + before_edge / total * height
+    y1 = bottom + (before_edge + flow) / total * height
+    # 最后一条连接带的上边界直接取节点顶部，避免累积误差
+    last = np.concatenate((node_key[1:] != node_key[:-1], [True]))
+    y1[last] = (bottom + height)[last]
+    return np.stack((y0, y1), axis=1)
+
+
+def _ribbon_paths(layout, m):
+    """
+    生成所有连接带的二次贝塞尔闭合路径
+    每条连接带由下边界曲线、目标节点侧竖直边、上边界曲线与源节点侧竖直边组成，
+    控制点位于两侧节点之间的中点，沿用 Matlab 版本的收窄偏移量 0.025 x 间距 x m，
+    但不超过连接带两端较窄一侧厚度的一半（节点很多时 Matlab 的偏移量会使连接带翻转）。
+
+    输出：
+        (paths, x_mid)：Path 对象列表，以及每条连接带中点的 x 坐标（用于取颜色）
+    """
+    from matplotlib.path import Path
+
+    xs = layout.x_positions[layout.layer] + layout.node_width / 2
+    xt = layout.x_positions[layout.layer + 1] - layout.node_width / 2
+    x_mid = (xs + xt) / 2
+    ys0, ys1 = layout.src_y.T
+    yt0, yt1 = layout.dst_y.T
+    offset = np.minimum(0.025 * (xt - xs) * m, 0.5 * np.minimum(ys1 - ys0, yt1 - yt0))
+
+    # k x 7 x 2 的顶点数组，所有路径共用同一组路径码
+    verts = np.empty((len(xs), 7, 2))
+    verts[:, :, 0] = np.stack((xs, x_mid, xt, xt, x_mid, xs, xs), axis=1)
+    verts[:, :, 1] = np.stack((ys0, (ys0 + yt0) / 2 + offset, yt0, yt1, (ys1 + yt1) / 2 - offset, ys1, ys0), axis=1)
+    codes = np.array([Path.MOVETO, Path.CURVE3, Path.CURVE3, Path.LINETO,
+                      Path.CURVE3, Path.CURVE3, Path.CLOSEPOLY], dtype=Path.code_type)
+    paths = [Path(v, codes) for v in verts]
+    return paths, x_mid
+
+
+# 测试代码
+if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+
+    # 测试用例1: 两层桑基图，从红到蓝过渡（COO 元组）
+    data1 = np.array([[10, 20], [15, 15]])
+    connection1 = (np.array([0, 0, 0, 0]), np.array([0, 0, 1, 1]), np.array([0, 1, 0, 1]), np.array([5, 5, 10, 10]))
+    fig1 = sankey_diagram(data1, connection1, ['#FF0000', '#0000FF'])
+    plt.show()
+
+    # 测试用例2: 四层桑基图，从绿到黄过渡（k x 4 数组）
+    data3 = np.array([[30, 20, 10], [25, 15, 20], [10, 30, 20], [20, 25, 15]])
+    connection3 = np.array([
+        [0, 0, 0, 15], [0, 0, 1, 10], [0, 0, 2, 5], [0, 1, 0, 5], [0, 1, 1, 10], [0, 1, 2, 5],
+        [0, 2, 0, 5], [0, 2, 2, 5],
+        [1, 0, 0, 10], [1, 0, 1, 10], [1, 0, 2, 5], [1, 1, 0, 5], [1, 1, 1, 5], [1, 1, 2, 5],
+        [1, 2, 1, 15], [1, 2, 2, 5],
+        [2, 0, 0, 5], [2, 0, 1, 5], [2, 1, 0, 5], [2, 1, 1, 20], [2, 1, 2, 5], [2, 2, 0, 10], [2, 2, 2, 10],
+    ])
+    fig3 = sankey_diagram(data3, connection3, ['#00FF00', '#FFFF00'])
+    plt.show()
+
+    # 测试用例3: 每层 2000 个节点的随机稀疏流量，使用默认颜色
+    rng = np.random.default_rng(0)
+    n_layers, n_nodes, n_edges = 4, 2000, 20000
+    layer = rng.integers(0, n_layers - 1, n_edges)
+    connection = (layer, rng.integers(0, n_nodes, n_edges), rng.integers(0, n_nodes, n_edges), rng.random(n_edges))
+    fig = sankey_diagram(rng.random((n_layers, n_nodes)) + 0.1, connection)
+    plt.show()
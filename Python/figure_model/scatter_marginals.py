@@ -0,0 +1,313 @@
+import collections.abc
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from .colors import map_colors
+from .data_source import as_array, chunked_min_max, iter_chunks
+from .figure_pool import new_figure
+from .profiling import start_call
+from .quantile_sketch import EXACT_LIMIT, QuantileSketch, box_stats
+from .raster import axes_pixel_shape, draw_raster, rasterize_points, shade_raster, use_raster
+
+# 默认颜色：散点按 x 坐标映射的渐变（近似 viridis），边缘图使用 Matlab 默认蓝色
+DEFAULT_STOPS = ('#440154', '#3B528B', '#21908D', '#5DC963', '#FDE725')
+DEFAULT_MARGIN_COLOR = '#0072BD'
+
+# marginal_summary 的输出
+# n: 样本点数；x_hist / y_hist: 两个坐标的直方图计数（未请求时为 None）；
+# x_sketch / y_sketch: 两个坐标的 QuantileSketch（未请求时为 None）；
+# density: 中心散点的像素聚合结果，即 rasterize_points 的输出（未请求时为 None）；
+# points: 迭代器输入且要求收集时得到的 k x 2 点坐标（其余情况为 None）
+MarginalSummary = namedtuple('MarginalSummary', ['n', 'x_hist', 'y_hist', 'x_sketch', 'y_sketch', 'density', 'points'])
+
+
+def scatter_with_histograms(data_matrix, colormap_param=None, bins=10, raster='auto', lim=None, chunk_rows=None):
+    """
+    绘制带边缘直方图的散点图
+    主图为散点图（颜色按 x 坐标映射），右侧为 y 的横向直方图，下方为 x 的翻转直方图。
+    直方图使用固定边界分块累加，与中心散点的像素聚合在同一遍读取中完成，
+    数据可以是 np.memmap、数据文件或按块产生数据的迭代器，内存只与块大小和输出像素数有关。
+
+    输入参数：
+        data_matrix: n x 2 矩阵，每行是一个数据点的 [x, y] 坐标；也可以是 np.memmap、
+                     数据文件路径（见 data_source.load_array），或依次产生 k x 2 数组的迭代器
+        colormap_param: 可选，颜色参数，可以是：
+                        - None：散点使用默认渐变色，直方图使用 Matlab 默认蓝色
+                        - 2 元素或 3 元素列表：生成经过这些颜色的渐变色并按 x 轴映射，直方图使用第一个颜色
+        bins: 可选，直方图箱数，默认 10
+        raster: 可选，中心散点是否聚合为密度栅格：'auto'（点数达到 100 万或输入为迭代器时聚合，默认）、True 或 False
+        lim: 可选，((x_min, x_max), (y_min, y_max))，数据范围；缺省时分块计算（多读一遍数据），
+             输入为迭代器时必须给出
+        chunk_rows: 可选，分块读取时每块的行数
+
+    输出：
+        fig: matplotlib 图窗对象
+
+    示例：
+        data = np.random.randn(100, 2)
+        fig = scatter_with_histograms(data, ['#ff0000', '#0000ff'])
+
+        data = np.load('points.npy', mmap_mode='r')      # 5000 万行也只读取一遍
+        fig = scatter_with_histograms(data, lim=((-5, 5), (-5, 5)))
+    """
+    return _scatter_with_marginals('scatter_with_histograms', data_matrix, colormap_param, raster, lim,
+                                   chunk_rows, bins=int(bins))
+
+
+def scatter_with_boxplot(data_matrix, colormap_param=None, raster='auto', lim=None, chunk_rows=None,
+                         exact_limit=EXACT_LIMIT):
+    """
+    绘制带边缘箱线图的散点图
+    主图为散点图（颜色按 x 坐标映射），右侧为 y 的竖向箱线图，下方为 x 的翻转横向箱线图
+    （须线长度为 1.5 倍四分位距，之外的点画为离群点）。
+    四分位数来自分块更新的分位数草图（见 quantile_sketch.QuantileSketch）：点数不超过 exact_limit 时为精确值，
+    超过后为近似值，与中心散点的像素聚合在同一遍读取中完成。
+
+    输入参数：
+        data_matrix: n x 2 矩阵，每行是一个数据点的 [x, y] 坐标；也可以是 np.memmap、
+                     数据文件路径（见 data_source.load_array），或依次产生 k x 2 数组的迭代器
+        colormap_param: 可选，颜色参数，可以是：
+                        - None：散点使用默认渐变色，箱线图使用 Matlab 默认蓝色
+                        - 2 元素或 3 元素列表：生成经过这些颜色的渐变色并按 x 轴映射，箱线图使用第一个颜色
+        raster: 可选，中心散点是否聚合为密度栅格：'auto'（点数达到 100 万或输入为迭代器时聚合，默认）、True 或 False
+        lim: 可选，((x_min, x_max), (y_min, y_max))，数据范围；缺省时分块计算（多读一遍数据），
+             输入为迭代器时必须给出
+        chunk_rows: 可选，分块读取时每块的行数
+        exact_limit: 可选，精确计算分位数的点数上限，默认 100 万
+
+    输出：
+        fig: matplotlib 图窗对象
+
+    示例：
+        data = np.random.randn(100, 2)
+        fig = scatter_with_boxplot(data, ['#ff0000', '#0000ff'])
+    """
+    return _scatter_with_marginals('scatter_with_boxplot', data_matrix, colormap_param, raster, lim,
+                                   chunk_rows, exact_limit=exact_limit)
+
+
+def marginal_summary(data, lim, bins=None, quantiles=False, raster_extent=None, raster_shape=None,
+                     collect=False, chunk_rows=None, exact_limit=EXACT_LIMIT):
+    """
+    一遍分块读取散点数据，同时累加两个坐标的固定边界直方图、分位数草图与中心散点的像素聚合
+    每块数据只在内存中出现一次，整体内存只与块大小、直方图与像素网格大小有关。
+
+    输入参数：
+        data: n x 2 数组（可以是 np.memmap 或数据文件路径），或依次产生 k x 2 数组的迭代器
+        lim: ((x_min, x_max), (y_min, y_max))，直方图的范围；范围之外的点不计入直方图
+        bins: 可选，直方图的箱数；None 时不计算直方图
+        quantiles: 可选，是否计算两个坐标的分位数草图
+        raster_extent: 可选，(x0, x1, y0, y1)，像素聚合覆盖的数据范围
+        raster_shape: 可选，(ny, nx)，像素网格尺寸；None 时不做像素聚合
+        collect: 可选，迭代器输入时是否收集全部点（用于逐点绘制）
+        chunk_rows: 可选，数组输入时每块的行数
+        exact_limit: 可选，分位数草图的精确模式上限
+
+    输出：
+        MarginalSummary
+    """
+    (x0, x1), (y0, y1) = _widen(lim[0]), _widen(lim[1])
+    x_hist = None if bins is None else np.zeros(bins, dtype=np.int64)
+    y_hist = None if bins is None else np.zeros(bins, dtype=np.int64)
+    x_sketch = QuantileSketch(exact_limit=exact_limit) if quantiles else None
+    y_sketch = QuantileSketch(exact_limit=exact_limit, seed=1) if quantiles else None
+    density = None
+    collected = [] if collect else None
+    n = 0
+
+    chunks = data if is_stream(data) else iter_chunks(as_array(data, 'data'), chunk_rows)
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=float)
+        if chunk.ndim != 2 or chunk.shape[1] != 2:
+            raise ValueError('data 的每一块都必须是 k x 2 数组')
+        n += len(chunk)
+        x, y = chunk[:, 0], chunk[:, 1]
+        if bins is not None:
+            # 给出 range 与整数箱数时 np.histogram 使用等宽箱的快速路径
+            x_hist += np.histogram(x, bins=bins, range=(x0, x1))[0]
+            y_hist += np.histogram(y, bins=bins, range=(y0, y1))[0]
+        if quantiles:
+            x_sketch.update(x)
+            y_sketch.update(y)
+        if raster_shape is not None:
+            density = rasterize_points(chunk, raster_extent, raster_shape, out=density)
+        if collect:
+            collected.append(chunk)
+    points = None
+    if collect:
+        points = np.concatenate(collected) if collected else np.empty((0, 2))
+    return MarginalSummary(n, x_hist, y_hist, x_sketch, y_sketch, density, points)
+
+
+def is_stream(data):
+    """
+    判断输入是否为按块产生数据的迭代器（如生成器），而不是数组、列表或文件路径
+    """
+    return isinstance(data, collections.abc.Iterator) and not isinstance(data, (np.ndarray, str, os.PathLike))
+
+
+def _scatter_with_marginals(chart, data_matrix, colormap_param, raster, lim, chunk_rows, bins=None,
+                            exact_limit=EXACT_LIMIT):
+    """
+    scatter_with_histograms 与 scatter_with_boxplot 的共同实现（bins 为 None 时绘制箱线图）
+    """
+    timer = start_call(chart)
+
+    stream = is_stream(data_matrix)
+    if not stream:
+        data_matrix = as_array(data_matrix, 'data_matrix')
+        if data_matrix.ndim != 2 or data_matrix.shape[1] != 2:
+            raise ValueError('data_matrix 必须是 n x 2 矩阵')
+    if lim is None:
+        if stream:
+            raise ValueError('data_matrix 为迭代器时必须给出 lim')
+        lo, hi = chunked_min_max(data_matrix, chunk_rows)
+        if lo is None:
+            raise ValueError('data_matrix 不能为空')
+        lim = ((lo[0], hi[0]), (lo[1], hi[1]))
+    (x_lo, x_hi), (y_lo, y_hi) = (float(lim[0][0]), float(lim[0][1])), (float(lim[1][0]), float(lim[1][1]))
+    timer.mark('input')
+
+    # 颜色处理：渐变色按 x 坐标映射，边缘图使用第一个颜色
+    if colormap_param is None or (isinstance(colormap_param, (list, tuple)) and len(colormap_param) == 0):
+        stops = DEFAULT_STOPS
+        margin_color = DEFAULT_MARGIN_COLOR
+    elif isinstance(colormap_param, (list, tuple)) and len(colormap_param) in (2, 3):
+        stops = tuple(colormap_param)
+        margin_color = colormap_param[0]
+    else:
+        raise ValueError('colormap_param 必须为空或 2 元素、3 元素颜色列表')
+    timer.mark('colors')
+
+    # 创建图窗：主散点图、右侧与下方的边缘图（位置与 Matlab 版本相同）
+    if bins is not None:
+        fig, ax = new_figure((8, 6), window_title='散点图与直方图', position=[0.1, 0.35, 0.55, 0.55])
+        ax_right = fig.add_axes([0.7, 0.35, 0.2, 0.55])
+        ax_bottom = fig.add_axes([0.1, 0.1, 0.55, 0.2])
+    else:
+        fig, ax = new_figure((9, 7), window_title='散点图与箱线图', position=[0.1, 0.35, 0.5, 0.55])
+        ax_right = fig.add_axes([0.65, 0.35, 0.25, 0.55])
+        ax_bottom = fig.add_axes([0.1, 0.1, 0.5, 0.2])
+    timer.mark('figure')
+
+    # 轴范围：数据范围四周各留 10%
+    x_range = x_hi - x_lo if x_hi > x_lo else 1.0
+    y_range = y_hi - y_lo if y_hi > y_lo else 1.0
+    xlim = (x_lo - 0.1 * x_range, x_hi + 0.1 * x_range)
+    ylim = (y_lo - 0.1 * y_range, y_hi + 0.1 * y_range)
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+    ax.grid(True)
+    ax.set_axisbelow(True)  # 网格线在数据下方（与 Matlab 相同）
+    timer.mark('limits')
+
+    # 一遍读取数据：边缘直方图 / 分位数草图与中心散点的像素聚合同时累加
+    aggregate = (raster == 'auto' or bool(raster)) if stream else use_raster(raster, len(data_matrix))
+    shape = axes_pixel_shape(ax) if aggregate else None
+    extent = (*xlim, *ylim)
+    summary = marginal_summary(data_matrix, ((x_lo, x_hi), (y_lo, y_hi)), bins=bins, quantiles=bins is None,
+                               raster_extent=extent, raster_shape=shape, collect=stream and not aggregate,
+                               chunk_rows=chunk_rows, exact_limit=exact_limit)
+    timer.mark('summary')
+
+    # 中心散点：聚合时按像素列中心的 x 坐标取色，用一个 imshow 显示；否则逐点绘制
+    if aggregate:
+        x_centers = xlim[0] + (np.arange(shape[1]) + 0.5) * (xlim[1] - xlim[0]) / shape[1]
+        column_colors = map_colors(x_centers, stops, x_lo, x_hi)[:, :3]
+        density = summary.density[0] if summary.density is not None else np.zeros(shape[0] * shape[1])
+        image = draw_raster(ax, shade_raster(density, shape, 1.0, column_colors=column_colors), extent)
+        image.set_zorder(1)
+    else:
+        points = summary.points if stream else data_matrix
+        colors = map_colors(points[:, 0], stops, x_lo, x_hi)[:, :3]
+        ax.scatter(points[:, 0], points[:, 1], s=50, c=colors, edgecolors='none')
+
+    # 边缘图
+    if bins is not None:
+        x_edges = np.linspace(*_widen((x_lo, x_hi)), bins + 1)
+        y_edges = np.linspace(*_widen((y_lo, y_hi)), bins + 1)
+        ax_right.barh(y_edges[:-1], summary.y_hist, height=np.diff(y_edges), align='edge',
+                      color=margin_color, edgecolor='none')
+        ax_bottom.bar(x_edges[:-1], summary.x_hist, width=np.diff(x_edges), align='edge',
+                      color=margin_color, edgecolor='none')
+        ax_right.set_yticks([])
+        ax_bottom.set_xticks([])
+    else:
+        _draw_box(ax_right, box_stats(summary.y_sketch), margin_color, True)
+        _draw_box(ax_bottom, box_stats(summary.x_sketch), margin_color, False)
+        ax_right.set_xlim(0.5, 1.5)
+        ax_bottom.set_ylim(0.5, 1.5)
+        for a in (ax_right, ax_bottom):
+            a.set_xticklabels([])
+            a.set_yticklabels([])
+    # 右侧图的 y 轴放在右边，下方图的 x 轴放在上边且 y 轴向下
+    ax_right.yaxis.tick_right()
+    ax_right.set_ylim(ylim)
+    ax_bottom.xaxis.tick_top()
+    ax_bottom.set_xlim(xlim)
+    ax_bottom.invert_yaxis()
+    timer.mark('artists')
+
+    timer.finish(fig)
+    return fig
+
+
+def _draw_box(ax, stats, color, vertical, position=1.0, width=0.5):
+    """
+    用一个 LineCollection 绘制单个箱线图（箱体、中位线、虚线须线与端线），离群点画为黑色 '+'
+    vertical 为 True 时数值沿 y 轴，否则沿 x 轴
+    """
+    from matplotlib.collections import LineCollection
+
+    if np.isnan(stats['med']):
+        return
+    p0, p1 = position - width / 2, position + width / 2
+    c0, c1 = position - width / 4, position + width / 4
+    q1, med, q3, lo, hi = stats['q1'], stats['med'], stats['q3'], stats['whislo'], stats['whishi']
+    # 局部坐标 (位置, 数值)
+    segments = np.array([
+        [[p0, q1], [p1, q1]], [[p1, q1], [p1, q3]], [[p1, q3], [p0, q3]], [[p0, q3], [p0, q1]],  # 箱体
+        [[p0, med], [p1, med]],                                                                # 中位线
+        [[position, q3], [position, hi]], [[position, q1], [position, lo]],                    # 须线
+        [[c0, hi], [c1, hi]], [[c0, lo], [c1, lo]],                                            # 端线
+    ])
+    linewidths = [1.5] * 5 + [0.5] * 4
+    linestyles = ['-'] * 5 + ['--'] * 2 + ['-'] * 2
+    fliers = np.column_stack((np.full(len(stats['fliers']), position), stats['fliers']))
+    if not vertical:
+        segments = segments[..., ::-1]
+        fliers = fliers[:, ::-1]
+    ax.add_collection(LineCollection(segments, colors=[color], linewidths=linewidths, linestyles=linestyles),
+                      autolim=False)
+    ax.plot(fliers[:, 0], fliers[:, 1], linestyle='none', marker='+', color='k')
+
+
+def _widen(lim):
+    # 范围为一个点时向两侧各扩展 0.5，与 np.histogram 对常数数据的处理相同
+    lo, hi = float(lim[0]), float(lim[1])
+    if not hi > lo:
+        lo, hi = lo - 0.5, hi + 0.5
+    return lo, hi
+
+
+# 测试代码
+if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+
+    np.random.seed(0)
+    data = np.random.randn(100, 2)
+
+    # 例子1：默认颜色
+    fig = scatter_with_histograms(data)
+    plt.show()
+
+    # 例子2：红到蓝渐变
+    fig = scatter_with_boxplot(data, ['#ff0000', '#0000ff'])
+    plt.show()
+
+    # 例子3：按块产生的 500 万个点，中心散点聚合为密度栅格，只读取一遍
+    chunks = (np.random.randn(500_000, 2) * [1, 2] for _ in range(10))
+    fig = scatter_with_boxplot(chunks, ['#FEAC5E', '#C779D0', '#4BC0C8'], lim=((-5, 5), (-10, 10)))
+    plt.show()
@@ -0,0 +1,88 @@
+import numpy as np
+
+from .data_source import as_array, chunked_min_max
+
+# 默认每个网格桶的平均点数
+POINTS_PER_CELL = 16
+# 网格每边的最大桶数
+MAX_GRID_SIDE = 2048
+
+
+class GridIndex:
+    """
+    二维点的均匀网格桶索引
+    按点所在的网格桶（行优先）排序后保存点坐标与每个桶的起点（CSR 结构）。窗口查询时，
+    窗口覆盖的每一行桶在排序后的数组中是一段连续区间，只需按行取切片，
+    查询耗时与窗口内的点数成正比，与总点数无关。
+
+    输入参数：
+        xy: n x 2 数组（也可以是 np.memmap 或数据文件路径，见 data_source.as_array）
+        grid_side: 可选，网格每边的桶数，默认使每个桶平均约 POINTS_PER_CELL 个点
+
+    属性：
+        xy: 按桶排序后的 n x 2 坐标
+        order: 排序后第 i 个点在原数组中的下标
+        bounds: ((x_min, y_min), (x_max, y_max))
+
+    示例：
+        index = GridIndex(points)
+        pos = index.query(10, 20, 30, 40)          # 中心落在窗口内的点（排序后的位置）
+        ids = index.order[pos]                      # 对应原数组中的下标
+    """
+
+    def __init__(self, xy, grid_side=None):
+        xy = as_array(xy, 'xy')
+        if xy.ndim != 2 or xy.shape[1] != 2:
+            raise ValueError('xy 必须是 n x 2 数组')
+        n = len(xy)
+        if grid_side is None:
+            grid_side = int(np.clip(np.ceil(np.sqrt(n / POINTS_PER_CELL)), 1, MAX_GRID_SIDE))
+        self.grid_side = int(grid_side)
+        lo, hi = chunked_min_max(xy) if n else (np.zeros(2), np.ones(2))
+        self.bounds = (lo, hi)
+        span = np.asarray(hi, dtype=float) - lo
+        # 所有点某一维坐标相同时，该维只有一个有效桶
+        self._cell_size = np.where(span > 0, span, 1.0) / self.grid_side
+        self._origin = np.asarray(lo, dtype=float)
+
+        cell = self._cells(xy)
+        self.order = np.argsort(cell, kind='stable')
+        self.xy = np.asarray(xy[self.order], dtype=float)
+        counts = np.bincount(cell, minlength=self.grid_side ** 2)
+        self._starts = np.concatenate(([0], np.cumsum(counts)))
+
+    def __len__(self):
+        return len(self.order)
+
+    def query(self, x_min, x_max, y_min, y_max):
+        """
+        返回中心可能落在窗口 [x_min, x_max] x [y_min, y_max] 内的点在排序后数组中的位置
+        结果是窗口覆盖的所有桶内的点（桶边界处可能多出少量窗口外的点，需要精确判断时由调用方再筛选）。
+        """
+        g = self.grid_side
+        (x_lo, y_lo), (x_hi, y_hi) = self.bounds
+        # 空索引、反向（空）窗口或与数据范围不相交的窗口
+        if len(self) == 0 or x_min > x_max or y_min > y_max or \
+                x_min > x_hi or x_max < x_lo or y_min > y_hi or y_max < y_lo:
+            return np.zeros(0, dtype=np.int64)
+        cx0, cy0 = self._cell_xy(x_min, y_min)
+        cx1, cy1 = self._cell_xy(x_max, y_max)
+        # 每一行桶 [cx0, cx1] 在排序后的数组中对应一个连续区间 [lo, hi)
+        rows = np.arange(cy0, cy1 + 1) * g
+        lo = self._starts[rows + cx0]
+        hi = self._starts[rows + cx1 + 1]
+        lengths = hi - lo
+        # 把各行区间拼接为一个位置数组：每段的起点加上段内偏移
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        return np.repeat(lo - offsets, lengths) + np.arange(lengths.sum())
+
+    def _cell_xy(self, x, y):
+        c = np.floor((np.array([x, y], dtype=float) - self._origin) / self._cell_size)
+        c = np.clip(c, 0, self.grid_side - 1).astype(np.int64)
+        return c[0], c[1]
+
+    def _cells(self, xy):
+        # 每个点所在桶的行优先编号
+        c = np.floor((np.asarray(xy, dtype=float) - self._origin) / self._cell_size)
+        c = np.clip(np.nan_to_num(c), 0, self.grid_side - 1).astype(np.int64)
+        return c[:, 1] * self.grid_side + c[:, 0]
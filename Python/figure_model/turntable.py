@@ -0,0 +1,267 @@
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .data_source import as_array
+from .figure_pool import FigurePool
+
+# 工作进程内的图窗与共享内存句柄，见 _init_worker
+_worker = {}
+
+
+def turntable_path(n_frames=36, elev=30, azim=-40, sweep=360, elev_swing=0):
+    """
+    生成转台动画的视角序列：方位角从 azim 开始匀速转过 sweep 度，
+    仰角可以围绕 elev 正弦摆动 elev_swing 度
+
+    输入参数：
+        n_frames: 帧数
+        elev, azim: 起始仰角与方位角（度），默认与 filled_3D_line 相同
+        sweep: 方位角转过的总角度，默认 360（不含终点，首尾帧衔接成循环）
+        elev_swing: 仰角摆动幅度，默认 0
+
+    输出：
+        [(elev, azim), ...] 列表，长度为 n_frames
+    """
+    phase = np.arange(n_frames) / max(n_frames, 1)
+    elevs = elev + elev_swing * np.sin(2 * np.pi * phase)
+    azims = azim + sweep * phase
+    return list(zip(elevs.tolist(), azims.tolist()))
+
+
+def export_views(data, timeVector, views, output, fill_colors=None, categories=None,
+                 fps=12, dpi=None, workers=None, ffmpeg=None, resample=None, agg='mean', band=False):
+    """
+    从多个视角导出 filled_3D_line 图表：PNG 序列、GIF 或 MP4
+    图形只构建一次（每个工作进程一次），之后每一帧只改变视角并重新投影（static_view 模式，见 set_view），
+    不再重复构建多边形、边线与字体。数据矩阵与时间向量放在共享内存中，工作进程直接映射，
+    每一帧的任务只传递视角，不会重复 pickle 数据。
+
+    输入参数：
+        data, timeVector, fill_colors, categories, resample, agg, band: 同 filled_3D_line
+        views: 视角列表 [(elev, azim), ...]，如 turntable_path(72)
+        output: 输出路径，按形式决定输出格式：
+                - 以 .gif / .mp4 结尾：动画（ffmpeg 可用时用 ffmpeg 编码；GIF 在没有 ffmpeg 时用 Pillow，
+                  MP4 必须有 ffmpeg）
+                - 含有 {} 占位符的路径（如 'frames/view_{:03d}.png'）：按帧序号格式化的 PNG 序列
+                - 其他：目录，帧保存为其中的 view_0000.png、view_0001.png ...
+        fps: 可选，动画帧率，默认 12
+        dpi: 可选，帧的分辨率，默认使用图窗自身的 dpi
+        workers: 可选，工作进程数，默认为 CPU 核数；为 1 时在当前进程内渲染
+        ffmpeg: 可选，ffmpeg 可执行文件路径；默认在 PATH 中查找，为 False 时不使用 ffmpeg
+
+    输出：
+        动画为输出文件路径；PNG 序列为按帧顺序的文件路径列表
+
+    示例：
+        export_views(data, timeVector, turntable_path(72), 'turntable.gif', fps=24)
+        export_views(data, timeVector, [(30, -40), (20, 30), (60, -90)], 'views/')
+        export_views(minute_data, minute_times, turntable_path(72), 'turntable.mp4', resample='day', band=True)
+    """
+    data = np.ascontiguousarray(as_array(data, 'data'), dtype=float)
+    if data.ndim != 2:
+        raise ValueError('data 必须是 n_time x n_cat 矩阵')
+    if timeVector is None or len(timeVector) != data.shape[0]:
+        raise ValueError('时间向量长度必须与数据的时间点数一致')
+    views = [(float(elev), float(azim)) for elev, azim in views]
+    if len(views) == 0:
+        raise ValueError('views 不能为空')
+    # 在启动工作进程前检查，避免初始化失败时进程池整体中断
+    if band and resample is None:
+        raise ValueError('band 需要与 resample 一起使用')
+
+    # 日期时间向量（datetime 列表或 datetime64 数组）以 matplotlib 日期数值共享，工作进程中再转换回 datetime64
+    is_datetime = np.issubdtype(np.asarray(timeVector).dtype, np.datetime64) or isinstance(timeVector[0], datetime)
+    if is_datetime:
+        import matplotlib.dates as mdates
+        t = mdates.date2num(timeVector)
+    else:
+        t = np.asarray(timeVector)
+    t = np.ascontiguousarray(t, dtype=float)
+
+    ext = os.path.splitext(output)[1].lower()
+    if ext in ('.gif', '.mp4'):
+        if ffmpeg is None:
+            ffmpeg = shutil.which('ffmpeg')
+        if ext == '.mp4' and not ffmpeg:
+            raise RuntimeError('未找到 ffmpeg，无法导出 MP4；可以改为导出 GIF 或 PNG 序列')
+        paths = [None] * len(views)
+        out_dirs = {os.path.dirname(output)}
+    else:
+        paths = _frame_paths(output, len(views))
+        out_dirs = {os.path.dirname(path) for path in paths}
+    for out_dir in out_dirs - {''}:
+        os.makedirs(out_dir, exist_ok=True)
+
+    init_args = (fill_colors, categories, dpi, is_datetime, resample, agg, band)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        _setup(data, t, *init_args)
+        try:
+            return _write(map(_render_frame, views, paths), output, paths, fps, ffmpeg)
+        finally:
+            _worker.clear()
+
+    blocks = []
+    try:
+        for array in (data, t):
+            blocks.append(_to_shared(array))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=([spec for _, spec in blocks],) + init_args) as executor:
+            frames = executor.map(_render_frame, views, paths, chunksize=max(1, len(views) // (4 * workers)))
+            return _write(frames, output, paths, fps, ffmpeg)
+    finally:
+        for shm, _ in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def _frame_paths(output, n):
+    # 含 {} 占位符时按帧序号格式化，否则视为目录
+    if '{' in output:
+        return [output.format(i) for i in range(n)]
+    return [os.path.join(output, f'view_{i:04d}.png') for i in range(n)]
+
+
+def _to_shared(array):
+    """
+    把数组复制到新建的共享内存块，返回 (SharedMemory, (名称, 形状, dtype))
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _init_worker(specs, fill_colors, categories, dpi, is_datetime, resample, agg, band):
+    """
+    工作进程初始化：切换到 Agg 后端，映射共享内存中的数据并构建一次图窗
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    handles, arrays = [], []
+    for name, shape, dtype in specs:
+        shm = shared_memory.SharedMemory(name=name)
+        handles.append(shm)
+        arrays.append(np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+    _setup(*arrays, fill_colors, categories, dpi, is_datetime, resample, agg, band)
+    # 共享内存句柄随进程保留，保证数组视图在进程生命周期内有效
+    _worker['handles'] = handles
+
+
+def _setup(data, t, fill_colors, categories, dpi, is_datetime, resample=None, agg='mean', band=False):
+    """
+    以 static_view 模式构建图窗并保存在 _worker 中
+    图窗取自 FigurePool（Figure + FigureCanvasAgg），不进入 pyplot 的图窗注册表
+    """
+    from .filled_3D_line import filled_3D_line
+
+    if is_datetime:
+        import matplotlib.dates as mdates
+        # 向量化转换为 datetime64（微秒精度），避免 num2date 逐个构造 datetime 对象
+        epoch = np.datetime64(mdates.get_epoch(), 'us')
+        timeVector = epoch + np.round(t * 86400e6).astype('timedelta64[us]')
+    else:
+        timeVector = t
+    with FigurePool().activate():
+        fig = filled_3D_line(data, timeVector, fill_colors, categories, static_view=True,
+                             resample=resample, agg=agg, band=band)
+    if dpi is not None:
+        fig.set_dpi(dpi)
+    _worker['fig'] = fig
+
+
+def _render_frame(view, path):
+    """
+    按视角渲染一帧：path 不为 None 时保存为 PNG 并返回路径，否则返回 (宽, 高, RGB 字节)
+    """
+    from .filled_3D_line import set_view
+
+    fig = _worker['fig']
+    set_view(fig, *view)
+    if path is not None:
+        fig.savefig(path)
+        return path
+    fig.canvas.draw()
+    rgba = np.asarray(fig.canvas.buffer_rgba())
+    return rgba.shape[1], rgba.shape[0], rgba[:, :, :3].tobytes()
+
+
+def _write(frames, output, paths, fps, ffmpeg):
+    """
+    消费按顺序产生的帧：PNG 序列已由工作进程写出，动画交给 ffmpeg 或 Pillow 编码
+    """
+    if paths[0] is not None:
+        return list(frames)
+    if ffmpeg:
+        _write_ffmpeg(frames, output, fps, ffmpeg)
+    else:
+        _write_gif_pillow(frames, output, fps)
+    return output
+
+
+def _write_ffmpeg(frames, output, fps, ffmpeg):
+    """
+    把原始 RGB 帧通过管道写入 ffmpeg 编码为 GIF 或 MP4
+    """
+    frames = iter(frames)
+    width, height, first = next(frames)
+    if output.lower().endswith('.gif'):
+        # 先由全部帧生成调色板再映射，颜色比逐帧量化更稳定
+        codec = ['-filter_complex', '[0:v]split[a][b];[a]palettegen[p];[b][p]paletteuse', '-loop', '0']
+    else:
+        # H.264 的 yuv420p 要求宽高为偶数
+        codec = ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-c:v', 'libx264', '-pix_fmt', 'yuv420p']
+    command = [ffmpeg, '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+               '-s', f'{width}x{height}', '-r', str(fps), '-i', '-'] + codec + [output]
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        process.stdin.write(first)
+        for _, _, frame in frames:
+            process.stdin.write(frame)
+        process.stdin.close()
+    except BrokenPipeError:
+        pass
+    finally:
+        stderr = process.stderr.read()
+        process.wait()
+    if process.returncode != 0:
+        raise RuntimeError(f'ffmpeg 编码失败: {stderr.decode(errors="replace").strip()}')
+
+
+def _write_gif_pillow(frames, output, fps):
+    """
+    没有 ffmpeg 时用 Pillow 写 GIF：每帧到达时即量化为调色板图像，内存中不保留 RGB 帧
+    """
+    from PIL import Image
+
+    images = [Image.frombytes('RGB', (width, height), frame).quantize(method=Image.Quantize.FASTOCTREE)
+              for width, height, frame in frames]
+    images[0].save(output, save_all=True, append_images=images[1:],
+                   duration=int(round(1000 / fps)), loop=0, optimize=False)
+
+
+# 测试代码：导出转台 GIF 与多视角 PNG 序列
+if __name__ == '__main__':
+    import tempfile
+    import time
+
+    from datetime import timedelta
+
+    rng = np.random.default_rng(42)
+    n_time, n_cat = 500, 6
+    data = np.abs(np.cumsum(rng.standard_normal((n_time, n_cat)), axis=0)) + 1
+    timeVector = [datetime(2023, 1, 1) + timedelta(days=i) for i in range(n_time)]
+
+    out_dir = tempfile.mkdtemp()
+    start = time.perf_counter()
+    gif = export_views(data, timeVector, turntable_path(36), os.path.join(out_dir, 'turntable.gif'))
+    print(f'GIF: {gif}（{time.perf_counter() - start:.2f}s）')
+    start = time.perf_counter()
+    pngs = export_views(data, timeVector, [(30, -40), (20, 30), (60, -90)], os.path.join(out_dir, 'views'))
+    print(f'PNG 序列: {len(pngs)} 帧（{time.perf_counter() - start:.2f}s）')
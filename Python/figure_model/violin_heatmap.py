@@ -0,0 +1,250 @@
+import numpy as np
+
+from .data_source import as_array
+from .figure_pool import new_figure
+from .font_cache import get_chinese_font
+from .kde import DEFAULT_GRID_SIZE, binned_quantiles, column_kde, density_at
+from .profiling import start_call
+
+# 每个小提琴轮廓单侧的点数（与 Matlab ksdensity 默认的 100 个估计点相同）
+_VIOLIN_POINTS = 100
+
+# 热图每个扇形单元沿弧线的细分段数（与 Matlab 版本每段弧线 30 个点相同）
+_ARC_SEGMENTS = 29
+
+
+def violin_heatmap(data, vdata, row_names=None, col_names=None, cmap='summer', width=0.9,
+                   vlim=None, vtick=None, grid_size=DEFAULT_GRID_SIZE):
+    """
+    绘制扇形小提琴热力图
+    内侧为 nrow 行 x ncol 列的扇形热图（如各年份 x 各月份的均值），外侧沿每列的射线绘制该列全部样本的小提琴图
+    （如各月份的全部日数据），小提琴内画出四分位线与中位线。
+    所有列的核密度一次性估计：样本先分箱到共享网格上，再用批量 FFT 卷积（见 kde.column_kde），
+    每列的计算量只与网格点数有关，每列 10^6 个以上样本时也很快。
+    热图是一个 pcolormesh，所有小提琴是一个 PolyCollection，所有四分位线是一个 LineCollection。
+
+    输入参数：
+        data: nrow x ncol 数组，热图数值；第 0 行画在最外圈
+        vdata: 小提琴图数据，列数与 data 相同，可以是：
+               - k x ncol 数组（可以是 np.memmap 或数据文件路径），NaN 表示缺失
+               - 长度为 ncol 的列表，每个元素是一维样本数组（各列长度可以不同）
+        row_names: 可选，长度为 nrow 的行名称列表，缺省时为 '1'、'2'、...
+        col_names: 可选，长度为 ncol 的列名称列表，缺省时为 '1'、'2'、...
+        cmap: 可选，颜色映射名称（如 'summer'）、Colormap 对象，或至少 2 个颜色组成的列表
+              （如 ['#D67390', '#FFEEEA', '#6B98BF']，生成多色渐变），默认 'summer'
+        width: 可选，小提琴图宽度占列宽的比例，默认 0.9
+        vlim: 可选，小提琴图数值范围 [min, max]，缺省时取 data 与 vdata 的整体范围
+        vtick: 可选，小提琴图刻度位置，缺省时自动计算
+        grid_size: 可选，核密度估计共享网格的点数，默认 512
+
+    输出：
+        fig: matplotlib 图窗对象
+
+    示例：
+        data = np.random.rand(7, 12)
+        vdata = data.mean(axis=0) + np.random.randn(50, 12) * 0.6
+        fig = violin_heatmap(data, vdata, row_names=[str(y) for y in range(2024, 2017, -1)])
+    """
+    timer = start_call('violin_heatmap')
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.colors import Colormap, ListedColormap, Normalize
+    timer.mark('import')
+
+    data = as_array(data, 'data').astype(float, copy=False)
+    if data.ndim != 2:
+        raise ValueError('data 必须是 nrow x ncol 矩阵')
+    nrow, ncol = data.shape
+    row_names = [str(i + 1) for i in range(nrow)] if row_names is None else list(row_names)
+    col_names = [str(j + 1) for j in range(ncol)] if col_names is None else list(col_names)
+    if len(row_names) != nrow or len(col_names) != ncol:
+        raise ValueError('row_names、col_names 的长度必须与 data 的行数、列数一致')
+    timer.mark('input')
+
+    # 所有列的核密度、统计量与分位数一次性计算
+    kde = column_kde(vdata, grid_size=grid_size)
+    if len(kde.n) != ncol:
+        raise ValueError('vdata 的列数必须与 data 相同')
+    has_data = kde.n > 0
+    quartiles = binned_quantiles(kde.grid, kde.counts, [0.25, 0.75, 0.5])
+    timer.mark('density')
+
+    # 数据范围与刻度
+    if vlim is None:
+        vlim = (np.nanmin(np.concatenate((data.ravel(), kde.min))),
+                np.nanmax(np.concatenate((data.ravel(), kde.max))))
+    v0, v1 = float(vlim[0]), float(vlim[1])
+    if not v1 > v0:
+        raise ValueError('vlim 必须满足 vlim[0] < vlim[1]')
+    vtick = _auto_ticks(v0, v1) if vtick is None else np.asarray(vtick, dtype=float)
+
+    # 颜色映射：热图数值与小提琴均值共用一个颜色范围
+    if isinstance(cmap, (list, tuple)):
+        from .colors import gradient_lut
+        cmap = ListedColormap(gradient_lut(tuple(cmap)))
+    elif not isinstance(cmap, (str, Colormap)):
+        raise ValueError('cmap 必须是颜色映射名称、Colormap 对象或颜色列表')
+    c_values = np.concatenate((data.ravel(), kde.mean[has_data]))
+    norm = Normalize(vmin=np.nanmin(c_values), vmax=np.nanmax(c_values))
+    timer.mark('colors')
+
+    # 创建图窗（激活 FigurePool 时复用池中的无界面图窗）
+    fig, ax = new_figure((12, 9), window_title='小提琴热力图', position=[0.05, 0.2, 0.9, 0.8])
+    timer.mark('figure')
+
+    chinese_font = get_chinese_font()
+    font_kw = {'fontproperties': chinese_font, 'fontsize': 16}
+    timer.mark('font')
+
+    # 每列射线的角度（从左上到右上）
+    w = np.pi / 3 / ncol
+    tt = np.linspace(5 * np.pi / 6 - w, np.pi / 6 + w, ncol)
+    cos_t, sin_t = np.cos(tt), np.sin(tt)
+
+    # 射线
+    rays = np.zeros((ncol, 2, 2))
+    rays[:, 1, 0] = 2 * cos_t
+    rays[:, 1, 1] = 2 * sin_t
+    ax.add_collection(LineCollection(rays, colors=[(0.8, 0.8, 0.8)], linewidths=1, linestyles='--'),
+                      autolim=False)
+
+    # 列标签
+    for j in range(ncol):
+        ax.text(cos_t[j] * 2.01, sin_t[j] * 2.01, col_names[j], ha='center', va='bottom',
+                rotation=np.degrees(tt[j]) - 90, rotation_mode='anchor', **font_kw)
+
+    # 行标签：交替放在左右两条刻度轴旁
+    for i in range(nrow):
+        r = 2 / 5 + (nrow - i - 0.5) * 4 / nrow / 5
+        if i % 2 == 0:
+            ax.text(np.cos(5 * np.pi / 6) * r - 1 / 100, np.sin(5 * np.pi / 6) * r - np.sqrt(3) / 100, row_names[i],
+                    ha='right', va='center', rotation=60, rotation_mode='anchor', **font_kw)
+        else:
+            ax.text(np.cos(np.pi / 6) * r + 1 / 100, np.sin(np.pi / 6) * r - np.sqrt(3) / 100, row_names[i],
+                    ha='left', va='center', rotation=-60, rotation_mode='anchor', **font_kw)
+
+    # 刻度轴线、刻度线与刻度标签
+    left_dir = np.array([np.cos(5 * np.pi / 6), np.sin(5 * np.pi / 6)])
+    right_dir = np.array([np.cos(np.pi / 6), np.sin(np.pi / 6)])
+    axis_r = np.array([6 / 5 + 1 / 10, 10 / 5 - 1 / 10])
+    tick_r = _radius(vtick, v0, v1)
+    tick_off_left = np.array([1 / 100, np.sqrt(3) / 100])
+    tick_off_right = np.array([-1 / 100, np.sqrt(3) / 100])
+    left_ticks = tick_r[:, None, None] * left_dir + np.array([[0, 0], tick_off_left])
+    right_ticks = tick_r[:, None, None] * right_dir + np.array([[0, 0], tick_off_right])
+    axes_lines = np.stack((axis_r[:, None] * left_dir, axis_r[:, None] * right_dir))
+    ax.add_collection(LineCollection(np.concatenate((axes_lines, left_ticks, right_ticks)), colors='k', linewidths=1),
+                      autolim=False)
+    for i, (v, r) in enumerate(zip(vtick, tick_r)):
+        label = f'{v:g}'
+        if (len(vtick) - 1 - i) % 2 == 0:
+            x, y = left_dir * r - np.array([1 / 100, np.sqrt(3) / 100])
+            ax.text(x, y, label, ha='right', va='center', rotation=60, rotation_mode='anchor', **font_kw)
+        else:
+            x, y = right_dir * r + np.array([1 / 100, -np.sqrt(3) / 100])
+            ax.text(x, y, label, ha='left', va='center', rotation=-60, rotation_mode='anchor', **font_kw)
+
+    # 小提琴：每列在 [最小值, 最大值] 上取等距点插值密度，沿射线旋转后合并为一个 PolyCollection
+    cols = np.flatnonzero(has_data)
+    half_width = (4 * np.pi / 5 / ncol) * width / 2
+    max_f = kde.density.max() if len(cols) > 0 else 1.0
+    s = np.linspace(0, 1, _VIOLIN_POINTS)
+    y = kde.min[cols, None] + (kde.max[cols] - kde.min[cols])[:, None] * s
+    f = density_at(kde, y, cols) / max_f * half_width
+    xx = np.concatenate((f, -f[:, ::-1]), axis=1)
+    rr = _radius(np.concatenate((y, y[:, ::-1]), axis=1), v0, v1)
+    violins = PolyCollection(_rotate(xx, rr, cos_t[cols, None], sin_t[cols, None]),
+                             array=kde.mean[cols], cmap=cmap, norm=norm, edgecolors='k', linewidths=1)
+    ax.add_collection(violins, autolim=False)
+
+    # 四分位线（细）与中位线（粗）
+    q = quartiles[cols]
+    fq = density_at(kde, q, cols) / max_f * half_width
+    qx = np.stack((fq, -fq), axis=2)
+    qr = np.repeat(_radius(q, v0, v1)[:, :, None], 2, axis=2)
+    q_lines = _rotate(qx.reshape(len(cols) * 3, 2), qr.reshape(len(cols) * 3, 2),
+                      np.repeat(cos_t[cols], 3)[:, None], np.repeat(sin_t[cols], 3)[:, None])
+    ax.add_collection(LineCollection(q_lines, colors='k', linewidths=np.tile([1, 1, 2], len(cols))), autolim=False)
+
+    # 热图：每个扇形单元沿弧线细分，整体作为一个 pcolormesh；第 0 行在最外圈
+    theta = np.linspace(5 * np.pi / 6, np.pi / 6, ncol * _ARC_SEGMENTS + 1)
+    r_edges = 2 / 5 + np.arange(nrow + 1) * 4 / nrow / 5
+    mesh_x = r_edges[:, None] * np.cos(theta)
+    mesh_y = r_edges[:, None] * np.sin(theta)
+    cells = np.repeat(data[::-1], _ARC_SEGMENTS, axis=1)
+    mesh = ax.pcolormesh(mesh_x, mesh_y, cells, cmap=cmap, norm=norm, shading='flat', edgecolors='none')
+
+    # 热图单元之间的白色分隔线：径向线段与各行边界弧线
+    edge_theta = theta[::_ARC_SEGMENTS]
+    radial = np.stack((np.stack((r_edges[0] * np.cos(edge_theta), r_edges[0] * np.sin(edge_theta)), axis=1),
+                       np.stack((r_edges[-1] * np.cos(edge_theta), r_edges[-1] * np.sin(edge_theta)), axis=1)), axis=1)
+    arcs = np.stack((mesh_x, mesh_y), axis=2)
+    ax.add_collection(LineCollection(list(radial) + list(arcs), colors='w', linewidths=1), autolim=False)
+
+    # 最上方弧线
+    top = np.linspace(5 * np.pi / 6, np.pi / 6, 80)
+    ax.plot(np.cos(top) * 2, np.sin(top) * 2, linewidth=1, color='k')
+
+    # 颜色条
+    cax = fig.add_axes([0.5 - 0.01, 0.1, 0.02, 0.2])
+    colorbar = fig.colorbar(mesh, cax=cax)
+    for label in colorbar.ax.get_yticklabels():
+        label.set_fontproperties(chinese_font)
+        label.set_fontsize(16)
+    timer.mark('artists')
+
+    ax.set_xlim(-np.sqrt(3), np.sqrt(3))
+    ax.set_ylim(0, 2)
+    ax.set_aspect('equal')
+    ax.set_axis_off()
+    timer.mark('limits')
+
+    timer.finish(fig)
+    return fig
+
+
+def _radius(v, v0, v1):
+    """
+    将数值映射到小提琴图的半径范围 [1.3, 1.9]
+    """
+    return (np.asarray(v, dtype=float) - v0) / (v1 - v0) * 3 / 5 + 6 / 5 + 1 / 10
+
+
+def _rotate(xx, rr, cos_t, sin_t):
+    """
+    将局部坐标（横向偏移 xx、沿射线的半径 rr）旋转到射线方向，返回 ... x 2 的坐标数组
+    """
+    return np.stack((sin_t * xx + cos_t * rr, -cos_t * xx + sin_t * rr), axis=-1)
+
+
+def _auto_ticks(v0, v1, compact_degree=5):
+    """
+    自动计算较合理的刻度位置（与 Matlab 版本相同：步长取 1、5 乘以 10 的整数次幂附近的值）
+    """
+    step = (v1 - v0) / compact_degree
+    exponent = np.ceil(np.log10(step))
+    step = np.round(np.round(step / 10 ** (exponent - 2)) / 5) * 5 * 10 ** (exponent - 2)
+    if step <= 0:
+        return np.array([v0, v1])
+    # 0 的整数倍中落在 [v0, v1] 内的值
+    ticks = step * np.arange(np.ceil(v0 / step - 1e-9), np.floor(v1 / step + 1e-9) + 1)
+    return np.round(ticks, 12)
+
+
+# 测试代码
+if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+
+    # 例子1：随便构造数据
+    rng = np.random.default_rng(4)
+    data = rng.random((7, 12)) + 1 + np.sin(np.linspace(0, 2 * np.pi, 12) - np.pi / 1.2) + np.arange(1, 8)[:, None] / 12
+    data = data / data.max()
+    vdata = data.mean(axis=0) + rng.standard_normal((50, 12)) * 0.6
+    row_names = [str(y) for y in range(2024, 2017, -1)]
+    col_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    fig = violin_heatmap(data, vdata, row_names, col_names)
+    plt.show()
+
+    # 例子2：每列 100 万个样本，三色渐变
+    vdata = [data[:, j].mean() + rng.standard_normal(1_000_000) * 0.3 for j in range(12)]
+    fig = violin_heatmap(data, vdata, row_names, col_names, cmap=['#D67390', '#FFEEEA', '#6B98BF'])
+    plt.show()
@@ -0,0 +1,8 @@
+import os
+import sys
+
+import matplotlib
+
+# 测试在无界面的 Agg 后端下运行，figure_model 从 Python/ 目录导入
+matplotlib.use('Agg')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+
+import pytest
+
+from figure_model.async_render import AsyncRenderer
+from figure_model.figure_pool import new_figure
+
+# 打开之前 _gated_chart 会阻塞在工作线程中，用于控制渲染何时结束
+_gate = threading.Event()
+_calls = []
+
+
+def _gated_chart(tag):
+    _calls.append(tag)
+    _gate.wait(10)
+    fig, ax = new_figure((2, 2), dpi=50)
+    ax.plot([0, 1], [tag, 0])
+    return fig
+
+
+@pytest.fixture(autouse=True)
+def _reset_gate():
+    _gate.clear()
+    _calls.clear()
+    yield
+    _gate.set()
+
+
+async def _until(condition):
+    while not condition():
+        await asyncio.sleep(0.005)
+
+
+def test_identical_requests_are_merged():
+    async def main():
+        async with AsyncRenderer(max_workers=2, executor='thread') as renderer:
+            n = 5
+            requests = [asyncio.ensure_future(renderer.render(_gated_chart, 1)) for _ in range(n)]
+            await _until(lambda: renderer.merged == n - 1)
+            _gate.set()
+            results = await asyncio.gather(*requests)
+            assert renderer.rendered == 1 and renderer.merged == n - 1
+            assert len(set(results)) == 1 and results[0].startswith(b'\x89PNG')
+            assert _calls == [1]
+
+    asyncio.run(main())
+
+
+def test_max_pending_rejects_with_queue_full():
+    async def main():
+        async with AsyncRenderer(max_workers=1, executor='thread', max_pending=2) as renderer:
+            requests = [asyncio.ensure_future(renderer.render(_gated_chart, tag)) for tag in (1, 2)]
+            await _until(lambda: renderer.pending == 2)
+            with pytest.raises(asyncio.QueueFull):
+                await renderer.render(_gated_chart, 3)
+            assert renderer.rejected == 1
+            # 与排队中的请求相同时直接合并，不受上限限制
+            merged = asyncio.ensure_future(renderer.render(_gated_chart, 1))
+            _gate.set()
+            await asyncio.gather(*requests, merged)
+            assert renderer.rendered == 2 and renderer.merged == 1
+
+    asyncio.run(main())
+
+
+def test_timeout_does_not_cancel_shared_render():
+    async def main():
+        async with AsyncRenderer(max_workers=1, executor='thread') as renderer:
+            patient = asyncio.ensure_future(renderer.render(_gated_chart, 1))
+            await _until(lambda: _calls)
+            with pytest.raises(asyncio.TimeoutError):
+                await renderer.render(_gated_chart, 1, timeout=0.05)
+            assert not patient.done()
+            _gate.set()
+            assert (await patient).startswith(b'\x89PNG')
+            assert renderer.rendered == 1 and renderer.merged == 1
+
+    asyncio.run(main())
+
+
+def test_aclose_cancels_pending_work():
+    async def main():
+        renderer = AsyncRenderer(max_workers=1, executor='thread')
+        running = asyncio.ensure_future(renderer.render(_gated_chart, 1))
+        queued = asyncio.ensure_future(renderer.render(_gated_chart, 2))
+        await _until(lambda: _calls and renderer.pending == 2)
+        closing = asyncio.ensure_future(renderer.aclose())
+        await asyncio.sleep(0.05)
+        # 已开始的渲染无法中断，放行后执行器才能关闭
+        _gate.set()
+        await closing
+        results = await asyncio.gather(running, queued, return_exceptions=True)
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert _calls == [1] and renderer.rendered == 0
+        with pytest.raises(RuntimeError):
+            await renderer.render(_gated_chart, 3)
+
+    asyncio.run(main())
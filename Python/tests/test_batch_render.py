@@ -0,0 +1,50 @@
+import json
+
+import numpy as np
+
+from figure_model.batch_render import load_chart_input, load_manifest, render_batch
+
+
+def _write_manifest(tmp_path, out_dir):
+    rng = np.random.default_rng(0)
+    np.savez(tmp_path / 'bubbles.npz', points=rng.random((200, 2)) * 10, v=rng.random(200))
+    with open(tmp_path / 'groups.json', 'w', encoding='utf-8') as f:
+        json.dump({'center_points': [[1, 2], [3, 4]],
+                   'data_matrix': [[[5, 6], [7, 8]], [[9, 10], [0, 0]]],
+                   'colormap_param': ['#ff6e7f', '#bfe9ff'],
+                   'center_visible': True}, f)
+    jobs = [{'chart': 'bubble_plot', 'input': 'bubbles.npz', 'output': f'{out_dir}/bubbles.png', 'params': {'r': 5}},
+            {'chart': 'diverging_scatter', 'input': 'groups.json', 'output': f'{out_dir}/groups.png', 'dpi': 50}]
+    path = tmp_path / f'{out_dir}.json'
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'jobs': jobs}, f)
+    return path
+
+
+def test_serial_and_process_pool_outputs_are_identical(tmp_path):
+    outputs = {}
+    for workers in (1, 2):
+        jobs, base_dir = load_manifest(_write_manifest(tmp_path, f'out{workers}'))
+        assert base_dir == str(tmp_path)
+        results = render_batch(jobs, workers=workers, base_dir=base_dir)
+        assert [r['index'] for r in results] == [0, 1]
+        assert all(r['ok'] for r in results), [r['error'] for r in results]
+        outputs[workers] = [open(r['output'], 'rb').read() for r in results]
+    assert all(png.startswith(b'\x89PNG') for png in outputs[1])
+    assert outputs[1] == outputs[2]
+
+
+def test_failed_job_is_recorded(tmp_path):
+    np.savez(tmp_path / 'bad.npz', points=np.zeros((3, 5)), v=np.zeros(3))
+    results = render_batch([{'chart': 'bubble_plot', 'input': 'bad.npz', 'output': 'bad.png'}],
+                           workers=1, base_dir=str(tmp_path))
+    assert not results[0]['ok'] and 'ValueError' in results[0]['error']
+    assert not (tmp_path / 'bad.png').exists()
+
+
+def test_npz_datetime64_and_strings_are_converted(tmp_path):
+    np.savez(tmp_path / 'times.npz', timeVector=np.array(['2023-01-01', '2023-01-02'], dtype='datetime64[D]'),
+             categories=np.array(['A', 'B']), data=np.ones((2, 2)))
+    inputs = load_chart_input(str(tmp_path / 'times.npz'))
+    assert [t.day for t in inputs['timeVector']] == [1, 2]
+    assert inputs['categories'] == ['A', 'B'] and isinstance(inputs['data'], np.ndarray)
@@ -0,0 +1,50 @@
+import numpy as np
+
+from figure_model.decimate import minmax_decimate
+
+
+def test_minmax_keeps_extremes_and_endpoints():
+    rng = np.random.default_rng(0)
+    x = np.arange(10_000.0)
+    y = np.cumsum(rng.standard_normal(10_000))
+    x_out, y_out = minmax_decimate(x, y, 100)
+    assert len(x_out) <= 2 * 100 + 2
+    assert x_out[0] == x[0] and x_out[-1] == x[-1]
+    assert np.all(np.diff(x_out) > 0)
+    assert y_out.min() == y.min() and y_out.max() == y.max()
+
+
+def test_minmax_nan_gap_longer_than_bucket():
+    rng = np.random.default_rng(1)
+    x = np.arange(10_000.0)
+    y = rng.standard_normal(10_000)
+    # 缺测段跨过多个完整的桶（每桶 100 个点）
+    y[2_050:4_430] = np.nan
+    x_out, y_out = minmax_decimate(x, y, 100)
+    assert np.all(np.diff(x_out) > 0)
+    # 非缺测部分的极值仍然保留
+    assert np.nanmin(y_out) == np.nanmin(y) and np.nanmax(y_out) == np.nanmax(y)
+    # 缺测段内保留 NaN 点，折线在缺测处断开
+    gap = (x_out >= 2_050) & (x_out < 4_430)
+    assert gap.any() and np.all(np.isnan(y_out[gap]))
+
+
+def test_minmax_all_nan():
+    y = np.full(1_000, np.nan)
+    x_out, y_out = minmax_decimate(np.arange(1_000.0), y, 10)
+    assert np.all(np.isnan(y_out))
+    assert x_out[0] == 0 and x_out[-1] == 999
+
+
+def test_filled_2D_line_downsample_with_nan_gap():
+    import matplotlib.pyplot as plt
+
+    from figure_model.filled_2D_line import filled_2D_line
+
+    x = np.linspace(0, 100, 50_000)
+    y = np.sin(x) + 2
+    y[10_000:30_000] = np.nan
+    data = np.stack((x, y), axis=1)[None, :, :]
+    fig = filled_2D_line(data, downsample=True)
+    fig.canvas.draw()
+    plt.close(fig)
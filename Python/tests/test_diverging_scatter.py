@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from figure_model.diverging_scatter import _centers_from_index, _group_labels, cluster_centers
+
+
+def _labeled_points(label_values, seed=0):
+    # 非连续、未排序的标签，其中最后一个标签只有一个数据点
+    rng = np.random.default_rng(seed)
+    labels = np.concatenate([np.full(size, v) for v, size in zip(label_values[:-1], (5, 8, 3, 12))]
+                            + [label_values[-1:]])
+    perm = rng.permutation(len(labels))
+    return labels[perm], rng.standard_normal((len(labels), 2)) * 3
+
+
+def _reference(labels, xy, method):
+    classes = sorted(set(labels.tolist()))
+    centers = []
+    for c in classes:
+        pts = xy[labels == c]
+        if method == 'centroid':
+            centers.append(np.mean(pts, axis=0))
+        elif method == 'median':
+            centers.append(np.median(pts, axis=0))
+        else:
+            # 逐点计算到类均值的距离，取最近的数据点
+            mean = np.mean(pts, axis=0)
+            dist = [np.hypot(*(p - mean)) for p in pts]
+            centers.append(pts[int(np.argmin(dist))])
+    return np.array(classes), np.array(centers)
+
+
+LABEL_SETS = {
+    'sparse ints': np.array([7, 2, 30, 11, 4]),
+    'negative ints': np.array([3, -5, 0, 9, -1]),
+    'large ints': np.array([10 ** 6, 3, 42, 10 ** 9, 8]),
+    'strings': np.array(['b', 'z', 'a', 'k', 'c']),
+}
+
+
+@pytest.mark.parametrize('method', ['centroid', 'median', 'medoid'])
+@pytest.mark.parametrize('kind', list(LABEL_SETS))
+def test_cluster_centers_match_per_label_loop(kind, method):
+    labels, xy = _labeled_points(LABEL_SETS[kind])
+    classes, centers = cluster_centers(labels, xy, method=method)
+    expected_classes, expected = _reference(labels, xy, method)
+    np.testing.assert_array_equal(classes, expected_classes)
+    np.testing.assert_allclose(centers, expected)
+    # 只有一个数据点的类，中心就是该点本身
+    single = labels == LABEL_SETS[kind][-1]
+    np.testing.assert_allclose(centers[np.searchsorted(classes, LABEL_SETS[kind][-1])], xy[single][0])
+
+
+def test_group_labels_maps_to_sorted_class_indices():
+    for values in LABEL_SETS.values():
+        labels, _ = _labeled_points(values)
+        classes, index = _group_labels(labels)
+        np.testing.assert_array_equal(classes, np.unique(labels))
+        assert index.min() == 0 and index.max() == len(classes) - 1
+        np.testing.assert_array_equal(classes[index], labels)
+
+
+def test_centers_from_index_keeps_empty_classes():
+    # 类索引 1 没有数据点时仍占一行，其余类的中心不受影响
+    index = np.array([2, 0, 2, 0, 3])
+    xy = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0], [9.0, 10.0]])
+    centers = _centers_from_index(index, xy, 4, 'centroid')
+    np.testing.assert_allclose(centers[[0, 2, 3]], [[5.0, 6.0], [3.0, 4.0], [9.0, 10.0]])
+    np.testing.assert_allclose(centers[1], [0.0, 0.0])
+    with pytest.raises(ValueError):
+        _centers_from_index(index, xy, 4, 'mode')
@@ -0,0 +1,56 @@
+import io
+
+import numpy as np
+
+from figure_model.diverging_scatter import diverging_scatter
+from figure_model.figure_pool import FigurePool, new_figure
+from figure_model.scatter_marginals import scatter_with_histograms
+
+CENTERS = np.array([[1.0, 2.0], [3.0, 4.0]])
+GROUPS = np.array([[[5.0, 6.0], [7.0, 8.0]], [[9.0, 10.0], [11.0, 12.0]]])
+
+
+def _rgb(png):
+    import matplotlib.image as mimage
+
+    return mimage.imread(io.BytesIO(png), format='png')
+
+
+def test_release_restores_axes_position():
+    pool = FigurePool()
+    fig, ax = pool.acquire((8, 6))
+    original = ax.get_position().bounds
+    ax.set_position([0.1, 0.35, 0.55, 0.55])
+    pool.release(fig)
+    fig2, ax2 = pool.acquire((8, 6))
+    assert fig2 is fig
+    np.testing.assert_allclose(ax2.get_position().bounds, original)
+    np.testing.assert_allclose(ax2.get_position(original=True).bounds, original)
+
+
+def test_position_is_part_of_the_key():
+    pool = FigurePool()
+    fig, ax = pool.acquire((8, 6), position=[0.1, 0.35, 0.55, 0.55])
+    np.testing.assert_allclose(ax.get_position().bounds, (0.1, 0.35, 0.55, 0.55))
+    pool.release(fig)
+    fig2, _ = pool.acquire((8, 6))
+    assert fig2 is not fig
+
+
+def _moved_axes_chart():
+    # 取得坐标轴后再移动位置的图表
+    fig, ax = new_figure((8, 6))
+    ax.set_position([0.1, 0.35, 0.55, 0.55])
+    ax.plot([0, 1], [1, 0])
+    return fig
+
+
+def test_chart_after_other_chart_matches_fresh_render():
+    rng = np.random.default_rng(0)
+    fresh = FigurePool().render(diverging_scatter, CENTERS, GROUPS, ['#ff6e7f', '#bfe9ff'], True)
+    for first, args in ((scatter_with_histograms, (rng.standard_normal((200, 2)),)), (_moved_axes_chart, ())):
+        pool = FigurePool()
+        pool.render(first, *args)
+        reused = pool.render(diverging_scatter, CENTERS, GROUPS, ['#ff6e7f', '#bfe9ff'], True)
+        np.testing.assert_array_equal(_rgb(reused), _rgb(fresh))
+    assert pool.reused == 1
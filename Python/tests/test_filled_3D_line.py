@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from figure_model.filled_3D_line import _static_views, filled_3D_line
+
+
+def _data(n_time=30, n_cat=4, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.abs(np.cumsum(rng.standard_normal((n_time, n_cat)), axis=0)) * 10 + 1
+
+
+def _fill_and_edges(ax, static_view):
+    if static_view:
+        view = _static_views[ax]
+        return view.poly_ref(), view.edge_ref()
+    fills = [c for c in ax.collections if c.get_alpha() == 0.7]
+    edges = [c for c in ax.collections if c.get_alpha() is None]
+    # 所有类别的几何各放在一个集合中
+    assert len(fills) == 1 and len(edges) == 1
+    return fills[0], edges[0]
+
+
+def _draw_order(fig, collections):
+    # 记录各集合实际的绘制顺序
+    order = []
+    for collection in collections:
+        draw = collection.draw
+
+        def recording_draw(renderer, collection=collection, draw=draw):
+            order.append(collection)
+            return draw(renderer)
+
+        collection.draw = recording_draw
+    fig.canvas.draw()
+    return order
+
+
+@pytest.mark.parametrize('static_view', [False, True])
+def test_edges_are_drawn_beneath_fills(static_view):
+    import matplotlib.pyplot as plt
+
+    fig = filled_3D_line(_data(), np.arange(30.0), static_view=static_view)
+    ax = fig.axes[0]
+    assert not ax.computed_zorder
+    fill, edges = _fill_and_edges(ax, static_view)
+    order = _draw_order(fig, [fill, edges])
+    assert order == [edges, fill]
+    plt.close(fig)
+
+
+def test_static_collections_are_not_projected_again():
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection, PolyCollection
+
+    fig = filled_3D_line(_data(), np.arange(30.0), static_view=True)
+    ax = fig.axes[0]
+    fill, edges = _fill_and_edges(ax, True)
+    # 二维集合不是坐标轴的直接子对象，mplot3d 不会对它们调用 do_3d_projection
+    assert type(fill) is PolyCollection and type(edges) is LineCollection
+    assert not hasattr(fill, 'do_3d_projection') and not hasattr(edges, 'do_3d_projection')
+    assert not ax.collections
+    # 图例 loc='best' 依据的轮廓线与投影后的填充多边形一致
+    outline = _static_views[ax].outline_ref()
+    assert outline in ax.lines and not outline.get_visible()
+    xy = outline.get_xydata()
+    np.testing.assert_allclose(xy[~np.isnan(xy[:, 0])].reshape(4, -1, 2)[:, :-1],
+                               np.stack([p.vertices[:-1] for p in fill.get_paths()]))
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def test_edge_segments_are_grouped_by_category():
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+    fig = filled_3D_line(_data(n_cat=3), np.arange(30.0), fill_colors=np.eye(3))
+    edges = next(c for c in fig.axes[0].collections if isinstance(c, Line3DCollection))
+    # 每个类别依次为数据线（填充色 x 0.7）、底部虚线与两条侧边线
+    colors = edges.get_colors()[:, :3].reshape(3, 4, 3)
+    np.testing.assert_allclose(colors[:, 0], np.eye(3) * 0.7)
+    np.testing.assert_allclose(colors[:, 1], 0.5)
+    np.testing.assert_allclose(colors[:, 2:], 0.7)
+    np.testing.assert_allclose(edges.get_linewidths(), [1.5, 0.5, 0.5, 0.5] * 3)
+    plt.close(fig)
+
+
+def test_static_planes_are_ordered_by_x_only():
+    import matplotlib.pyplot as plt
+    from figure_model.filled_3D_line import set_view
+
+    # 高度悬殊的类别交替排列：前后顺序不能受数据高度影响
+    n_cat = 40
+    data = np.tile(np.where(np.arange(n_cat) % 2 == 0, 1000.0, 1.0), (20, 1))
+    colors = np.column_stack((np.arange(n_cat) / (n_cat - 1), np.zeros(n_cat), np.zeros(n_cat)))
+    fig = filled_3D_line(data, np.arange(20.0), fill_colors=colors, static_view=True, azim=-40)
+    ax = fig.axes[0]
+
+    def drawn_categories():
+        fills = _static_views[ax].poly_ref()
+        return np.rint(fills.get_facecolor()[:, 0] * (n_cat - 1)).astype(int)
+
+    # 默认视角从 x 正方向一侧观察，x 大的类别更近、后绘制；转到对侧后顺序反转
+    np.testing.assert_array_equal(drawn_categories(), np.arange(n_cat))
+    set_view(fig, 30, 140)
+    np.testing.assert_array_equal(drawn_categories(), np.arange(n_cat)[::-1])
+    plt.close(fig)
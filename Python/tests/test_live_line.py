@@ -0,0 +1,93 @@
+import io
+
+import numpy as np
+from matplotlib.colors import to_hex
+
+from figure_model.filled_2D_line import filled_2D_line
+from figure_model.figure_pool import FigurePool
+from figure_model.live_line import LiveFilledLine
+from figure_model.ragged import ragged_from_lines
+
+COLORS = ['#ff0000', '#00aa00', '#0000ff']
+
+
+def _streams(seed=0, n=3_000):
+    # 三条 x 递增的线，长度不同，跨过缓冲区的多次扩容
+    rng = np.random.default_rng(seed)
+    return [(np.arange(k, dtype=float) + 1 + i, np.cumsum(rng.standard_normal(k)) + 20)
+            for i, k in enumerate((n, n // 2, 7))]
+
+
+def _fill_region(vertices):
+    # 填充多边形 = 曲线 + 回到 y = 0 的基线：返回曲线部分与基线两端的 x
+    vertices = np.asarray(vertices)
+    on_base = vertices[:, 1] == 0
+    return vertices, (vertices[on_base, 0].min(), vertices[on_base, 0].max())
+
+
+def test_appends_match_fresh_filled_2D_line():
+    streams = _streams()
+    with FigurePool().session():
+        chart = LiveFilledLine(n_lines=3, colormap_param=COLORS)
+        rng = np.random.default_rng(1)
+        starts = [0, 0, 0]
+        while any(start < len(x) for start, (x, _) in zip(starts, streams)):
+            for i, (x, y) in enumerate(streams):
+                step = int(rng.integers(1, 400))
+                chart.append(i, x[starts[i]:starts[i] + step], y[starts[i]:starts[i] + step])
+                starts[i] += step
+            chart.refresh()
+
+        expected = filled_2D_line(ragged_from_lines([np.column_stack(s) for s in streams]), COLORS).axes[0]
+        for i, (x, y) in enumerate(streams):
+            line = chart._lines[i]
+            np.testing.assert_array_equal(line.get_xydata(), expected.lines[i].get_xydata())
+            np.testing.assert_array_equal(chart.line_data(i), np.column_stack((x, y)))
+            assert to_hex(line.get_color()) == to_hex(expected.lines[i].get_color())
+
+            live = chart._fills[i].get_path().vertices
+            fresh = expected.patches[i].get_xy()
+            # 曲线部分相同，基线覆盖相同的 x 区间
+            np.testing.assert_array_equal(live[1:-1], fresh[:len(x)])
+            assert _fill_region(live)[1] == _fill_region(fresh)[1] == (x[0], x[-1])
+        np.testing.assert_allclose(chart.ax.get_xlim(), expected.get_xlim())
+        np.testing.assert_allclose(chart.ax.get_ylim(), expected.get_ylim())
+
+
+def test_refresh_extends_limits():
+    with FigurePool().session():
+        chart = LiveFilledLine(np.array([[[1.0, 1.0], [2.0, 2.0]]]))
+        xlim, ylim = chart.ax.get_xlim(), chart.ax.get_ylim()
+        # 落在当前范围内的数据不改变轴范围
+        chart.append(0, [2.1], [1.5])
+        chart.refresh()
+        assert chart.ax.get_xlim() == xlim and chart.ax.get_ylim() == ylim
+        chart.append(0, [10.0], [50.0])
+        chart.refresh()
+        x0, x1 = chart.ax.get_xlim()
+        y0, y1 = chart.ax.get_ylim()
+        assert x1 >= 10 and y1 >= 50 and x0 <= 1 and y0 <= 1
+
+
+def test_savefig_after_blit_refresh_draws_each_artist_once():
+    with FigurePool().session():
+        chart = LiveFilledLine(n_lines=2, colormap_param=COLORS[:2], blit=True)
+        chart.append(0, [1, 2, 3], [0.5, 2.0, 1.0])
+        chart.append(1, [2, 3], [1.0, 0.2])
+        chart.refresh()
+        chart.append(0, [3.5], [1.2])
+        chart.refresh()
+
+        counts = {}
+        for artist in chart._lines + chart._fills:
+            draw = artist.draw
+
+            def counting_draw(renderer, artist=artist, draw=draw):
+                counts[artist] = counts.get(artist, 0) + 1
+                return draw(renderer)
+
+            artist.draw = counting_draw
+        chart.savefig(io.BytesIO(), format='png')
+        assert [counts.get(artist, 0) for artist in chart._lines + chart._fills] == [1, 1, 1, 1]
+        # 保存后恢复动画标记，之后的刷新仍使用 blitting
+        assert all(line.get_animated() for line in chart._lines)
@@ -0,0 +1,57 @@
+import numpy as np
+
+from figure_model.quantile_sketch import QuantileSketch, box_stats
+
+Q = np.linspace(0, 1, 101)
+
+
+def _sketch(values, n_chunks, **kwargs):
+    sketch = QuantileSketch(**kwargs)
+    for chunk in np.array_split(values, n_chunks):
+        sketch.update(chunk)
+    return sketch
+
+
+def test_exact_mode_matches_np_quantile():
+    rng = np.random.default_rng(0)
+    for values in (rng.standard_normal(10_001), rng.integers(0, 5, 777).astype(float), np.array([3.0])):
+        with_nan = values.copy()
+        with_nan[::7] = np.nan
+        for data in (values, with_nan):
+            sketch = _sketch(data, 13)
+            assert sketch.exact
+            expected = np.nanquantile(data, Q) if np.any(~np.isnan(data)) else np.full(Q.shape, np.nan)
+            np.testing.assert_allclose(sketch.quantile(Q), expected, rtol=0, atol=1e-12)
+
+
+def test_compacted_mode_rank_error_is_bounded():
+    rng = np.random.default_rng(1)
+    n, k = 300_000, 256
+    # 秩误差的量级为 log(n / k) / k
+    bound = np.log(n / k) / k
+    for values in (rng.standard_normal(n), rng.lognormal(0, 2, n), np.sort(rng.random(n)), rng.integers(0, 50, n) * 1.0):
+        sketch = _sketch(values, 97, k=k, exact_limit=1_000, seed=3)
+        assert not sketch.exact
+        _, weights = sketch.items()
+        assert weights.sum() == n
+        assert sketch.min == values.min() and sketch.max == values.max()
+        ranked = np.sort(values)
+        v = sketch.quantile(Q)
+        # 分位数值在样本中的秩区间（重复值占据一段秩）
+        lo = np.searchsorted(ranked, v, 'left') / n
+        hi = np.searchsorted(ranked, v, 'right') / n
+        err = np.maximum(0, np.maximum(lo - Q, Q - hi)).max()
+        assert err <= bound, err
+
+
+def test_empty_sketch_and_box_stats():
+    sketch = QuantileSketch()
+    sketch.update([np.nan])
+    assert np.all(np.isnan(sketch.quantile([0.25, 0.5])))
+    assert np.isnan(box_stats(sketch)['whislo'])
+
+    values = np.concatenate((np.arange(100.0), [1_000.0]))
+    sketch.update(values)
+    stats = box_stats(sketch)
+    assert stats['med'] == np.median(values)
+    assert stats['whishi'] == 99 and list(stats['fliers']) == [1_000.0]
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from matplotlib.colors import to_hex
+
+from figure_model.filled_2D_line import filled_2D_line
+from figure_model.figure_pool import FigurePool
+from figure_model.ragged import RaggedLines, as_ragged, ragged_from_lines, ragged_from_padded
+
+
+def _artists(fig):
+    ax = fig.axes[0]
+    lines = [(line.get_xydata().tolist(), to_hex(line.get_color())) for line in ax.lines]
+    polys = [(patch.get_xy().tolist(), tuple(patch.get_facecolor())) for patch in ax.patches]
+    return lines, polys, ax.get_xlim(), ax.get_ylim()
+
+
+def _padded_and_lines():
+    rng = np.random.default_rng(0)
+    lines = [np.column_stack((np.arange(1.0, k + 1), rng.random(k) * 10)) for k in (5, 1, 8)]
+    lines.insert(1, np.zeros((0, 2)))
+    padded = np.zeros((len(lines), 8, 2))
+    for i, line in enumerate(lines):
+        padded[i, :len(line)] = line
+    return padded, lines
+
+
+def test_padded_and_ragged_inputs_draw_identical_artists():
+    padded, lines = _padded_and_lines()
+    ragged = ragged_from_lines(lines)
+    np.testing.assert_array_equal(ragged_from_padded(padded).offsets, [0, 5, 5, 6, 14])
+    for colormap_param in (None, ['#ff6e7f', '#bfe9ff'], ['#ff0000', '#00ff00', '#0000ff', '#000000']):
+        with FigurePool().session():
+            expected = _artists(filled_2D_line(padded, colormap_param))
+            assert _artists(filled_2D_line(ragged, colormap_param)) == expected
+    assert len(expected[0]) == 3
+
+
+def test_only_trailing_zero_rows_are_padding():
+    # 线中间 y = 0 与开头 x = 0 的采样点是有效数据；只有末尾的 [0, 0] 是补齐
+    padded = np.array([[[1.0, 2.0], [2.0, 0.0], [3.0, 4.0], [0.0, 0.0]],
+                       [[0.0, 1.0], [1.0, 3.0], [0.0, 0.0], [0.0, 0.0]]])
+    lines = ragged_from_padded(padded)
+    np.testing.assert_array_equal(lines.offsets, [0, 3, 5])
+    np.testing.assert_array_equal(lines.coords[3], [0.0, 1.0])
+    with FigurePool().session():
+        ax = filled_2D_line(padded).axes[0]
+        assert [len(line.get_xydata()) for line in ax.lines] == [3, 2]
+        # y = 0 的点计入 y 轴下限，x = 0 的点计入 x 轴范围
+        assert ax.get_ylim()[0] == 0
+        assert ax.get_xlim()[0] == pytest.approx(-0.3)
+
+
+def test_invalid_ragged_offsets_are_rejected():
+    coords = np.zeros((3, 2))
+    for offsets in ([1, 3], [0, 2], [0, 2, 1, 3]):
+        with pytest.raises(ValueError):
+            as_ragged(RaggedLines(coords, np.array(offsets)))
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+import figure_model.raster as raster
+from figure_model.bubble_plot import bubble_plot
+from figure_model.diverging_scatter import diverging_scatter, diverging_scatter_from_labels
+from figure_model.figure_pool import FigurePool, new_figure
+from figure_model.raster import axes_pixel_shape, rasterize_points
+
+
+def _histogram(xy, extent, shape, weights=None):
+    x0, x1, y0, y1 = extent
+    hist, _, _ = np.histogram2d(xy[:, 1], xy[:, 0], bins=shape, range=[[y0, y1], [x0, x1]], weights=weights)
+    return hist.ravel()
+
+
+def test_matches_histogram2d_on_axes_pixel_grid():
+    rng = np.random.default_rng(0)
+    with FigurePool().session():
+        _, ax = new_figure((8, 6), dpi=50)
+        shape = axes_pixel_shape(ax)
+    assert 100 < shape[0] < shape[1] < 400
+    # 一部分点落在范围之外，会被两种方法同样忽略
+    xy = rng.uniform(-1, 11, (50_000, 2))
+    extent = (0.0, 10.0, 0.0, 10.0)
+    weights = rng.random(len(xy))
+    colors = rng.random((len(xy), 3))
+
+    density, color_sum = rasterize_points(xy, extent, shape)
+    assert color_sum is None
+    np.testing.assert_array_equal(density, _histogram(xy, extent, shape))
+
+    density, color_sum = rasterize_points(xy, extent, shape, weights=weights, colors=colors)
+    np.testing.assert_allclose(density, _histogram(xy, extent, shape, weights))
+    for ch in range(3):
+        np.testing.assert_allclose(color_sum[:, ch], _histogram(xy, extent, shape, weights * colors[:, ch]))
+
+
+def test_accumulates_groups_and_skips_zero_points():
+    rng = np.random.default_rng(1)
+    xy = rng.random((1_000, 2))
+    xy[::10] = 0
+    extent, shape = (0.0, 1.0, 0.0, 1.0), (20, 30)
+    red, blue = np.array([1.0, 0, 0]), np.array([0, 0, 1.0])
+    out = rasterize_points(xy[:500], extent, shape, colors=red, skip_zero=True,
+                           out=(np.zeros(600), np.zeros((600, 3))))
+    density, color_sum = rasterize_points(xy[500:], extent, shape, colors=blue, skip_zero=True, out=out)
+    nonzero = xy[np.any(xy != 0, axis=1)]
+    np.testing.assert_array_equal(density, _histogram(nonzero, extent, shape))
+    np.testing.assert_array_equal(color_sum[:, 0], _histogram(xy[:500][np.any(xy[:500] != 0, axis=1)], extent, shape))
+    np.testing.assert_array_equal(color_sum[:, 0] + color_sum[:, 2], density)
+
+
+@pytest.mark.parametrize('n', [399, 400])
+def test_auto_raster_threshold(monkeypatch, n):
+    monkeypatch.setattr(raster, 'RASTER_THRESHOLD', 400)
+    rng = np.random.default_rng(2)
+    xy = rng.random((n, 2)) * 10
+    expect_raster = n >= 400
+    charts = [
+        lambda: bubble_plot(xy, rng.random(n)),
+        lambda: diverging_scatter(np.array([[2.0, 2.0]]), xy[None, :, :], ['#ff6e7f', '#bfe9ff'], True),
+        lambda: diverging_scatter_from_labels(np.arange(n) % 3, xy),
+    ]
+    for chart in charts:
+        with FigurePool().session():
+            ax = chart().axes[0]
+            assert (len(ax.images) == 1) == expect_raster
+            if expect_raster:
+                # 栅格模式下点不再逐个绘制（集合中只剩类中心等少量元素）
+                assert sum(len(c.get_offsets()) for c in ax.collections) < 10
@@ -0,0 +1,85 @@
+import os
+
+import numpy as np
+
+import figure_model.render_cache as render_cache
+from figure_model.render_cache import RenderCache, cache_key
+
+
+def test_key_ignores_memory_layout():
+    rng = np.random.default_rng(0)
+    base = rng.random((40, 2, 6))
+    view = base[::2, :, 1:5]
+    assert not view.flags.c_contiguous
+    key = cache_key('filled_2D_line', (view,), {'colormap_param': None})
+    assert key == cache_key('filled_2D_line', (np.ascontiguousarray(view),), {'colormap_param': None})
+    assert key == cache_key('filled_2D_line', (np.asfortranarray(view),), {'colormap_param': None})
+    # 数值、dtype 或形状不同时键不同
+    assert key != cache_key('filled_2D_line', (view.astype(np.float32),), {'colormap_param': None})
+    assert key != cache_key('filled_2D_line', (view.reshape(20, 4, 2),), {'colormap_param': None})
+    changed = view.copy()
+    changed[0, 0, 0] += 1
+    assert key != cache_key('filled_2D_line', (changed,), {'colormap_param': None})
+
+
+def test_key_tracks_data_file_mtime_and_size(tmp_path):
+    path = tmp_path / 'lines.npy'
+    for arg in (str(path), path):
+        np.save(path, np.ones((3, 4, 2)))
+        key = cache_key('filled_2D_line', (arg,), {})
+        assert key == cache_key('filled_2D_line', (arg,), {})
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        touched = cache_key('filled_2D_line', (arg,), {})
+        assert touched != key
+        # 大小改变（修改时间恢复为原值）
+        np.save(path, np.ones((3, 5, 2)))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert cache_key('filled_2D_line', (arg,), {}) not in (key, touched)
+
+
+def test_hit_returns_same_bytes_without_rendering(tmp_path, monkeypatch):
+    calls = []
+    render_bytes = render_cache._render_bytes
+
+    def counting_render(*args):
+        calls.append(args[0])
+        return render_bytes(*args)
+
+    monkeypatch.setattr(render_cache, '_render_bytes', counting_render)
+    points = np.random.default_rng(1).random((50, 2))
+    v = np.arange(50.0)
+    cache = RenderCache(directory=str(tmp_path), memory_bytes=0)
+    first = cache.render('bubble_plot', points, v, r=5, format='png', dpi=50)
+    second = cache.render('bubble_plot', points.copy(), v, r=5, format='png', dpi=50)
+    assert first == second and first.startswith(b'\x89PNG')
+    assert calls == ['bubble_plot'] and cache.hits == 1 and cache.misses == 1
+    # 新的缓存对象从磁盘命中
+    assert RenderCache(directory=str(tmp_path)).render('bubble_plot', points, v, r=5, format='png', dpi=50) == first
+    assert len(calls) == 1
+    # 参数不同则重新渲染
+    cache.render('bubble_plot', points, v, r=6, format='png', dpi=50)
+    assert len(calls) == 2
+
+
+def test_disk_lru_trims_to_byte_limit(tmp_path):
+    cache = RenderCache(directory=str(tmp_path), max_bytes=1_000)
+
+    def disk():
+        return {os.path.basename(path).split('.')[0]: size for path, size, _ in cache._scan()}
+
+    keys = [f'{i:02d}' + 'ab' * 19 for i in range(4)]
+    for i, key in enumerate(keys[:3]):
+        cache.put(key, 'png', bytes(300))
+        # 显式设置最近使用时间，不依赖文件系统的时间精度
+        os.utime(cache._path(key, 'png'), (1_000 + i, 1_000 + i))
+    assert sum(disk().values()) == 900
+    # 读取第 0 个条目使其成为最近使用
+    assert cache.get(keys[0], 'png') == bytes(300)
+    os.utime(cache._path(keys[0], 'png'), (2_000, 2_000))
+
+    cache.put(keys[3], 'png', bytes(300))
+    remaining = disk()
+    assert sum(remaining.values()) <= 0.9 * cache.max_bytes
+    assert set(remaining) == {keys[0], keys[2], keys[3]}
+    assert cache.get(keys[1], 'png') is None
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from figure_model.sankey_diagram import sankey_layout
+
+# 3 个层级、每层最多 3 个节点，中间层级的流入等于流出
+DATA = np.array([[10.0, 20.0, 0.0], [12.0, 0.0, 18.0], [0.0, 30.0, 0.0]])
+EDGES = np.array([
+    [0, 0, 0, 4.0], [0, 0, 2, 6.0], [0, 1, 0, 8.0], [0, 1, 2, 12.0],
+    [1, 0, 1, 12.0], [1, 2, 1, 18.0],
+])
+
+
+class _Coo:
+    """只实现 sankey_layout 用到的 COO 接口（row / col / data / nnz / shape）"""
+
+    def __init__(self, dense):
+        self.row, self.col = np.nonzero(dense)
+        self.data = dense[self.row, self.col]
+        self.nnz = len(self.data)
+        self.shape = dense.shape
+
+    def tocoo(self):
+        return self
+
+
+def _dense():
+    dense = np.zeros((DATA.shape[0] - 1, DATA.shape[1], DATA.shape[1]))
+    layer, src, dst = EDGES[:, :3].astype(int).T
+    dense[layer, src, dst] = EDGES[:, 3]
+    return dense
+
+
+def _coo_tuple():
+    # 打乱顺序，把最后一条边拆成两条重复项，并加入零流量与负流量的边；合并、过滤后应与其他格式相同
+    rows = np.vstack((EDGES[::-1], [[1, 2, 1, 8.0], [0, 1, 0, 0.0], [0, 0, 0, -1.0]]))
+    rows[0, 3] -= 8.0
+    return rows[:, 0].astype(int), rows[:, 1].astype(int), rows[:, 2].astype(int), rows[:, 3]
+
+
+def _sparse_list(kind):
+    if kind == 'scipy':
+        sparse = pytest.importorskip('scipy.sparse')
+        return [sparse.csr_matrix(mat) for mat in _dense()]
+    return [_Coo(mat) for mat in _dense()]
+
+
+def _assert_layouts_equal(actual, expected):
+    for name, a, b in zip(expected._fields, actual, expected):
+        np.testing.assert_allclose(np.asarray(a, dtype=float), np.asarray(b, dtype=float), err_msg=name)
+
+
+@pytest.mark.parametrize('form', ['tuple', 'k x 4', 'sparse', 'scipy', 'dense'])
+def test_input_forms_give_identical_layouts(form):
+    expected = sankey_layout(DATA, _dense())
+    connection = {
+        'tuple': _coo_tuple,
+        'k x 4': lambda: EDGES.copy(),
+        'sparse': lambda: _sparse_list('duck'),
+        'scipy': lambda: _sparse_list('scipy'),
+        'dense': _dense,
+    }[form]()
+    layout = sankey_layout(DATA, connection)
+    _assert_layouts_equal(layout, expected)
+    np.testing.assert_array_equal(np.column_stack((layout.layer, layout.src, layout.dst)), EDGES[:, :3])
+    np.testing.assert_allclose(layout.flow, EDGES[:, 3])
+
+
+def test_flow_is_conserved_and_ribbons_tile_nodes():
+    layout = sankey_layout(DATA, EDGES)
+    n, m = DATA.shape
+    inflow = np.zeros((n, m))
+    outflow = np.zeros((n, m))
+    np.add.at(outflow, (layout.layer, layout.src), layout.flow)
+    np.add.at(inflow, (layout.layer + 1, layout.dst), layout.flow)
+    np.testing.assert_allclose(inflow[1:-1], outflow[1:-1])
+    np.testing.assert_allclose(outflow[0], DATA[0])
+    np.testing.assert_allclose(inflow[-1], DATA[-1])
+
+    # 节点高度与流量成正比：同一层级内 高度 / 流量 为常数
+    valid = DATA > 0
+    scale = layout.node_heights[valid] / DATA[valid]
+    layer_of = np.nonzero(valid)[0]
+    for i in range(n):
+        np.testing.assert_allclose(scale[layer_of == i], scale[layer_of == i][0])
+    # 节点底部为同层前面节点高度与空隙的累积和
+    for i in range(n):
+        j = np.flatnonzero(valid[i])
+        expected = np.concatenate(([0.0], np.cumsum(layout.node_heights[i, j] + layout.gap)[:-1]))
+        np.testing.assert_allclose(layout.node_bottoms[i, j], expected)
+
+    # 每个节点上的连接带按对端节点序号自下而上首尾相接，宽度与流量成正比并占满节点高度
+    for side, y, node_layer, node, other in (
+            ('src', layout.src_y, layout.layer, layout.src, layout.dst),
+            ('dst', layout.dst_y, layout.layer + 1, layout.dst, layout.src)):
+        for i, j in zip(*np.nonzero(valid)):
+            edges = np.flatnonzero((node_layer == i) & (node == j))
+            if len(edges) == 0:
+                continue
+            edges = edges[np.argsort(other[edges], kind='stable')]
+            bottom, height = layout.node_bottoms[i, j], layout.node_heights[i, j]
+            widths = layout.flow[edges] / layout.flow[edges].sum() * height
+            lower = bottom + np.concatenate(([0.0], np.cumsum(widths)[:-1]))
+            np.testing.assert_allclose(y[edges, 0], lower, err_msg=side)
+            np.testing.assert_allclose(y[edges, 1], lower + widths, err_msg=side)
@@ -0,0 +1,56 @@
+import numpy as np
+
+from figure_model.spatial_index import GridIndex
+
+
+def _brute_force(xy, x_min, x_max, y_min, y_max):
+    inside = (xy[:, 0] >= x_min) & (xy[:, 0] <= x_max) & (xy[:, 1] >= y_min) & (xy[:, 1] <= y_max)
+    return set(np.flatnonzero(inside).tolist())
+
+
+def _check_windows(xy, index, windows):
+    for window in windows:
+        found = index.order[index.query(*window)]
+        assert len(found) == len(set(found.tolist()))
+        assert _brute_force(xy, *window) <= set(found.tolist()), window
+
+
+def _random_windows(rng, lo, hi, n):
+    span = hi - lo
+    a = rng.uniform(lo - 0.2 * span, hi + 0.2 * span, (n, 2))
+    b = a + rng.exponential(0.2 * span, (n, 2))
+    return [(a[i, 0], b[i, 0], a[i, 1], b[i, 1]) for i in range(n)]
+
+
+def test_query_is_superset_of_brute_force():
+    rng = np.random.default_rng(0)
+    clustered = np.concatenate((rng.normal(0, 1, (3_000, 2)), rng.normal(8, 0.1, (2_000, 2))))
+    for xy, grid_side in ((rng.random((5_000, 2)) * 100, None), (clustered, None), (clustered, 7)):
+        index = GridIndex(xy, grid_side)
+        lo, hi = np.asarray(index.bounds[0]), np.asarray(index.bounds[1])
+        windows = _random_windows(rng, lo.min(), hi.max(), 200)
+        # 零宽度窗口、整个范围与范围外的窗口
+        p = xy[17]
+        windows += [(p[0], p[0], p[1], p[1]), (lo[0], hi[0], lo[1], hi[1]), (hi[0] + 1, hi[0] + 2, lo[1], hi[1]),
+                    (lo[0], hi[0], hi[1], hi[1]), (-np.inf, np.inf, -np.inf, np.inf)]
+        _check_windows(xy, index, windows)
+        assert sorted(index.order[index.query(lo[0], hi[0], lo[1], hi[1])]) == list(range(len(xy)))
+
+
+def test_degenerate_and_empty_inputs():
+    rng = np.random.default_rng(1)
+    # 所有点在一条竖线上、所有点重合
+    line = np.column_stack((np.full(500, 3.0), rng.random(500)))
+    same = np.full((50, 2), 2.5)
+    for xy in (line, same):
+        index = GridIndex(xy)
+        _check_windows(xy, index, _random_windows(rng, 0, 5, 100) + [(3, 3, 0, 1), (2.5, 2.5, 2.5, 2.5)])
+
+    empty = GridIndex(np.zeros((0, 2)))
+    assert len(empty) == 0 and len(empty.query(0, 1, 0, 1)) == 0
+
+
+def test_reversed_window_is_empty():
+    index = GridIndex(np.random.default_rng(2).random((1_000, 2)) * 100)
+    for window in ((90, 10, 0, 100), (0, 100, 90, 10), (60, 40, 60, 40)):
+        assert len(index.query(*window)) == 0
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from figure_model.turntable import export_views, turntable_path
+
+
+def _frames(tmp_path, name, data, timeVector, **kwargs):
+    paths = export_views(data, timeVector, turntable_path(2), str(tmp_path / name), workers=1, **kwargs)
+    return [open(path, 'rb').read() for path in paths]
+
+
+def test_datetime64_time_axis_matches_datetime_list(tmp_path):
+    rng = np.random.default_rng(0)
+    data = np.abs(rng.standard_normal((40, 3))) * 10
+    days = [datetime(2023, 1, 1) + timedelta(days=i) for i in range(40)]
+    as_list = _frames(tmp_path, 'list', data, days)
+    as_datetime64 = _frames(tmp_path, 'dt64', data, np.array(days, dtype='datetime64[ns]'))
+    as_numbers = _frames(tmp_path, 'num', data, np.arange(40.0))
+    assert as_datetime64 == as_list
+    assert as_numbers != as_list
+
+
+def test_resample_options_reach_the_chart(tmp_path):
+    from figure_model.figure_pool import FigurePool
+    from figure_model.filled_3D_line import filled_3D_line, set_view
+
+    rng = np.random.default_rng(1)
+    data = np.abs(np.cumsum(rng.standard_normal((24 * 30, 3)), axis=0))
+    hours = np.datetime64('2023-01-01T00') + np.arange(24 * 30).astype('timedelta64[h]')
+    frames = _frames(tmp_path, 'band', data, hours, resample='day', agg='max', band=True)
+    assert frames != _frames(tmp_path, 'full', data, hours)
+
+    with FigurePool().session():
+        fig = filled_3D_line(data, hours, static_view=True, resample='day', agg='max', band=True)
+        expected = []
+        for i, view in enumerate(turntable_path(2)):
+            set_view(fig, *view)
+            fig.savefig(tmp_path / f'direct_{i}.png')
+            expected.append((tmp_path / f'direct_{i}.png').read_bytes())
+    assert frames == expected